@@ -0,0 +1,235 @@
+// Code généré par protocol/generate.py à partir de protocol/schema.json. NE PAS MODIFIER.
+
+// Codec binaire du protocole Pong (DataView, big-endian)
+
+// En-tête de chaque message : type (1 octet) puis longueur du corps (uint32, big-endian)
+const HEADER_SIZE = 5;
+
+// Types de messages
+const MSG_TYPE_GAME_STATE = 1;
+const MSG_TYPE_PLAYER_MOVE = 2;
+const MSG_TYPE_PLAYER_JOIN = 3;
+const MSG_TYPE_PLAYER_READY = 4;
+const MSG_TYPE_SUBSCRIBE = 5;
+const MSG_TYPE_DISCOVERY_PING = 6;
+const MSG_TYPE_DISCOVERY_PONG = 7;
+
+// GameState: État complet du jeu envoyé par le serveur
+// - ballX (f32, octets 0-3): Position X de la balle
+// - ballY (f32, octets 4-7): Position Y de la balle
+// - player1Y (f32, octets 8-11): Position Y du joueur 1
+// - player1Score (u16, octets 12-13): Score du joueur 1
+// - player2Y (f32, octets 14-17): Position Y du joueur 2
+// - player2Score (u16, octets 18-19): Score du joueur 2
+// - isRunning (u8, octet 20): 1 si le jeu est en cours, 0 sinon
+// - player1Seq (u32, octets 21-24): Dernière séquence d'entrée appliquée pour le joueur 1
+// - player2Seq (u32, octets 25-28): Dernière séquence d'entrée appliquée pour le joueur 2
+// - tick (u32, octets 29-32): Numéro du tick de simulation de cet état
+const GAME_STATE_SIZE = 33;
+
+// Encode un message GameState complet (en-tête inclus)
+function encodeGameState(m) {
+    const message = new Uint8Array(HEADER_SIZE + GAME_STATE_SIZE);
+    const view = new DataView(message.buffer);
+    view.setUint8(0, MSG_TYPE_GAME_STATE);
+    view.setUint32(1, GAME_STATE_SIZE, false);
+    view.setFloat32(HEADER_SIZE + 0, m.ballX, false);
+    view.setFloat32(HEADER_SIZE + 4, m.ballY, false);
+    view.setFloat32(HEADER_SIZE + 8, m.player1Y, false);
+    view.setUint16(HEADER_SIZE + 12, m.player1Score, false);
+    view.setFloat32(HEADER_SIZE + 14, m.player2Y, false);
+    view.setUint16(HEADER_SIZE + 18, m.player2Score, false);
+    view.setUint8(HEADER_SIZE + 20, m.isRunning);
+    view.setUint32(HEADER_SIZE + 21, m.player1Seq, false);
+    view.setUint32(HEADER_SIZE + 25, m.player2Seq, false);
+    view.setUint32(HEADER_SIZE + 29, m.tick, false);
+    return message;
+}
+
+// Décode le corps d'un message GameState (lève RangeError si incomplet)
+function decodeGameState(view, offset = 0) {
+    return {
+        ballX: view.getFloat32(offset + 0, false),
+        ballY: view.getFloat32(offset + 4, false),
+        player1Y: view.getFloat32(offset + 8, false),
+        player1Score: view.getUint16(offset + 12, false),
+        player2Y: view.getFloat32(offset + 14, false),
+        player2Score: view.getUint16(offset + 18, false),
+        isRunning: view.getUint8(offset + 20),
+        player1Seq: view.getUint32(offset + 21, false),
+        player2Seq: view.getUint32(offset + 25, false),
+        tick: view.getUint32(offset + 29, false),
+    };
+}
+
+// PlayerMove: Mouvement du joueur envoyé par le client
+// - playerId (u8, octet 0): ID du joueur (1 ou 2)
+// - direction (i8, octet 1): Direction (1 pour bas, -1 pour haut, 0 pour arrêt)
+// - seq (u32, octets 2-5): Numéro de séquence de l'entrée
+// - viewTick (u32, octets 6-9): Tick du dernier état affiché par le client lors de l'entrée
+const PLAYER_MOVE_SIZE = 10;
+
+// Encode un message PlayerMove complet (en-tête inclus)
+function encodePlayerMove(m) {
+    const message = new Uint8Array(HEADER_SIZE + PLAYER_MOVE_SIZE);
+    const view = new DataView(message.buffer);
+    view.setUint8(0, MSG_TYPE_PLAYER_MOVE);
+    view.setUint32(1, PLAYER_MOVE_SIZE, false);
+    view.setUint8(HEADER_SIZE + 0, m.playerId);
+    view.setInt8(HEADER_SIZE + 1, m.direction);
+    view.setUint32(HEADER_SIZE + 2, m.seq, false);
+    view.setUint32(HEADER_SIZE + 6, m.viewTick, false);
+    return message;
+}
+
+// Décode le corps d'un message PlayerMove (lève RangeError si incomplet)
+function decodePlayerMove(view, offset = 0) {
+    return {
+        playerId: view.getUint8(offset + 0),
+        direction: view.getInt8(offset + 1),
+        seq: view.getUint32(offset + 2, false),
+        viewTick: view.getUint32(offset + 6, false),
+    };
+}
+
+// PlayerJoin: Attribution d'un ID de joueur
+// - playerId (u8, octet 0): ID du joueur (1 ou 2)
+const PLAYER_JOIN_SIZE = 1;
+
+// Encode un message PlayerJoin complet (en-tête inclus)
+function encodePlayerJoin(m) {
+    const message = new Uint8Array(HEADER_SIZE + PLAYER_JOIN_SIZE);
+    const view = new DataView(message.buffer);
+    view.setUint8(0, MSG_TYPE_PLAYER_JOIN);
+    view.setUint32(1, PLAYER_JOIN_SIZE, false);
+    view.setUint8(HEADER_SIZE + 0, m.playerId);
+    return message;
+}
+
+// Décode le corps d'un message PlayerJoin (lève RangeError si incomplet)
+function decodePlayerJoin(view, offset = 0) {
+    return {
+        playerId: view.getUint8(offset + 0),
+    };
+}
+
+// PlayerReady: État de préparation d'un joueur
+// - playerId (u8, octet 0): ID du joueur (1 ou 2)
+// - ready (u8, octet 1): 1 si prêt, 0 sinon
+const PLAYER_READY_SIZE = 2;
+
+// Encode un message PlayerReady complet (en-tête inclus)
+function encodePlayerReady(m) {
+    const message = new Uint8Array(HEADER_SIZE + PLAYER_READY_SIZE);
+    const view = new DataView(message.buffer);
+    view.setUint8(0, MSG_TYPE_PLAYER_READY);
+    view.setUint32(1, PLAYER_READY_SIZE, false);
+    view.setUint8(HEADER_SIZE + 0, m.playerId);
+    view.setUint8(HEADER_SIZE + 1, m.ready);
+    return message;
+}
+
+// Décode le corps d'un message PlayerReady (lève RangeError si incomplet)
+function decodePlayerReady(view, offset = 0) {
+    return {
+        playerId: view.getUint8(offset + 0),
+        ready: view.getUint8(offset + 1),
+    };
+}
+
+// Subscribe: Fréquence des états de jeu demandée par le client
+// - rateHz (u8, octet 0): Fréquence maximale en Hz (0 pour chaque tick du serveur)
+// - onChange (u8, octet 1): 1 pour ne recevoir que les états modifiés, 0 sinon
+const SUBSCRIBE_SIZE = 2;
+
+// Encode un message Subscribe complet (en-tête inclus)
+function encodeSubscribe(m) {
+    const message = new Uint8Array(HEADER_SIZE + SUBSCRIBE_SIZE);
+    const view = new DataView(message.buffer);
+    view.setUint8(0, MSG_TYPE_SUBSCRIBE);
+    view.setUint32(1, SUBSCRIBE_SIZE, false);
+    view.setUint8(HEADER_SIZE + 0, m.rateHz);
+    view.setUint8(HEADER_SIZE + 1, m.onChange);
+    return message;
+}
+
+// Décode le corps d'un message Subscribe (lève RangeError si incomplet)
+function decodeSubscribe(view, offset = 0) {
+    return {
+        rateHz: view.getUint8(offset + 0),
+        onChange: view.getUint8(offset + 1),
+    };
+}
+
+// DiscoveryPing: Requête de découverte envoyée en UDP par un client
+// - nonce (u32, octets 0-3): Identifiant de la requête, renvoyé dans la réponse
+const DISCOVERY_PING_SIZE = 4;
+
+// Encode un message DiscoveryPing complet (en-tête inclus)
+function encodeDiscoveryPing(m) {
+    const message = new Uint8Array(HEADER_SIZE + DISCOVERY_PING_SIZE);
+    const view = new DataView(message.buffer);
+    view.setUint8(0, MSG_TYPE_DISCOVERY_PING);
+    view.setUint32(1, DISCOVERY_PING_SIZE, false);
+    view.setUint32(HEADER_SIZE + 0, m.nonce, false);
+    return message;
+}
+
+// Décode le corps d'un message DiscoveryPing (lève RangeError si incomplet)
+function decodeDiscoveryPing(view, offset = 0) {
+    return {
+        nonce: view.getUint32(offset + 0, false),
+    };
+}
+
+// DiscoveryPong: Réponse du serveur à une requête de découverte
+// - nonce (u32, octets 0-3): Identifiant de la requête
+// - port (u16, octets 4-5): Port TCP du serveur de jeu
+// - players (u8, octet 6): Nombre de joueurs connectés
+// - freeSlots (u8, octet 7): Nombre de places libres
+const DISCOVERY_PONG_SIZE = 8;
+
+// Encode un message DiscoveryPong complet (en-tête inclus)
+function encodeDiscoveryPong(m) {
+    const message = new Uint8Array(HEADER_SIZE + DISCOVERY_PONG_SIZE);
+    const view = new DataView(message.buffer);
+    view.setUint8(0, MSG_TYPE_DISCOVERY_PONG);
+    view.setUint32(1, DISCOVERY_PONG_SIZE, false);
+    view.setUint32(HEADER_SIZE + 0, m.nonce, false);
+    view.setUint16(HEADER_SIZE + 4, m.port, false);
+    view.setUint8(HEADER_SIZE + 6, m.players);
+    view.setUint8(HEADER_SIZE + 7, m.freeSlots);
+    return message;
+}
+
+// Décode le corps d'un message DiscoveryPong (lève RangeError si incomplet)
+function decodeDiscoveryPong(view, offset = 0) {
+    return {
+        nonce: view.getUint32(offset + 0, false),
+        port: view.getUint16(offset + 4, false),
+        players: view.getUint8(offset + 6),
+        freeSlots: view.getUint8(offset + 7),
+    };
+}
+
+// Taille du corps attendue pour chaque type de message
+const MESSAGE_SIZES = {
+    [MSG_TYPE_GAME_STATE]: GAME_STATE_SIZE,
+    [MSG_TYPE_PLAYER_MOVE]: PLAYER_MOVE_SIZE,
+    [MSG_TYPE_PLAYER_JOIN]: PLAYER_JOIN_SIZE,
+    [MSG_TYPE_PLAYER_READY]: PLAYER_READY_SIZE,
+    [MSG_TYPE_SUBSCRIBE]: SUBSCRIBE_SIZE,
+    [MSG_TYPE_DISCOVERY_PING]: DISCOVERY_PING_SIZE,
+    [MSG_TYPE_DISCOVERY_PONG]: DISCOVERY_PONG_SIZE,
+};
+
+// Décodeur associé à chaque type de message
+const DECODERS = {
+    [MSG_TYPE_GAME_STATE]: decodeGameState,
+    [MSG_TYPE_PLAYER_MOVE]: decodePlayerMove,
+    [MSG_TYPE_PLAYER_JOIN]: decodePlayerJoin,
+    [MSG_TYPE_PLAYER_READY]: decodePlayerReady,
+    [MSG_TYPE_SUBSCRIBE]: decodeSubscribe,
+    [MSG_TYPE_DISCOVERY_PING]: decodeDiscoveryPing,
+    [MSG_TYPE_DISCOVERY_PONG]: decodeDiscoveryPong,
+};
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Statistiques agrégées sur les parties enregistrées par recorder.py.
+
+Tous les calculs sont vectorisés avec NumPy sur les colonnes projetées en
+mémoire : la seule boucle Python parcourt les fichiers de parties.
+
+Usage:
+    python analytics.py <dossier_des_enregistrements>
+"""
+
+import os
+import sys
+
+import numpy as np
+
+from game_config import TICK_RATE
+from recorder import load_index, open_match
+
+# Histogramme de la gigue des états reçus : 0 à 1 s par pas de 0,1 ms
+JITTER_BINS = np.linspace(0.0, 1.0, 10001)
+
+
+def match_stats(columns):
+    """Calcule les statistiques d'une partie à partir de ses colonnes"""
+    t = np.asarray(columns["t"])
+    if len(t) < 3:
+        return None
+
+    ball_x = np.asarray(columns["ball_x"])
+    total = columns["player1_score"].astype(np.int32) + columns["player2_score"]
+
+    # Transitions i -> i+1 pendant lesquelles un point a été marqué
+    scored = np.diff(total) > 0
+    point_frames = np.flatnonzero(scored) + 1
+
+    # Une frappe de raquette inverse le sens horizontal de la balle ; les
+    # remises au centre après un point sont exclues
+    dx = np.diff(ball_x)
+    hits = ~scored[:-1] & ~scored[1:] & (dx[:-1] * dx[1:] < 0)
+    rally_id = np.cumsum(scored)[:-1]
+    hits_per_rally = np.bincount(rally_id[hits], minlength=len(point_frames) + 1)
+
+    # Seuls les échanges terminés par un point sont comptés
+    bounds = np.concatenate((t[:1], t[point_frames]))
+    dt = np.diff(t)
+
+    # Retard de chaque réception sur la chronologie des ticks du serveur : sa
+    # dispersion est la gigue, indépendamment des états sautés ou regroupés
+    tick = np.asarray(columns["tick"]).astype(np.int64)
+    delay = t - tick / TICK_RATE
+
+    return {
+        "frames": len(t),
+        "duration": float(t[-1] - t[0]),
+        "rally_hits": hits_per_rally[:len(point_frames)],
+        "rally_durations": np.diff(bounds),
+        "point_times": t[point_frames] - t[0],
+        "player1_travel": float(np.abs(np.diff(columns["player1_y"])).sum()),
+        "player2_travel": float(np.abs(np.diff(columns["player2_y"])).sum()),
+        "dt": dt,
+        "tick_steps": np.diff(tick),
+        "jitter": np.abs(delay - np.median(delay)),
+    }
+
+
+def histogram_percentile(counts, bins, q):
+    """Percentile approximatif à partir d'un histogramme cumulé"""
+    cumulative = np.cumsum(counts)
+    if cumulative[-1] == 0:
+        return float("nan")
+    index = np.searchsorted(cumulative, q / 100.0 * cumulative[-1])
+    return float(bins[min(index + 1, len(bins) - 1)])
+
+
+def aggregate(directory, match_ids=None):
+    """Agrège les statistiques de toutes les parties d'un dossier"""
+    entries = load_index(directory)
+    if match_ids is not None:
+        wanted = set(match_ids)
+        entries = [entry for entry in entries if entry["match_id"] in wanted]
+
+    rally_hits = []
+    rally_durations = []
+    point_intervals = []
+    jitter_counts = np.zeros(len(JITTER_BINS) - 1, dtype=np.int64)
+    frames = 0
+    duration = 0.0
+    travel = 0.0
+    dt_sum = 0.0
+    dt_sq_sum = 0.0
+    tick_steps = 0
+    max_tick_step = 0
+    matches = 0
+
+    for entry in entries:
+        stats = match_stats(open_match(os.path.join(directory, entry["file"])))
+        if stats is None:
+            continue
+
+        matches += 1
+        frames += stats["frames"]
+        duration += stats["duration"]
+        travel += stats["player1_travel"] + stats["player2_travel"]
+        rally_hits.append(stats["rally_hits"])
+        rally_durations.append(stats["rally_durations"])
+        point_intervals.append(np.diff(stats["point_times"]))
+        dt_sum += stats["dt"].sum()
+        dt_sq_sum += np.square(stats["dt"]).sum()
+        tick_steps += int(stats["tick_steps"].sum())
+        max_tick_step = max(max_tick_step, int(stats["tick_steps"].max()))
+        jitter_counts += np.histogram(stats["jitter"], bins=JITTER_BINS)[0]
+
+    if matches == 0:
+        return {"matches": 0}
+
+    rally_hits = np.concatenate(rally_hits)
+    rally_durations = np.concatenate(rally_durations)
+    point_intervals = np.concatenate(point_intervals)
+    intervals = frames - matches
+    dt_mean = dt_sum / intervals
+
+    def summary(values):
+        if len(values) == 0:
+            return {"mean": float("nan"), "p50": float("nan"), "p95": float("nan")}
+        p50, p95 = np.percentile(values, [50, 95])
+        return {"mean": float(values.mean()), "p50": float(p50), "p95": float(p95)}
+
+    return {
+        "matches": matches,
+        "frames": frames,
+        "duration": duration,
+        "rallies": len(rally_hits),
+        "rally_hits": summary(rally_hits),
+        "rally_duration": summary(rally_durations),
+        "point_interval": summary(point_intervals),
+        "paddle_travel_per_minute": 60.0 * travel / (2 * duration) if duration > 0 else float("nan"),
+        "snapshot_interval": {
+            "mean": dt_mean,
+            "std": float(np.sqrt(max(dt_sq_sum / intervals - dt_mean * dt_mean, 0.0))),
+        },
+        "ticks_per_state": {"mean": tick_steps / intervals, "max": max_tick_step},
+        "jitter": {
+            "p50": histogram_percentile(jitter_counts, JITTER_BINS, 50),
+            "p99": histogram_percentile(jitter_counts, JITTER_BINS, 99),
+        },
+    }
+
+
+def main(argv):
+    if len(argv) != 1:
+        print(__doc__.strip().splitlines()[-1].strip())
+        return 1
+
+    stats = aggregate(argv[0])
+    if stats["matches"] == 0:
+        print("Aucune partie enregistrée")
+        return 0
+
+    print(f"Parties: {stats['matches']} ({stats['frames']} états, {stats['duration'] / 60:.1f} min)")
+    print(f"Échanges: {stats['rallies']}")
+    print("Frappes par échange: moyenne {mean:.2f}, médiane {p50:.0f}, p95 {p95:.0f}".format(**stats["rally_hits"]))
+    print("Durée des échanges (s): moyenne {mean:.2f}, médiane {p50:.2f}, p95 {p95:.2f}".format(**stats["rally_duration"]))
+    print("Intervalle entre points (s): moyenne {mean:.2f}, médiane {p50:.2f}, p95 {p95:.2f}".format(**stats["point_interval"]))
+    print(f"Déplacement des raquettes: {stats['paddle_travel_per_minute']:.0f} px/min par joueur")
+    print("Intervalle entre états (ms): moyenne {:.2f}, écart-type {:.2f}".format(
+        1000 * stats["snapshot_interval"]["mean"], 1000 * stats["snapshot_interval"]["std"]))
+    print("Ticks entre états: moyenne {mean:.2f}, max {max}".format(**stats["ticks_per_state"]))
+    print("Gigue (ms): p50 {:.2f}, p99 {:.2f}".format(1000 * stats["jitter"]["p50"], 1000 * stats["jitter"]["p99"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
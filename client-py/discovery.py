@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Découverte des serveurs sur le réseau local.
+
+Un DiscoveryPing UDP est envoyé en parallèle à chaque candidat (et en
+diffusion sur le réseau local) ; les serveurs répondent avec leur port TCP
+et leurs places libres. Les serveurs sont classés par places disponibles
+puis par temps d'aller-retour mesuré.
+
+Usage:
+    python discovery.py [hôte:port,...]
+"""
+
+import os
+import socket
+import sys
+import time
+from collections import namedtuple
+
+from pong_protocol import (
+    DISCOVERY_PONG_SIZE, HEADER, HEADER_SIZE, MSG_TYPE_DISCOVERY_PONG,
+    decode_discovery_pong, encode_discovery_ping,
+)
+
+# Serveurs candidats (variable PONG_SERVERS, séparés par des virgules)
+DEFAULT_SERVERS = os.environ.get("PONG_SERVERS", "127.0.0.1:9090")
+
+# Port interrogé en diffusion sur le réseau local (0 pour désactiver)
+BROADCAST_PORT = int(os.environ.get("PONG_DISCOVERY_PORT", "9090"))
+
+DISCOVERY_TIMEOUT = 0.25  # Secondes d'attente des réponses
+
+ServerInfo = namedtuple("ServerInfo", ["host", "port", "rtt", "players", "free_slots"])
+
+
+def parse_servers(text=DEFAULT_SERVERS):
+    """Convertit "hôte:port,hôte:port" en liste de (hôte, port)"""
+    servers = []
+    for item in text.split(","):
+        item = item.strip()
+        if item:
+            host, _, port = item.rpartition(":")
+            servers.append((host, int(port)))
+    return servers
+
+
+def resolve(host, port):
+    """Adresses IPv4 d'un candidat, comme les rapportent les réponses UDP"""
+    try:
+        infos = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_DGRAM)
+    except socket.gaierror:
+        return set()
+    return {(address[0], port) for *_, address in infos}
+
+
+def probe(candidates, broadcast_port=BROADCAST_PORT, timeout=DISCOVERY_TIMEOUT):
+    """Interroge les candidats en parallèle et retourne les serveurs classés"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sent_at = {}
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+
+        targets = list(candidates)
+        if broadcast_port:
+            targets.append(("<broadcast>", broadcast_port))
+
+        for nonce, target in enumerate(targets, start=1):
+            try:
+                sock.sendto(encode_discovery_ping(nonce), target)
+                sent_at[nonce] = time.monotonic()
+            except OSError:
+                # Hôte invalide ou diffusion interdite : ignorer ce candidat
+                pass
+
+        found = {}
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            # Sans diffusion, inutile d'attendre une fois tous les candidats répondus
+            if remaining <= 0 or (not broadcast_port and len(found) >= len(sent_at)):
+                break
+            sock.settimeout(remaining)
+            try:
+                data, (host, _) = sock.recvfrom(512)
+            except socket.timeout:
+                break
+            received_at = time.monotonic()
+
+            if len(data) < HEADER_SIZE + DISCOVERY_PONG_SIZE:
+                continue
+            msg_type, _ = HEADER.unpack_from(data)
+            if msg_type != MSG_TYPE_DISCOVERY_PONG:
+                continue
+            pong = decode_discovery_pong(data, HEADER_SIZE)
+            if pong.nonce not in sent_at:
+                continue
+
+            info = ServerInfo(host, pong.port, received_at - sent_at[pong.nonce], pong.players, pong.free_slots)
+            key = (info.host, info.port)
+            if key not in found or info.rtt < found[key].rtt:
+                found[key] = info
+    finally:
+        sock.close()
+
+    return sorted(found.values(), key=lambda info: (info.free_slots == 0, info.rtt))
+
+
+def connection_order(candidates, broadcast_port=BROADCAST_PORT, timeout=DISCOVERY_TIMEOUT):
+    """Ordre dans lequel tenter les connexions TCP
+
+    Les serveurs ayant répondu avec des places libres passent en premier,
+    par RTT croissant, suivis des candidats restés muets (serveurs sans
+    découverte UDP). Les serveurs pleins sont écartés. Les réponses
+    portant l'adresse IP du serveur, chaque candidat est résolu avant d'être
+    comparé aux serveurs ayant répondu.
+    """
+    servers = probe(candidates, broadcast_port, timeout)
+    order = [(info.host, info.port) for info in servers if info.free_slots > 0]
+    answered = {(info.host, info.port) for info in servers}
+    order += [candidate for candidate in candidates if not resolve(*candidate) & answered]
+    return order, servers
+
+
+def main(argv):
+    candidates = parse_servers(argv[0]) if argv else parse_servers()
+    servers = probe(candidates)
+    if not servers:
+        print("Aucun serveur trouvé")
+        return 1
+
+    for info in servers:
+        print(f"{info.host}:{info.port}  RTT {1000 * info.rtt:.2f} ms  "
+              f"joueurs {info.players}  places libres {info.free_slots}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+# Code généré par protocol/generate.py à partir de protocol/schema.json. NE PAS MODIFIER.
+
+"""Constantes du jeu partagées avec le serveur (server-tcp/pkg/game/config_gen.go)"""
+
+GAME_WIDTH = 800  # Largeur du terrain (px)
+GAME_HEIGHT = 600  # Hauteur du terrain (px)
+PADDLE_WIDTH = 15  # Largeur d'une raquette (px)
+PADDLE_HEIGHT = 100  # Hauteur d'une raquette (px)
+BALL_SIZE = 10  # Côté de la balle (px)
+BALL_SPEED = 300.0  # Vitesse de la balle (px/s)
+PADDLE_SPEED = 480.0  # Vitesse d'une raquette (px/s)
+TICK_RATE = 60  # Fréquence de la simulation (Hz)
+BROADCAST_RATE = 60  # Fréquence maximale de diffusion des états (Hz)
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Mesure l'effet de la compensation de latence sur des parties simulées.
+
+La physique reproduit Game.Update (server-tcp/pkg/game/game.go) : pas fixe
+de TICK_RATE, balayage continu des collisions, historique de la balle et
+décision différée des balles manquées. Deux
+robots jouent l'un contre l'autre : chacun reçoit les états avec un retard
+d'aller simple, prédit sa raquette localement et voit ses entrées arriver
+au serveur avec le même retard. Le taux de balles manquées est comparé
+avec et sans compensation pour plusieurs latences, en moyenne sur
+plusieurs graines : une seule partie varie autant que l'effet mesuré.
+La part des renvois dus au rejeu est l'effet directement attribuable à la
+compensation.
+
+test_lag_sim.py vérifie que cette physique suit celle du serveur sur les
+trajectoires de référence de server-tcp/pkg/game/testdata.
+
+Usage:
+    python lag_sim.py [durée_simulée_en_secondes] [rtt_ms,...] [nombre_de_graines]
+"""
+
+import math
+import random
+import statistics
+import sys
+from collections import deque, namedtuple
+
+from game_config import (
+    BALL_SIZE, BALL_SPEED, GAME_HEIGHT, GAME_WIDTH, PADDLE_HEIGHT, PADDLE_WIDTH, TICK_RATE,
+)
+from prediction import PADDLE_STEP, PaddlePredictor, move_paddle
+
+# Constantes du serveur (doivent correspondre à pkg/game/game.go)
+TICK_SECONDS = 1.0 / TICK_RATE
+MAX_REWIND_TICKS = TICK_RATE // 4
+HISTORY_SIZE = 64
+MAX_SWEEP_EVENTS = 8
+
+LEFT_LINE = PADDLE_WIDTH
+RIGHT_LINE = GAME_WIDTH - PADDLE_WIDTH - BALL_SIZE
+FLOOR = GAME_HEIGHT - BALL_SIZE
+
+# Comportement des robots
+REACTION_DISTANCE = 110  # Distance (px) à partir de laquelle le robot réagit
+AIM_NOISE = 20.0  # Écart type (px) de la visée
+
+DEFAULT_DURATION = 300  # Secondes de jeu simulées par mesure
+DEFAULT_RTTS = (0, 50, 100, 150, 200, 300)
+DEFAULT_SEEDS = 8  # Parties par latence et par mode
+
+EDGE_CLEAR, EDGE_PENDING, EDGE_MISSED = range(3)
+
+Snapshot = namedtuple("Snapshot", ["tick", "ball_x", "ball_y", "paddles", "seqs"])
+
+
+class Game:
+    """Portage de Game.Update ; max_rewind=0 désactive la compensation"""
+
+    def __init__(self, rng, max_rewind=MAX_REWIND_TICKS):
+        self.rng = rng
+        self.max_rewind = max_rewind
+        self.tick = 0
+        self.paddles = [GAME_HEIGHT / 2 - PADDLE_HEIGHT / 2] * 2
+        self.last_seq = [0, 0]
+        self.view_tick = [0, 0]
+        self.inputs = [None, None]
+        self.history = [(0, None)] * HISTORY_SIZE
+        self.edges = [(EDGE_CLEAR, 0, None), (EDGE_CLEAR, 0, None)]
+        self.scores = [0, 0]
+        self.hits = [0, 0]
+        self.rewound_hits = [0, 0]
+        self.misses = [0, 0]
+        self.reset_ball()
+
+    def reset_ball(self):
+        self.x = GAME_WIDTH / 2
+        self.y = GAME_HEIGHT / 2
+        angle = self.rng.random() * math.pi / 2 - math.pi / 4
+        if self.rng.random() <= 0.5:
+            angle += math.pi
+        self.vx = BALL_SPEED * math.cos(angle)
+        self.vy = BALL_SPEED * math.sin(angle)
+        self.edges = [(EDGE_CLEAR, 0, None), (EDGE_CLEAR, 0, None)]
+
+    def set_input(self, side, direction, seq, view_tick):
+        self.inputs[side] = (direction, seq, view_tick)
+
+    def update(self):
+        self.tick += 1
+        for side, entry in enumerate(self.inputs):
+            if entry is not None:
+                direction, self.last_seq[side], self.view_tick[side] = entry
+                # Raquette d'avant la première entrée faite en voyant le passage
+                state, tick, paddle = self.edges[side]
+                if state == EDGE_PENDING and paddle is None and self.view_tick[side] >= tick:
+                    self.edges[side] = (state, tick, self.paddles[side])
+                self.paddles[side] = move_paddle(self.paddles[side], direction)
+
+        self.history[self.tick % HISTORY_SIZE] = (self.tick, self.ball())
+
+        passed = self.sweep_ball(TICK_SECONDS)
+        for side in (0, 1):
+            if passed[side] and self.edges[side][0] == EDGE_CLEAR:
+                self.edges[side] = (EDGE_PENDING, self.tick, None)
+
+        self.resolve_miss(0)
+        self.resolve_miss(1)
+
+        if self.x <= 0 and self.edges[0][0] != EDGE_PENDING:
+            self.misses[0] += 1
+            self.scores[1] += 1
+            self.reset_ball()
+        elif self.x >= GAME_WIDTH and self.edges[1][0] != EDGE_PENDING:
+            self.misses[1] += 1
+            self.scores[0] += 1
+            self.reset_ball()
+
+    def ball(self):
+        return self.x, self.y, self.vx, self.vy
+
+    def sweep_ball(self, dt):
+        """Portage de Game.sweepBall"""
+        passed = [False, False]
+        crossed = [False, False]
+        for _ in range(MAX_SWEEP_EVENTS):
+            if dt <= 0:
+                break
+
+            tx, horizontal = dt, None
+            if self.vx < 0 and self.x >= LEFT_LINE and not crossed[0]:
+                tc = (LEFT_LINE - self.x) / self.vx
+                if tc <= tx:
+                    tx, horizontal = tc, "left"
+            elif self.vx > 0 and self.x <= RIGHT_LINE and not crossed[1]:
+                tc = (RIGHT_LINE - self.x) / self.vx
+                if tc <= tx:
+                    tx, horizontal = tc, "right"
+            ty, vertical = dt, None
+            if self.vy < 0 and self.y >= 0:
+                tc = -self.y / self.vy
+                if tc <= ty:
+                    ty, vertical = tc, "top"
+            elif self.vy > 0 and self.y <= FLOOR:
+                tc = (FLOOR - self.y) / self.vy
+                if tc <= ty:
+                    ty, vertical = tc, "bottom"
+
+            # Contacts simultanés : le mur d'abord, puis la raquette
+            t = min(tx, ty)
+            if tx > t:
+                horizontal = None
+            if ty > t:
+                vertical = None
+
+            self.x += self.vx * t
+            self.y += self.vy * t
+            dt -= t
+
+            if vertical == "top":
+                self.y = 0.0
+                self.vy = -self.vy
+            elif vertical == "bottom":
+                self.y = float(FLOOR)
+                self.vy = -self.vy
+
+            if horizontal == "left":
+                crossed[0] = True
+                self.x = LEFT_LINE
+                if self.overlaps(self.y, 0):
+                    self.bounce(0)
+                else:
+                    passed[0] = True
+            elif horizontal == "right":
+                crossed[1] = True
+                self.x = RIGHT_LINE
+                if self.overlaps(self.y, 1):
+                    self.bounce(1)
+                else:
+                    passed[1] = True
+        return passed
+
+    def overlaps(self, ball_y, side):
+        return ball_y + BALL_SIZE >= self.paddles[side] and ball_y <= self.paddles[side] + PADDLE_HEIGHT
+
+    def bounce(self, side):
+        self.hits[side] += 1
+        relative = (self.paddles[side] + PADDLE_HEIGHT / 2 - self.y) / (PADDLE_HEIGHT / 2)
+        angle = relative * math.pi / 4
+        self.vx = BALL_SPEED * math.cos(angle) * (1 if side == 0 else -1)
+        self.vy = -BALL_SPEED * math.sin(angle)
+        self.edges[side] = (EDGE_CLEAR, 0, None)
+
+    def resolve_miss(self, side):
+        state, tick, paddle = self.edges[side]
+        if state != EDGE_PENDING:
+            return
+
+        elapsed = self.tick - tick
+        if paddle is None:
+            if elapsed >= self.max_rewind:
+                self.edges[side] = (EDGE_MISSED, tick, None)
+            return
+
+        frame_tick, ball = self.history[tick % HISTORY_SIZE]
+        if frame_tick != tick:
+            self.edges[side] = (EDGE_MISSED, tick, None)
+            return
+
+        current, position = self.ball(), self.paddles[side]
+        self.x, self.y, self.vx, self.vy = ball
+        self.paddles[side] = paddle
+        missed = self.sweep_ball(TICK_SECONDS)[side]
+        self.paddles[side] = position
+        if missed:
+            self.x, self.y, self.vx, self.vy = current
+            self.edges[side] = (EDGE_MISSED, tick, None)
+            return
+
+        self.rewound_hits[side] += 1
+        for _ in range(elapsed):
+            self.sweep_ball(TICK_SECONDS)
+
+    def snapshot(self):
+        return Snapshot(self.tick, self.x, self.y, tuple(self.paddles), tuple(self.last_seq))
+
+
+class Bot:
+    """Joueur simulé : vise l'impact prévu une fois la balle assez proche"""
+
+    def __init__(self, side, rng, clock):
+        self.side = side
+        self.rng = rng
+        self.predictor = PaddlePredictor(GAME_HEIGHT / 2 - PADDLE_HEIGHT / 2, clock)
+        self.view = None
+        self.previous = None
+        self.noise = 0.0
+
+    def receive(self, snapshot):
+        self.previous, self.view = self.view, snapshot
+        self.predictor.reconcile(snapshot.paddles[self.side], snapshot.seqs[self.side], snapshot.tick)
+
+    def decide(self):
+        """Retourne (direction, séquence, tick affiché)"""
+        target = GAME_HEIGHT / 2
+        view, previous = self.view, self.previous
+        if view is not None and previous is not None:
+            ticks = max(1, view.tick - previous.tick)
+            vx = (view.ball_x - previous.ball_x) / ticks
+            vy = (view.ball_y - previous.ball_y) / ticks
+            line = PADDLE_WIDTH if self.side == 0 else GAME_WIDTH - PADDLE_WIDTH - BALL_SIZE
+            distance = (view.ball_x - line) if self.side == 0 else (line - view.ball_x)
+            approaching = (vx < 0) if self.side == 0 else (vx > 0)
+
+            # Un écart supérieur à la vitesse de la balle trahit une remise au centre
+            if approaching and 0 < abs(vx) <= BALL_SPEED * TICK_SECONDS and distance <= REACTION_DISTANCE:
+                target = self.intercept(view.ball_y, vy, distance / abs(vx)) + self.noise
+            else:
+                self.noise = self.rng.gauss(0.0, AIM_NOISE)
+
+        center = self.predictor.position + PADDLE_HEIGHT / 2 - BALL_SIZE / 2
+        direction = 0
+        if abs(target - center) > PADDLE_STEP / 2:
+            direction = 1 if target > center else -1
+
+        seq = self.predictor.apply_input(direction)
+        return direction, seq, view.tick if view is not None else 0
+
+    @staticmethod
+    def intercept(y, vy, ticks):
+        """Hauteur de la balle après `ticks`, rebonds sur les murs compris"""
+        span = GAME_HEIGHT - BALL_SIZE
+        y = (y + vy * ticks) % (2 * span)
+        return 2 * span - y if y > span else y
+
+
+def play(rtt_ms, duration, max_rewind, seed):
+    """Simule `duration` secondes de jeu et retourne le jeu final"""
+    rng = random.Random(seed)
+    game = Game(rng, max_rewind)
+    bots = [Bot(side, rng, lambda: game.tick) for side in (0, 1)]
+    delay = int(round(rtt_ms / 2 * TICK_RATE / 1000))
+
+    to_server = deque()  # (tick d'arrivée, côté, entrée)
+    to_clients = deque()  # (tick d'arrivée, état)
+
+    while game.tick < duration * TICK_RATE:
+        while to_server and to_server[0][0] <= game.tick:
+            _, side, entry = to_server.popleft()
+            game.set_input(side, *entry)
+
+        game.update()
+        to_clients.append((game.tick + delay, game.snapshot()))
+
+        now = game.tick
+        while to_clients and to_clients[0][0] <= now:
+            _, snapshot = to_clients.popleft()
+            for bot in bots:
+                bot.receive(snapshot)
+        for bot in bots:
+            to_server.append((now + delay, bot.side, bot.decide()))
+
+    return game
+
+
+def miss_rate(game):
+    returns = sum(game.hits) + sum(game.misses)
+    return sum(game.misses) / returns if returns else 0.0
+
+
+def rewound_rate(game):
+    """Part des renvois obtenus par rejeu"""
+    hits = sum(game.hits)
+    return sum(game.rewound_hits) / hits if hits else 0.0
+
+
+def spread(values):
+    """Moyenne et écart type en pourcentage"""
+    return 100 * statistics.mean(values), 100 * (statistics.stdev(values) if len(values) > 1 else 0.0)
+
+
+def main(argv):
+    duration = float(argv[0]) if argv else DEFAULT_DURATION
+    rtts = [int(v) for v in argv[1].split(",")] if len(argv) > 1 else DEFAULT_RTTS
+    seeds = int(argv[2]) if len(argv) > 2 else DEFAULT_SEEDS
+
+    print(f"{duration:.0f} s simulées par mesure, {seeds} graines, compensation jusqu'à "
+          f"{MAX_REWIND_TICKS} ticks ({1000 * MAX_REWIND_TICKS / TICK_RATE:.0f} ms)")
+    print("Taux de balles manquées (moyenne ± écart type entre graines) et part des renvois dus au rejeu")
+    print(f"{'RTT':>8}  {'sans':>13}  {'avec':>13}  {'rattrapées':>13}")
+    for rtt in rtts:
+        without, with_comp, rewound = [], [], []
+        for seed in range(seeds):
+            game = play(rtt, duration, 0, seed=seed)
+            without.append(miss_rate(game))
+            game = play(rtt, duration, MAX_REWIND_TICKS, seed=seed)
+            with_comp.append(miss_rate(game))
+            rewound.append(rewound_rate(game))
+        print(f"{rtt:>5} ms  " + "  ".join("{:>6.1f} ± {:>4.1f}%".format(*spread(values))
+                                           for values in (without, with_comp, rewound)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
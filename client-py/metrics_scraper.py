@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Enregistre les métriques du serveur pendant un test de charge.
+
+Le point /metrics du serveur (format texte de Prometheus) est interrogé à
+intervalle régulier ; chaque collecte est ajoutée à un fichier JSON Lines
+avec l'heure murale et l'horloge monotone, pour la rapprocher des mesures
+côté client (move_flood.py, statistiques F3, enregistrements de parties).
+
+Usage:
+    python metrics_scraper.py [url] [fichier] [intervalle_s] [durée_s]
+"""
+
+import json
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+
+# Point de collecte (variable PONG_METRICS_URL)
+DEFAULT_URL = os.environ.get("PONG_METRICS_URL", "http://127.0.0.1:9100/metrics")
+DEFAULT_PATH = "metrics.jsonl"
+DEFAULT_INTERVAL = 1.0
+SCRAPE_TIMEOUT = 1.0
+
+
+def parse_metrics(text):
+    """Convertit le format texte en {"nom{étiquettes}": valeur}"""
+    samples = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        name, _, value = line.rpartition(" ")
+        samples[name] = float(value)
+    return samples
+
+
+def scrape(url, timeout=SCRAPE_TIMEOUT):
+    """Interroge le serveur et retourne les échantillons"""
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return parse_metrics(response.read().decode("utf-8"))
+
+
+def record(url, path, interval=DEFAULT_INTERVAL, duration=None):
+    """Collecte jusqu'à la fin de `duration` (ou Ctrl-C) et retourne (première, dernière) collecte"""
+    first = last = None
+    next_scrape = time.monotonic()
+    end = next_scrape + duration if duration else None
+    with open(path, "a", encoding="utf-8") as f:
+        try:
+            while end is None or time.monotonic() < end:
+                try:
+                    samples = scrape(url)
+                except (urllib.error.URLError, OSError) as e:
+                    print(f"Collecte impossible: {e}")
+                else:
+                    entry = {"time": time.time(), "monotonic": time.monotonic(), "samples": samples}
+                    f.write(json.dumps(entry) + "\n")
+                    f.flush()
+                    first = first or entry
+                    last = entry
+
+                # Avancer d'un intervalle fixe pour conserver la cadence
+                next_scrape += interval
+                time.sleep(max(0.0, next_scrape - time.monotonic()))
+        except KeyboardInterrupt:
+            pass
+    return first, last
+
+
+def summarize(first, last):
+    """Résume l'évolution des compteurs entre deux collectes"""
+    elapsed = last["monotonic"] - first["monotonic"]
+    a, b = first["samples"], last["samples"]
+
+    def delta(name):
+        return b.get(name, 0.0) - a.get(name, 0.0)
+
+    lines = [f"Durée: {elapsed:.1f} s"]
+    if elapsed > 0:
+        lines.append(f"Ticks: {delta('pong_ticks_total') / elapsed:.1f}/s")
+    for name, label in (("pong_tick_duration_seconds", "Durée moyenne d'un tick"),
+                        ("pong_tick_overrun_seconds", "Retard moyen des ticks")):
+        count = delta(f"{name}_count")
+        if count:
+            lines.append(f"{label}: {1e6 * delta(f'{name}_sum') / count:.0f} µs")
+    for player in ("1", "2"):
+        count = delta(f'pong_client_write_seconds_count{{player="{player}"}}')
+        if count:
+            total = delta(f'pong_client_write_seconds_sum{{player="{player}"}}')
+            sent = delta(f'pong_client_sent_bytes_total{{player="{player}"}}')
+            lines.append(f"Joueur {player}: écriture moyenne {1e6 * total / count:.0f} µs, "
+                         f"{sent / max(elapsed, 1e-9) / 1024:.1f} Kio/s")
+    lines.append(f"File de diffusion (dernière collecte): {b.get('pong_broadcast_queue_depth', 0.0):.0f}")
+    return lines
+
+
+def main(argv):
+    url = argv[0] if argv else DEFAULT_URL
+    path = argv[1] if len(argv) > 1 else DEFAULT_PATH
+    interval = float(argv[2]) if len(argv) > 2 else DEFAULT_INTERVAL
+    duration = float(argv[3]) if len(argv) > 3 else None
+
+    print(f"Collecte de {url} toutes les {interval:g} s dans {path} (Ctrl-C pour arrêter)")
+    first, last = record(url, path, interval, duration)
+    if first is None:
+        print("Aucune collecte réussie")
+        return 1
+
+    for line in summarize(first, last):
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,22 +1,22 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import socket
-import struct
-import threading
 import time
 import os
 import sys
 
-# Configuration
-SERVER_HOST = "127.0.0.1"
-SERVER_PORT = 9090
+from discovery import parse_servers
+from net_daemon import LINK_CONNECTED, NetworkLink
 
-# Types de messages (doivent correspondre à ceux du serveur)
-MSG_TYPE_GAME_STATE = 1
-MSG_TYPE_PLAYER_JOIN = 2
-MSG_TYPE_PLAYER_MOVE = 3
-MSG_TYPE_PLAYER_READY = 4
+# Configuration : serveurs candidats (variable PONG_SERVERS, voir discovery.py)
+SERVERS = parse_servers()
+
+# Abonnement aux états de jeu (l'état n'est affiché qu'entre deux commandes)
+SNAPSHOT_RATE = 2  # Hz, 0 pour chaque tick du serveur
+SNAPSHOT_ON_CHANGE = 1  # 1 pour ne recevoir que les états modifiés
+
+# Durée d'un déplacement déclenché par une commande A ou Z (secondes)
+MOVE_DURATION = 0.1
 
 class PongClient:
     def __init__(self):
@@ -32,143 +32,77 @@ class PongClient:
         
         # État du client
         self.player_id = 0
+        self.move_seq = 0
         self.player1_ready = False
         self.player2_ready = False
         self.game_started = False
         self.connected = False
         self.running = True
+        self.snapshots = 0
+        self.link_message = ""
         self.message = "Initialisation..."
         
-        # Connexion au serveur
-        self.connect_to_server()
-        
-        # Démarrer la boucle de réception
-        self.receive_thread = threading.Thread(target=self.receive_loop)
-        self.receive_thread.daemon = True
-        self.receive_thread.start()
+        # Le démon réseau possède le socket et publie l'état en mémoire partagée
+        self.link = NetworkLink(SERVERS, SNAPSHOT_RATE, SNAPSHOT_ON_CHANGE)
         
         # Boucle principale du jeu
         self.main_loop()
     
-    def connect_to_server(self):
-        """Établit la connexion avec le serveur"""
-        try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.connect((SERVER_HOST, SERVER_PORT))
-            self.connected = True
-            self.message = f"Connecté au serveur {SERVER_HOST}:{SERVER_PORT}"
-        except Exception as e:
-            self.connected = False
-            self.message = f"Erreur de connexion: {e}"
-    
-    def receive_loop(self):
-        """Boucle de réception des messages du serveur"""
-        while self.running and self.connected:
-            try:
-                # Lire l'en-tête (5 octets)
-                header = self.sock.recv(5)
-                if not header or len(header) < 5:
-                    self.connected = False
-                    self.message = "Connexion fermée par le serveur"
-                    break
-                
-                # Analyser l'en-tête
-                msg_type = header[0]
-                msg_length = struct.unpack(">I", header[1:5])[0]
-                
-                # Lire le contenu du message
-                payload = self.sock.recv(msg_length)
-                if len(payload) < msg_length:
-                    self.message = "Message incomplet reçu"
-                    continue
-                
-                # Traiter le message selon son type
-                if msg_type == MSG_TYPE_GAME_STATE:
-                    self.handle_game_state(payload)
-                elif msg_type == MSG_TYPE_PLAYER_JOIN:
-                    self.handle_player_join(payload)
-                elif msg_type == MSG_TYPE_PLAYER_READY:
-                    self.handle_player_ready(payload)
-            
-            except Exception as e:
-                self.connected = False
-                self.message = f"Erreur dans la boucle de réception: {e}"
-                break
-    
-    def handle_game_state(self, payload):
-        """Traite un message d'état du jeu"""
-        if len(payload) >= 18:
-            self.state["player1_y"] = int(struct.unpack(">f", payload[0:4])[0])
-            self.state["player2_y"] = int(struct.unpack(">f", payload[4:8])[0])
-            self.state["ball_x"] = int(struct.unpack(">f", payload[8:12])[0])
-            self.state["ball_y"] = int(struct.unpack(">f", payload[12:16])[0])
-            self.state["player1_score"] = payload[16]
-            self.state["player2_score"] = payload[17]
-            
-            # Si les deux joueurs sont prêts, le jeu est considéré comme démarré
-            if self.player1_ready and self.player2_ready:
-                self.game_started = True
-    
-    def handle_player_join(self, payload):
-        """Traite un message d'attribution d'ID de joueur"""
-        if len(payload) >= 1:
-            self.player_id = payload[0]
-            self.message = f"Vous êtes le joueur {self.player_id}"
+    def poll_network(self):
+        """Lit le dernier état publié par le démon réseau"""
+        _, record = self.link.read()
+        if record is None:
+            return
+        
+        self.player_id = record.player_id
+        self.player1_ready = record.player1_ready == 1
+        self.player2_ready = record.player2_ready == 1
+        self.connected = record.link == LINK_CONNECTED
+        
+        # Afficher les nouveaux messages du démon
+        if record.message != self.link_message:
+            self.link_message = record.message
+            self.message = record.message
+        
+        if record.snapshots != self.snapshots:
+            self.snapshots = record.snapshots
+            self.handle_game_state(record)
     
-    def handle_player_ready(self, payload):
-        """Traite un message d'état de préparation d'un joueur"""
-        if len(payload) >= 2:
-            player_id = payload[0]
-            is_ready = payload[1] == 1
-            
-            if player_id == 1:
-                self.player1_ready = is_ready
-                self.message = f"Joueur 1 est {'prêt' if is_ready else 'pas prêt'}"
-            elif player_id == 2:
-                self.player2_ready = is_ready
-                self.message = f"Joueur 2 est {'prêt' if is_ready else 'pas prêt'}"
+    def handle_game_state(self, state):
+        """Traite un nouvel état du jeu"""
+        self.state["player1_y"] = int(state.player1_y)
+        self.state["player2_y"] = int(state.player2_y)
+        self.state["ball_x"] = int(state.ball_x)
+        self.state["ball_y"] = int(state.ball_y)
+        self.state["player1_score"] = state.player1_score
+        self.state["player2_score"] = state.player2_score
+        
+        # Si les deux joueurs sont prêts, le jeu est considéré comme démarré
+        if self.player1_ready and self.player2_ready:
+            self.game_started = True
     
     def send_player_move(self, direction):
-        """Envoie un message de mouvement du joueur"""
+        """Transmet un mouvement du joueur au démon réseau"""
         if not self.connected or self.player_id == 0:
             return
         
-        try:
-            # Créer le message
-            payload = struct.pack(">Bb", self.player_id, direction)
-            
-            # Ajouter l'en-tête
-            header = struct.pack(">BI", MSG_TYPE_PLAYER_MOVE, len(payload))
-            
-            # Envoyer le message complet
-            self.sock.sendall(header + payload)
-        except Exception as e:
-            self.message = f"Erreur d'envoi de mouvement: {e}"
+        self.move_seq += 1
+        self.link.send_move(direction, self.move_seq)
     
     def send_player_ready(self, is_ready):
-        """Envoie un message d'état de préparation du joueur"""
+        """Transmet l'état de préparation du joueur au démon réseau"""
         if not self.connected or self.player_id == 0:
             return
         
-        try:
-            # Créer le message
-            payload = struct.pack(">BB", self.player_id, 1 if is_ready else 0)
-            
-            # Ajouter l'en-tête
-            header = struct.pack(">BI", MSG_TYPE_PLAYER_READY, len(payload))
-            
-            # Envoyer le message complet
-            self.sock.sendall(header + payload)
-            
-            # Mettre à jour l'état local
-            if self.player_id == 1:
-                self.player1_ready = is_ready
-            elif self.player_id == 2:
-                self.player2_ready = is_ready
-            
-            self.message = f"Vous êtes {'prêt' if is_ready else 'pas prêt'}"
-        except Exception as e:
-            self.message = f"Erreur d'envoi d'état de préparation: {e}"
+        self.link.send_ready(is_ready)
+        
+        # Mettre à jour l'état local
+        if self.player_id == 1:
+            self.player1_ready = is_ready
+        elif self.player_id == 2:
+            self.player2_ready = is_ready
+        
+        self.message = f"Vous êtes {'prêt' if is_ready else 'pas prêt'}"
     
     def clear_screen(self):
         """Efface l'écran de la console"""
@@ -230,6 +164,9 @@ class PongClient:
         """Boucle principale du jeu"""
         try:
             while self.running:
+                # Lire le dernier état publié par le démon réseau
+                self.poll_network()
+                
                 # Afficher l'interface
                 if not self.game_started:
                     self.print_waiting_screen()
@@ -249,11 +186,12 @@ class PongClient:
                     elif self.player_id == 2:
                         self.send_player_ready(not self.player2_ready)
                 
-                elif command.lower() == 'a':
-                    self.send_player_move(-1)  # Vers le haut
-                
-                elif command.lower() == 'z':
-                    self.send_player_move(1)   # Vers le bas
+                elif command.lower() in ('a', 'z'):
+                    # Le serveur applique la direction à chaque tick jusqu'à
+                    # l'arrêt : on se déplace pendant MOVE_DURATION secondes
+                    self.send_player_move(-1 if command.lower() == 'a' else 1)
+                    time.sleep(MOVE_DURATION)
+                    self.send_player_move(0)
                 
                 # Pause pour éviter une utilisation excessive du CPU
                 time.sleep(0.1)
@@ -264,8 +202,7 @@ class PongClient:
         
         finally:
             # Nettoyage
-            if self.connected:
-                self.sock.close()
+            self.link.close()
             print("\nAu revoir !")
 
 if __name__ == "__main__":
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Inonde le serveur de mouvements pour vérifier que leur coût reste borné.
+
+Le client envoie des PlayerMove aussi vite que possible (la direction
+s'inverse toutes les 0,25 s) et observe les états reçus : la raquette ne
+doit jamais avancer de plus de PADDLE_STEP par tick et la cadence des
+ticks doit rester régulière, quel que soit le débit de mouvements.
+
+La cadence est jugée sur les ticks des états reçus (fréquence mesurée et
+ticks rattrapés en un seul passage de la boucle de jeu) et, si le point
+de métriques répond, sur le retard moyen des réveils du serveur
+(pong_tick_overrun_seconds). test_move_flood.py lance le même contrôle
+sur un serveur compilé pour l'occasion.
+
+Usage:
+    python move_flood.py [hôte:port] [durée_en_secondes] [url_des_métriques]
+"""
+
+import socket
+import sys
+import threading
+import time
+import urllib.error
+
+from pong_protocol import (
+    HEADER, MSG_TYPE_GAME_STATE, MSG_TYPE_PLAYER_JOIN,
+    decode_game_state, decode_player_join, encode_player_move, encode_subscribe,
+)
+from game_config import TICK_RATE
+from metrics_scraper import DEFAULT_URL, scrape
+from prediction import PADDLE_STEP
+
+BATCH_SIZE = 100  # Mouvements concaténés par appel à sendall
+REVERSE_INTERVAL = 0.25
+
+# Limites de la cadence des ticks
+TICK_RATE_TOLERANCE = 0.05  # Écart relatif admis sur la fréquence mesurée
+MAX_CATCH_UP_RATIO = 0.01  # Part maximale des ticks simulés en rattrapage
+MAX_MEAN_OVERRUN = 0.002  # Retard moyen maximal des réveils du serveur (s)
+
+
+def read_exact(sock, size):
+    """Lit exactement `size` octets"""
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connexion fermée par le serveur")
+        data += chunk
+    return bytes(data)
+
+
+def read_message(sock):
+    """Lit un message complet et retourne (type, corps)"""
+    msg_type, length = HEADER.unpack(read_exact(sock, HEADER.size))
+    return msg_type, read_exact(sock, length)
+
+
+def overrun_totals(metrics_url):
+    """Retourne (somme, nombre) de pong_tick_overrun_seconds, ou None"""
+    if not metrics_url:
+        return None
+    try:
+        samples = scrape(metrics_url)
+    except (urllib.error.URLError, OSError):
+        return None
+    return samples.get("pong_tick_overrun_seconds_sum", 0.0), samples.get("pong_tick_overrun_seconds_count", 0.0)
+
+
+def flood(host, port, duration, metrics_url=None):
+    before = overrun_totals(metrics_url)
+    sock = socket.create_connection((host, port))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.sendall(encode_subscribe(0, 0))
+
+    msg_type, payload = read_message(sock)
+    if msg_type != MSG_TYPE_PLAYER_JOIN:
+        raise RuntimeError(f"PlayerJoin attendu, type {msg_type} reçu")
+    player_id = decode_player_join(payload).player_id
+
+    sent = 0
+    stop = threading.Event()
+
+    def sender():
+        nonlocal sent
+        seq = 0
+        start = time.monotonic()
+        while not stop.is_set():
+            direction = 1 if int((time.monotonic() - start) / REVERSE_INTERVAL) % 2 == 0 else -1
+            batch = bytearray()
+            for _ in range(BATCH_SIZE):
+                seq += 1
+                batch += encode_player_move(player_id, direction, seq, 0)
+            sock.sendall(batch)
+            sent += BATCH_SIZE
+        sock.sendall(encode_player_move(player_id, 0, seq + 1, 0))
+
+    thread = threading.Thread(target=sender, daemon=True)
+    thread.start()
+
+    positions = []
+    ticks = []
+    arrivals = []
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        msg_type, payload = read_message(sock)
+        if msg_type == MSG_TYPE_GAME_STATE:
+            state = decode_game_state(payload)
+            positions.append(state.player1_y if player_id == 1 else state.player2_y)
+            ticks.append(state.tick)
+            arrivals.append(time.monotonic())
+
+    stop.set()
+    thread.join()
+    sock.close()
+    after = overrun_totals(metrics_url)
+
+    # Un état peut couvrir plusieurs ticks si la simulation a rattrapé un retard
+    steps = [abs(b - a) / max(1, t1 - t0)
+             for a, b, t0, t1 in zip(positions, positions[1:], ticks, ticks[1:])]
+    intervals = [b - a for a, b in zip(arrivals, arrivals[1:])]
+    gaps = [t1 - t0 for t0, t1 in zip(ticks, ticks[1:])]
+    span = arrivals[-1] - arrivals[0] if len(arrivals) > 1 else 0.0
+    mean_overrun = None
+    if before is not None and after is not None and after[1] > before[1]:
+        mean_overrun = (after[0] - before[0]) / (after[1] - before[1])
+    return {
+        "moves_per_second": sent / duration,
+        "states": len(positions),
+        "max_step": max(steps) if steps else 0.0,
+        "mean_interval": sum(intervals) / len(intervals) if intervals else 0.0,
+        "max_interval": max(intervals) if intervals else 0.0,
+        "tick_rate": sum(gaps) / span if span > 0 else 0.0,
+        "catch_up_ratio": sum(gap - 1 for gap in gaps if gap > 1) / max(1, sum(gaps)),
+        "mean_overrun": mean_overrun,
+    }
+
+
+def check(result):
+    """Retourne la liste des limites dépassées"""
+    failures = []
+    if result["max_step"] > PADDLE_STEP + 1e-3:
+        failures.append("la raquette avance de plus d'un pas par tick")
+    if abs(result["tick_rate"] - TICK_RATE) > TICK_RATE_TOLERANCE * TICK_RATE:
+        failures.append(f"fréquence des ticks {result['tick_rate']:.1f} Hz au lieu de {TICK_RATE} Hz")
+    if result["catch_up_ratio"] > MAX_CATCH_UP_RATIO:
+        failures.append(f"{100 * result['catch_up_ratio']:.1f}% des ticks simulés en rattrapage")
+    if result["mean_overrun"] is not None and result["mean_overrun"] > MAX_MEAN_OVERRUN:
+        failures.append(f"retard moyen des ticks {1000 * result['mean_overrun']:.2f} ms")
+    return failures
+
+
+def main(argv):
+    address = argv[0] if argv else "127.0.0.1:9090"
+    duration = float(argv[1]) if len(argv) > 1 else 5.0
+    metrics_url = argv[2] if len(argv) > 2 else DEFAULT_URL
+    host, _, port = address.rpartition(":")
+
+    result = flood(host, int(port), duration, metrics_url)
+    print(f"Mouvements envoyés: {result['moves_per_second']:.0f}/s")
+    print(f"États reçus: {result['states']}")
+    print(f"Pas maximal de la raquette: {result['max_step']:.1f} px (limite {PADDLE_STEP:.1f})")
+    print("Intervalle entre états: moyen {:.1f} ms, max {:.1f} ms".format(
+        1000 * result["mean_interval"], 1000 * result["max_interval"]))
+    print(f"Ticks: {result['tick_rate']:.1f}/s, {100 * result['catch_up_ratio']:.2f}% en rattrapage")
+    if result["mean_overrun"] is not None:
+        print(f"Retard moyen des ticks: {1e6 * result['mean_overrun']:.0f} µs")
+    else:
+        print("Retard des ticks: métriques indisponibles")
+
+    failures = check(result)
+    for failure in failures:
+        print(f"ÉCHEC: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
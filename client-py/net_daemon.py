@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Démon réseau : possède le socket et publie l'état en mémoire partagée.
+
+Le démon tourne dans un processus séparé, avec son propre GIL : il lit et
+décode les messages du serveur puis publie le dernier état dans un bloc
+multiprocessing.shared_memory protégé par un seqlock. Les moteurs de rendu
+(pygame, curses, console) se contentent de lire ce bloc ; leurs entrées
+reviennent au démon par un anneau producteur/consommateur sans verrou.
+
+D'autres processus locaux (enregistreur, statistiques) peuvent s'attacher
+au bloc par son nom sans ouvrir de socket supplémentaire.
+
+En mode vidange (par défaut), chaque lecture vide le socket d'un coup et
+seul le GAME_STATE le plus récent est décodé : après un ralentissement, le
+client revient immédiatement au temps réel au lieu de rejouer l'historique.
+"""
+
+import multiprocessing
+import os
+import select
+import socket
+import struct
+import sys
+import time
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+from discovery import connection_order
+from pong_protocol import (
+    HEADER, HEADER_SIZE, MSG_TYPE_GAME_STATE, MSG_TYPE_PLAYER_JOIN, MSG_TYPE_PLAYER_READY,
+    decode_game_state, decode_player_join, decode_player_ready,
+    encode_player_move, encode_player_ready, encode_subscribe,
+)
+
+# États de la liaison avec le serveur
+LINK_CONNECTING = 0
+LINK_CONNECTED = 1
+LINK_DISCONNECTED = 2
+
+# Enregistrement publié par le démon
+SharedRecord = namedtuple("SharedRecord", [
+    "ball_x", "ball_y", "player1_y", "player1_score", "player2_y", "player2_score",
+    "is_running", "player1_seq", "player2_seq", "tick",
+    "player_id", "player1_ready", "player2_ready", "link",
+    "snapshots", "skipped", "received_at", "message",
+])
+
+_U64 = struct.Struct("<Q")
+_RECORD = struct.Struct("<fffHfHBIIIBBBBQQd128s")
+STATE_SIZE = _U64.size + _RECORD.size
+
+# Anneau d'entrées (renderer -> démon). La tête n'est écrite que par le
+# producteur et la queue que par le consommateur, chacune sur sa propre
+# ligne de cache.
+INPUT_MOVE = 1
+INPUT_READY = 2
+INPUT_QUIT = 3
+
+_SLOT = struct.Struct("<BbI")
+RING_SLOTS = 256
+SLOT_SIZE = 8
+_RING_HEAD = 0
+_RING_TAIL = 64
+_RING_SLOTS_OFFSET = 128
+RING_SIZE = _RING_SLOTS_OFFSET + RING_SLOTS * SLOT_SIZE
+
+CONNECT_TIMEOUT = 2.0
+INPUT_POLL_INTERVAL = 0.001  # Attente maximale de select entre deux lectures de l'anneau
+RECV_SIZE = 65536
+RECV_BUFFER_SIZE = 1 << 20  # Tampon de réception du mode vidange
+
+# Vidange du socket à chaque lecture (variable PONG_DRAIN, 0 pour traiter chaque état)
+DRAIN_SNAPSHOTS = os.environ.get("PONG_DRAIN", "1") != "0"
+SEQLOCK_RETRIES = 1000
+
+
+def _open(name, create, size, track):
+    """Crée ou ouvre un bloc de mémoire partagée
+
+    Avec track=False (processus externe au client), le bloc n'est pas
+    confié au resource_tracker du processus, qui le supprimerait sinon à
+    sa sortie alors qu'il appartient au client.
+    """
+    if create:
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
+    if track:
+        return shared_memory.SharedMemory(name=name)
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == "posix":
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class SharedState:
+    """Dernier état publié, protégé par un seqlock
+
+    Le compteur est impair pendant une écriture ; un lecteur recommence
+    tant que le compteur est impair ou a changé pendant sa copie.
+    """
+
+    def __init__(self, name=None, create=False, track=True):
+        self.shm = _open(name, create, STATE_SIZE, track)
+        self.name = self.shm.name
+        self.buf = self.shm.buf
+        self.version = 0
+        self.last = None
+        if create:
+            self.buf[:STATE_SIZE] = bytes(STATE_SIZE)
+
+    def publish(self, record):
+        """Écrit un nouvel enregistrement (un seul écrivain)"""
+        version = self.version + 1
+        _U64.pack_into(self.buf, 0, version)
+        _RECORD.pack_into(self.buf, _U64.size, *record)
+        self.version = version + 1
+        _U64.pack_into(self.buf, 0, self.version)
+
+    def read(self):
+        """Retourne (version, SharedRecord) ou (0, None) si rien n'est publié"""
+        buf = self.buf
+        for _ in range(SEQLOCK_RETRIES):
+            before = _U64.unpack_from(buf, 0)[0]
+            if before & 1:
+                continue
+            values = _RECORD.unpack_from(buf, _U64.size)
+            if _U64.unpack_from(buf, 0)[0] == before:
+                break
+        else:
+            # Écrivain bloqué au milieu d'une écriture : garder le dernier état cohérent
+            return self.last if self.last is not None else (0, None)
+
+        if before == 0:
+            return 0, None
+        record = SharedRecord._make(values)
+        record = record._replace(message=record.message.rstrip(b"\0").decode("utf-8", "ignore"))
+        self.last = (before, record)
+        return self.last
+
+    def close(self, unlink=False):
+        self.buf = None
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+class InputRing:
+    """Anneau d'entrées à un producteur et un consommateur, sans verrou"""
+
+    def __init__(self, name=None, create=False, track=True):
+        self.shm = _open(name, create, RING_SIZE, track)
+        self.name = self.shm.name
+        self.buf = self.shm.buf
+        if create:
+            self.buf[:RING_SIZE] = bytes(RING_SIZE)
+
+    def push(self, kind, value=0, seq=0):
+        """Ajoute une entrée ; retourne False si l'anneau est plein"""
+        head = _U64.unpack_from(self.buf, _RING_HEAD)[0]
+        tail = _U64.unpack_from(self.buf, _RING_TAIL)[0]
+        if head - tail >= RING_SLOTS:
+            return False
+
+        _SLOT.pack_into(self.buf, _RING_SLOTS_OFFSET + (head % RING_SLOTS) * SLOT_SIZE, kind, value, seq)
+        _U64.pack_into(self.buf, _RING_HEAD, head + 1)
+        return True
+
+    def pop_all(self):
+        """Retire toutes les entrées disponibles, dans l'ordre"""
+        head = _U64.unpack_from(self.buf, _RING_HEAD)[0]
+        tail = _U64.unpack_from(self.buf, _RING_TAIL)[0]
+        items = [
+            _SLOT.unpack_from(self.buf, _RING_SLOTS_OFFSET + (i % RING_SLOTS) * SLOT_SIZE)
+            for i in range(tail, head)
+        ]
+        _U64.pack_into(self.buf, _RING_TAIL, head)
+        return items
+
+    def close(self, unlink=False):
+        self.buf = None
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+class NetworkDaemon:
+    """Boucle du processus réseau"""
+
+    def __init__(self, state, ring, servers, snapshot_rate, snapshot_on_change, drain=DRAIN_SNAPSHOTS):
+        self.state = state
+        self.ring = ring
+        self.servers = servers
+        self.snapshot_rate = snapshot_rate
+        self.snapshot_on_change = snapshot_on_change
+        self.drain = drain
+        self.parent_pid = os.getppid()
+        self.sock = None
+        self.running = True
+
+        # Octets reçus non encore traités
+        self.buffer = bytearray(RECV_BUFFER_SIZE if drain else 0)
+        self.view = memoryview(self.buffer) if drain else None
+        self.buffered = 0
+        self.record = SharedRecord(
+            ball_x=400.0, ball_y=300.0, player1_y=250.0, player1_score=0,
+            player2_y=250.0, player2_score=0, is_running=0, player1_seq=0, player2_seq=0, tick=0,
+            player_id=0, player1_ready=0, player2_ready=0, link=LINK_CONNECTING,
+            snapshots=0, skipped=0, received_at=0.0, message="Connexion au serveur...",
+        )
+
+    def publish(self, **changes):
+        """Met à jour l'enregistrement local et le publie"""
+        self.record = self.record._replace(**changes)
+        self.state.publish(self.record._replace(message=self.record.message.encode("utf-8")[:128]))
+
+    def connect(self):
+        """Découvre les serveurs puis se connecte au meilleur disponible"""
+        self.publish(link=LINK_CONNECTING, message="Recherche de serveurs...")
+        order, found = connection_order(self.servers)
+        rtts = {(info.host, info.port): info.rtt for info in found}
+
+        error = "aucun serveur disponible"
+        for host, port in order:
+            self.publish(message=f"Connexion au serveur {host}:{port}...")
+            try:
+                self.sock = socket.create_connection((host, port), timeout=CONNECT_TIMEOUT)
+                # Bloquant pour sendall ; drain_socket ne passe en non bloquant
+                # que le temps de vider le socket
+                self.sock.settimeout(None)
+                self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.sock.sendall(encode_subscribe(self.snapshot_rate, self.snapshot_on_change))
+            except Exception as e:
+                self.sock = None
+                error = e
+                continue
+
+            self.buffered = 0
+            if not self.drain:
+                self.buffer.clear()
+
+            message = f"Connecté au serveur {host}:{port}"
+            if (host, port) in rtts:
+                message += f" (RTT {1000 * rtts[host, port]:.1f} ms)"
+            self.publish(link=LINK_CONNECTED, message=message)
+            return
+
+        self.publish(link=LINK_DISCONNECTED, message=f"Erreur de connexion: {error}")
+
+    def disconnect(self, message):
+        """Ferme le socket et signale la déconnexion"""
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+        self.publish(link=LINK_DISCONNECTED, message=message)
+
+    def run(self):
+        self.connect()
+
+        while self.running and os.getppid() == self.parent_pid:
+            self.process_inputs()
+
+            if self.sock is None:
+                time.sleep(INPUT_POLL_INTERVAL)
+                continue
+
+            try:
+                readable, _, _ = select.select([self.sock], [], [], INPUT_POLL_INTERVAL)
+                if not readable:
+                    continue
+
+                if self.drain:
+                    self.drain_socket()
+                else:
+                    self.receive()
+            except Exception as e:
+                self.disconnect(f"Erreur dans la boucle de réception: {e}")
+
+        if self.sock is not None:
+            self.sock.close()
+
+    def receive(self):
+        """Lit un bloc de données et traite chaque message complet"""
+        data = self.sock.recv(RECV_SIZE)
+        if not data:
+            self.disconnect("Connexion fermée par le serveur")
+            return
+
+        self.buffer += data
+        offset = self.process_messages(self.buffer)
+        del self.buffer[:offset]
+
+    def drain_socket(self):
+        """Vide le socket puis ne publie que l'état le plus récent"""
+        sock, view = self.sock, self.view
+        end = self.buffered
+        # Non bloquant pendant la vidange seulement : recv_into s'arrête quand
+        # le socket est vide, et sendall peut toujours attendre un tampon plein
+        sock.setblocking(False)
+        try:
+            while True:
+                if end == len(view):
+                    # Tampon plein : traiter ce qui est complet avant de continuer
+                    end = self.compact(end)
+                try:
+                    n = sock.recv_into(view[end:])
+                except BlockingIOError:
+                    break
+                if n == 0:
+                    self.disconnect("Connexion fermée par le serveur")
+                    return
+                end += n
+        finally:
+            if self.sock is sock:
+                sock.setblocking(True)
+
+        self.buffered = self.compact(end)
+
+    def compact(self, end):
+        """Traite les messages complets et ramène le reste en début de tampon"""
+        offset = self.process_latest(self.buffer, end)
+        remaining = end - offset
+        if offset and remaining:
+            self.view[:remaining] = self.view[offset:end]
+        return remaining
+
+    def process_messages(self, buffer):
+        """Traite les messages complets du tampon et retourne les octets consommés"""
+        offset = 0
+        while len(buffer) - offset >= HEADER_SIZE:
+            msg_type, length = HEADER.unpack_from(buffer, offset)
+            end = offset + HEADER_SIZE + length
+            if len(buffer) < end:
+                break
+
+            body = offset + HEADER_SIZE
+            if msg_type == MSG_TYPE_GAME_STATE:
+                self.handle_game_state(decode_game_state(buffer, body))
+            elif msg_type == MSG_TYPE_PLAYER_JOIN:
+                self.handle_player_join(decode_player_join(buffer, body))
+            elif msg_type == MSG_TYPE_PLAYER_READY:
+                self.handle_player_ready(decode_player_ready(buffer, body))
+            offset = end
+        return offset
+
+    def process_latest(self, buffer, end):
+        """Comme process_messages, mais seul le dernier GAME_STATE est décodé
+
+        Les PLAYER_JOIN et PLAYER_READY sont tous appliqués, dans l'ordre ;
+        les états plus anciens sont seulement comptés.
+        """
+        offset = 0
+        latest = None
+        states = 0
+        while end - offset >= HEADER_SIZE:
+            msg_type, length = HEADER.unpack_from(buffer, offset)
+            stop = offset + HEADER_SIZE + length
+            if stop > end:
+                break
+
+            body = offset + HEADER_SIZE
+            if msg_type == MSG_TYPE_GAME_STATE:
+                latest = body
+                states += 1
+            elif msg_type == MSG_TYPE_PLAYER_JOIN:
+                self.handle_player_join(decode_player_join(buffer, body))
+            elif msg_type == MSG_TYPE_PLAYER_READY:
+                self.handle_player_ready(decode_player_ready(buffer, body))
+            offset = stop
+
+        if latest is not None:
+            self.handle_game_state(decode_game_state(buffer, latest), skipped=states - 1)
+        return offset
+
+    def handle_game_state(self, state, skipped=0):
+        """Publie un état du jeu ; skipped compte les états plus anciens ignorés"""
+        self.publish(
+            **state._asdict(),
+            snapshots=self.record.snapshots + 1,
+            skipped=self.record.skipped + skipped,
+            received_at=time.monotonic(),
+        )
+
+    def handle_player_join(self, join):
+        """Publie l'ID de joueur attribué"""
+        self.publish(player_id=join.player_id, message=f"Vous êtes le joueur {join.player_id}")
+
+    def handle_player_ready(self, ready):
+        """Publie l'état de préparation d'un joueur"""
+        message = f"Joueur {ready.player_id} est {'prêt' if ready.ready == 1 else 'pas prêt'}"
+        if ready.player_id == 1:
+            self.publish(player1_ready=ready.ready, message=message)
+        elif ready.player_id == 2:
+            self.publish(player2_ready=ready.ready, message=message)
+
+    def process_inputs(self):
+        """Envoie au serveur les entrées déposées par le moteur de rendu"""
+        inputs = self.ring.pop_all()
+        if not inputs:
+            return
+
+        player_id = self.record.player_id
+        # Les mouvements portent le tick du dernier état reçu, pour que le
+        # serveur juge les frappes selon ce que le joueur voyait
+        view_tick = self.record.tick
+        out = bytearray()
+        for kind, value, seq in inputs:
+            if kind == INPUT_QUIT:
+                self.running = False
+            elif player_id == 0:
+                continue
+            elif kind == INPUT_MOVE:
+                out += encode_player_move(player_id, value, seq, view_tick)
+            elif kind == INPUT_READY:
+                out += encode_player_ready(player_id, value)
+                # Mettre à jour l'état local sans attendre la diffusion du serveur
+                self.publish(**{f"player{player_id}_ready": value})
+
+        if out and self.sock is not None:
+            try:
+                self.sock.sendall(out)
+            except Exception as e:
+                self.disconnect(f"Erreur d'envoi: {e}")
+
+
+def run_daemon(state_name, ring_name, servers, snapshot_rate, snapshot_on_change, drain=DRAIN_SNAPSHOTS):
+    """Point d'entrée du processus réseau"""
+    state = SharedState(state_name)
+    ring = InputRing(ring_name)
+    try:
+        NetworkDaemon(state, ring, servers, snapshot_rate, snapshot_on_change, drain).run()
+    finally:
+        state.close()
+        ring.close()
+
+
+class NetworkLink:
+    """Côté rendu : lance le démon réseau et lit l'état partagé
+
+    La découverte et la connexion ont lieu dans le démon : l'interface
+    s'affiche immédiatement pendant la recherche du serveur.
+    """
+
+    def __init__(self, servers, snapshot_rate=0, snapshot_on_change=0, drain=DRAIN_SNAPSHOTS):
+        self.state = SharedState(create=True)
+        self.ring = InputRing(create=True)
+        self.process = multiprocessing.Process(
+            target=run_daemon,
+            args=(self.state.name, self.ring.name, servers, snapshot_rate, snapshot_on_change, drain),
+            name="pong-network",
+            daemon=True,
+        )
+        self.process.start()
+
+    @property
+    def name(self):
+        """Nom du bloc d'état, pour s'y attacher depuis un autre processus"""
+        return self.state.name
+
+    def read(self):
+        """Retourne (version, SharedRecord) du dernier état publié"""
+        return self.state.read()
+
+    def send_move(self, direction, seq):
+        return self.ring.push(INPUT_MOVE, direction, seq)
+
+    def send_ready(self, is_ready):
+        return self.ring.push(INPUT_READY, 1 if is_ready else 0)
+
+    def close(self):
+        """Arrête le démon et libère la mémoire partagée"""
+        self.ring.push(INPUT_QUIT)
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.state.close(unlink=True)
+        self.ring.close(unlink=True)
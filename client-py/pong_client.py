@@ -1,16 +1,28 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import socket
+import os
 import pygame
 import sys
-import struct
-import threading
 import time
 
-# Configuration
-SERVER_HOST = "127.0.0.1"
-SERVER_PORT = 9090
+from discovery import parse_servers
+from net_daemon import LINK_CONNECTED, LINK_CONNECTING, NetworkLink
+from game_config import TICK_RATE
+from prediction import PaddlePredictor
+
+# Configuration : serveurs candidats (variable PONG_SERVERS, voir discovery.py)
+SERVERS = parse_servers()
+
+# Abonnement aux états de jeu (rendu pygame à 60 FPS : un état à chaque tick du serveur)
+SNAPSHOT_RATE = 0  # Hz, 0 pour chaque tick du serveur
+SNAPSHOT_ON_CHANGE = 0  # 1 pour ne recevoir que les états modifiés
+
+# Dossier d'enregistrement des parties (désactivé si vide, voir recorder.py)
+RECORD_DIR = os.environ.get("PONG_RECORD_DIR", "")
+
+# Intervalle entre deux entrées : une par tick de simulation du serveur
+INPUT_INTERVAL = 1.0 / TICK_RATE
 
 # Constantes du jeu
 SCREEN_WIDTH = 800
@@ -25,12 +37,6 @@ GREEN = (0, 255, 0)
 YELLOW = (255, 255, 0)
 GRAY = (128, 128, 128)
 
-# Types de messages (doivent correspondre à ceux du serveur)
-MSG_TYPE_GAME_STATE = 1
-MSG_TYPE_PLAYER_JOIN = 2
-MSG_TYPE_PLAYER_MOVE = 3
-MSG_TYPE_PLAYER_READY = 4
-
 class PongClient:
     def __init__(self):
         # Initialisation de pygame
@@ -39,6 +45,7 @@ class PongClient:
         pygame.display.set_caption("Pong Game")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
+        self.small_font = pygame.font.Font(None, 22)
         
         # État du jeu
         self.game_state = {
@@ -50,142 +57,109 @@ class PongClient:
             "player2_score": 0,
         }
         
+        # Prédiction locale de notre raquette
+        self.predictor = PaddlePredictor(SCREEN_HEIGHT // 2 - PADDLE_HEIGHT // 2)
+        self.next_input = 0.0
+        
+        # Enregistrement colonnaire de la partie (optionnel, nécessite numpy)
+        self.recorder = None
+        if RECORD_DIR:
+            from recorder import MatchRecorder
+            self.recorder = MatchRecorder(RECORD_DIR)
+        
         # État du client
         self.player_id = 0
         self.player1_ready = False
         self.player2_ready = False
         self.game_started = False
         self.connected = False
+        self.connecting = True
         self.running = True
+        self.snapshots = 0
+        self.message = ""
         
-        # Connexion au serveur
-        self.connect_to_server()
+        # Statistiques réseau (touche F3)
+        self.show_stats = False
+        self.stats = {"rate": 0.0, "age": 0.0, "skipped": 0}
+        self.stats_window = (time.monotonic(), 0)
         
-        # Démarrer la boucle de réception
-        self.receive_thread = threading.Thread(target=self.receive_loop)
-        self.receive_thread.daemon = True
-        self.receive_thread.start()
+        # Le démon réseau possède le socket et publie l'état en mémoire partagée
+        self.link = NetworkLink(SERVERS, SNAPSHOT_RATE, SNAPSHOT_ON_CHANGE)
+        print(f"État partagé: {self.link.name}")
         
         # Boucle principale du jeu
         self.main_loop()
     
-    def connect_to_server(self):
-        """Établit la connexion avec le serveur"""
-        try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.connect((SERVER_HOST, SERVER_PORT))
-            self.connected = True
-            print(f"Connecté au serveur {SERVER_HOST}:{SERVER_PORT}")
-        except Exception as e:
-            print(f"Erreur de connexion: {e}")
-            self.connected = False
-    
-    def receive_loop(self):
-        """Boucle de réception des messages du serveur"""
-        while self.running and self.connected:
-            try:
-                # Lire l'en-tête (5 octets)
-                header = self.sock.recv(5)
-                if not header or len(header) < 5:
-                    print("Connexion fermée par le serveur")
-                    self.connected = False
-                    break
-                
-                # Analyser l'en-tête
-                msg_type = header[0]
-                msg_length = struct.unpack(">I", header[1:5])[0]
-                
-                # Lire le contenu du message
-                payload = self.sock.recv(msg_length)
-                if len(payload) < msg_length:
-                    print("Message incomplet reçu")
-                    continue
-                
-                # Traiter le message selon son type
-                if msg_type == MSG_TYPE_GAME_STATE:
-                    self.handle_game_state(payload)
-                elif msg_type == MSG_TYPE_PLAYER_JOIN:
-                    self.handle_player_join(payload)
-                elif msg_type == MSG_TYPE_PLAYER_READY:
-                    self.handle_player_ready(payload)
-            
-            except Exception as e:
-                print(f"Erreur dans la boucle de réception: {e}")
-                self.connected = False
-                break
-    
-    def handle_game_state(self, payload):
-        """Traite un message d'état du jeu"""
-        if len(payload) >= 18:
-            self.game_state["player1_y"] = struct.unpack(">f", payload[0:4])[0]
-            self.game_state["player2_y"] = struct.unpack(">f", payload[4:8])[0]
-            self.game_state["ball_x"] = struct.unpack(">f", payload[8:12])[0]
-            self.game_state["ball_y"] = struct.unpack(">f", payload[12:16])[0]
-            self.game_state["player1_score"] = payload[16]
-            self.game_state["player2_score"] = payload[17]
-            
-            # Si les deux joueurs sont prêts, le jeu est considéré comme démarré
-            if self.player1_ready and self.player2_ready:
-                self.game_started = True
-    
-    def handle_player_join(self, payload):
-        """Traite un message d'attribution d'ID de joueur"""
-        if len(payload) >= 1:
-            self.player_id = payload[0]
-            print(f"Vous êtes le joueur {self.player_id}")
+    def poll_network(self):
+        """Lit le dernier état publié par le démon réseau"""
+        _, record = self.link.read()
+        if record is None:
+            return
+        
+        self.player_id = record.player_id
+        self.player1_ready = record.player1_ready == 1
+        self.player2_ready = record.player2_ready == 1
+        self.connected = record.link == LINK_CONNECTED
+        self.connecting = record.link == LINK_CONNECTING
+        self.message = record.message
+        
+        if record.snapshots != self.snapshots:
+            self.snapshots = record.snapshots
+            self.handle_game_state(record)
+        
+        # Statistiques sur une fenêtre glissante d'une seconde
+        now = time.monotonic()
+        if record.received_at > 0:
+            self.stats["age"] = now - record.received_at
+        window_start, window_snapshots = self.stats_window
+        if now - window_start >= 1.0:
+            self.stats["rate"] = (record.snapshots - window_snapshots) / (now - window_start)
+            self.stats_window = (now, record.snapshots)
+        self.stats["skipped"] = record.skipped
     
-    def handle_player_ready(self, payload):
-        """Traite un message d'état de préparation d'un joueur"""
-        if len(payload) >= 2:
-            player_id = payload[0]
-            is_ready = payload[1] == 1
-            
-            if player_id == 1:
-                self.player1_ready = is_ready
-                print(f"Joueur 1 est {'prêt' if is_ready else 'pas prêt'}")
-            elif player_id == 2:
-                self.player2_ready = is_ready
-                print(f"Joueur 2 est {'prêt' if is_ready else 'pas prêt'}")
+    def handle_game_state(self, state):
+        """Traite un nouvel état du jeu"""
+        self.game_state["ball_x"] = state.ball_x
+        self.game_state["ball_y"] = state.ball_y
+        self.game_state["player1_y"] = state.player1_y
+        self.game_state["player2_y"] = state.player2_y
+        self.game_state["player1_score"] = state.player1_score
+        self.game_state["player2_score"] = state.player2_score
+        
+        if self.recorder is not None and state.is_running:
+            self.recorder.append(state, t=state.received_at)
+        
+        # Réconcilier la prédiction avec la position acquittée par le serveur
+        if self.player_id == 1:
+            self.predictor.reconcile(state.player1_y, state.player1_seq, state.tick)
+        elif self.player_id == 2:
+            self.predictor.reconcile(state.player2_y, state.player2_seq, state.tick)
+        
+        # Si les deux joueurs sont prêts, le jeu est considéré comme démarré
+        if self.player1_ready and self.player2_ready:
+            self.game_started = True
     
     def send_player_move(self, direction):
-        """Envoie un message de mouvement du joueur"""
+        """Transmet un mouvement du joueur au démon réseau"""
         if not self.connected or self.player_id == 0:
             return
         
-        try:
-            # Créer le message
-            payload = struct.pack(">Bb", self.player_id, direction)
-            
-            # Ajouter l'en-tête
-            header = struct.pack(">BI", MSG_TYPE_PLAYER_MOVE, len(payload))
-            
-            # Envoyer le message complet
-            self.sock.sendall(header + payload)
-        except Exception as e:
-            print(f"Erreur d'envoi de mouvement: {e}")
+        # Appliquer le mouvement localement sans attendre le serveur
+        seq = self.predictor.apply_input(direction)
+        self.link.send_move(direction, seq)
     
     def send_player_ready(self, is_ready):
-        """Envoie un message d'état de préparation du joueur"""
+        """Transmet l'état de préparation du joueur au démon réseau"""
         if not self.connected or self.player_id == 0:
             return
         
-        try:
-            # Créer le message
-            payload = struct.pack(">BB", self.player_id, 1 if is_ready else 0)
-            
-            # Ajouter l'en-tête
-            header = struct.pack(">BI", MSG_TYPE_PLAYER_READY, len(payload))
-            
-            # Envoyer le message complet
-            self.sock.sendall(header + payload)
-            
-            # Mettre à jour l'état local
-            if self.player_id == 1:
-                self.player1_ready = is_ready
-            elif self.player_id == 2:
-                self.player2_ready = is_ready
-        except Exception as e:
-            print(f"Erreur d'envoi d'état de préparation: {e}")
+        self.link.send_ready(is_ready)
+        
+        # Mettre à jour l'état local
+        if self.player_id == 1:
+            self.player1_ready = is_ready
+        elif self.player_id == 2:
+            self.player2_ready = is_ready
     
     def render_waiting_screen(self):
         """Affiche l'écran d'attente"""
@@ -196,9 +170,12 @@ class PongClient:
         if self.player_id > 0:
             player_text = self.font.render(f"Vous êtes le Joueur {self.player_id}", True, YELLOW)
             self.screen.blit(player_text, (SCREEN_WIDTH // 2 - player_text.get_width() // 2, 100))
-        else:
+        elif self.connected or self.connecting:
             connecting_text = self.font.render("Connexion au serveur...", True, WHITE)
             self.screen.blit(connecting_text, (SCREEN_WIDTH // 2 - connecting_text.get_width() // 2, 100))
+        else:
+            error_text = self.font.render(self.message, True, RED)
+            self.screen.blit(error_text, (SCREEN_WIDTH // 2 - error_text.get_width() // 2, 100))
         
         # Afficher l'état des joueurs
         p1_status = "Prêt" if self.player1_ready else "En attente"
@@ -227,14 +204,16 @@ class PongClient:
         for y in range(0, SCREEN_HEIGHT, 20):
             pygame.draw.rect(self.screen, WHITE, (SCREEN_WIDTH // 2 - 1, y, 2, 10))
         
-        # Raquettes
+        # Raquettes (la nôtre à sa position prédite)
+        player1_y = self.predictor.position if self.player_id == 1 else self.game_state["player1_y"]
+        player2_y = self.predictor.position if self.player_id == 2 else self.game_state["player2_y"]
         pygame.draw.rect(
             self.screen, WHITE,
-            (0, self.game_state["player1_y"], PADDLE_WIDTH, PADDLE_HEIGHT)
+            (0, player1_y, PADDLE_WIDTH, PADDLE_HEIGHT)
         )
         pygame.draw.rect(
             self.screen, WHITE,
-            (SCREEN_WIDTH - PADDLE_WIDTH, self.game_state["player2_y"], PADDLE_WIDTH, PADDLE_HEIGHT)
+            (SCREEN_WIDTH - PADDLE_WIDTH, player2_y, PADDLE_WIDTH, PADDLE_HEIGHT)
         )
         
         # Balle
@@ -250,11 +229,27 @@ class PongClient:
         )
         self.screen.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 20))
     
+    def render_stats(self):
+        """Affiche les statistiques réseau du démon"""
+        lines = [
+            f"États: {self.stats['rate']:.0f}/s",
+            f"Âge du dernier état: {1000 * self.stats['age']:.0f} ms",
+            f"États sautés: {self.stats['skipped']}",
+            f"Entrées non acquittées: {len(self.predictor.pending)}",
+            f"Image: {self.clock.get_fps():.0f} FPS",
+        ]
+        for i, line in enumerate(lines):
+            text = self.small_font.render(line, True, GRAY)
+            self.screen.blit(text, (10, SCREEN_HEIGHT - 20 * (len(lines) - i) - 5))
+    
     def main_loop(self):
         """Boucle principale du jeu"""
         ready_toggle = False  # Pour éviter les changements rapides d'état
         
         while self.running:
+            # Lire le dernier état publié par le démon réseau
+            self.poll_network()
+            
             # Gestion des événements
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -263,6 +258,10 @@ class PongClient:
                     if event.key == pygame.K_ESCAPE:
                         self.running = False
                     
+                    # Afficher ou masquer les statistiques réseau
+                    if event.key == pygame.K_F3:
+                        self.show_stats = not self.show_stats
+                    
                     # Changer l'état de préparation
                     if event.key == pygame.K_SPACE and not self.game_started and not ready_toggle:
                         if self.player_id == 1:
@@ -276,10 +275,16 @@ class PongClient:
                     if event.key == pygame.K_SPACE:
                         ready_toggle = False
             
-            # Gestion des mouvements (touches maintenues)
+            # Gestion des mouvements (touches maintenues), échantillonnés au
+            # rythme de la simulation quelle que soit la fréquence d'affichage
             keys = pygame.key.get_pressed()
+            now = time.monotonic()
+            # (demi-intervalle de tolérance pour absorber la gigue de l'horloge)
+            input_due = now >= self.next_input - INPUT_INTERVAL / 2
+            if input_due:
+                self.next_input = max(self.next_input + INPUT_INTERVAL, now)
             
-            if self.connected and (self.game_started or (self.player_id == 1 and self.player1_ready) or (self.player_id == 2 and self.player2_ready)):
+            if input_due and self.connected and (self.game_started or (self.player_id == 1 and self.player1_ready) or (self.player_id == 2 and self.player2_ready)):
                 if keys[pygame.K_UP]:
                     self.send_player_move(-1)  # Vers le haut
                 elif keys[pygame.K_DOWN]:
@@ -292,14 +297,17 @@ class PongClient:
                 self.render_waiting_screen()
             else:
                 self.render_game()
+            if self.show_stats:
+                self.render_stats()
             
             # Mise à jour de l'écran
             pygame.display.flip()
             self.clock.tick(60)  # 60 FPS
         
         # Nettoyage
-        if self.connected:
-            self.sock.close()
+        self.link.close()
+        if self.recorder is not None:
+            self.recorder.close()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+# Code généré par protocol/generate.py à partir de protocol/schema.json. NE PAS MODIFIER.
+
+"""Codec binaire du protocole Pong (structures struct précompilées)"""
+
+import struct
+from collections import namedtuple
+
+# En-tête de chaque message : type (1 octet) puis longueur du corps (uint32, big-endian)
+HEADER = struct.Struct(">BI")
+HEADER_SIZE = HEADER.size
+
+# Types de messages
+MSG_TYPE_GAME_STATE = 1
+MSG_TYPE_PLAYER_MOVE = 2
+MSG_TYPE_PLAYER_JOIN = 3
+MSG_TYPE_PLAYER_READY = 4
+MSG_TYPE_SUBSCRIBE = 5
+MSG_TYPE_DISCOVERY_PING = 6
+MSG_TYPE_DISCOVERY_PONG = 7
+
+
+# GameState: État complet du jeu envoyé par le serveur
+# - ball_x (f32): Position X de la balle
+# - ball_y (f32): Position Y de la balle
+# - player1_y (f32): Position Y du joueur 1
+# - player1_score (u16): Score du joueur 1
+# - player2_y (f32): Position Y du joueur 2
+# - player2_score (u16): Score du joueur 2
+# - is_running (u8): 1 si le jeu est en cours, 0 sinon
+# - player1_seq (u32): Dernière séquence d'entrée appliquée pour le joueur 1
+# - player2_seq (u32): Dernière séquence d'entrée appliquée pour le joueur 2
+# - tick (u32): Numéro du tick de simulation de cet état
+GameState = namedtuple("GameState", ['ball_x', 'ball_y', 'player1_y', 'player1_score', 'player2_y', 'player2_score', 'is_running', 'player1_seq', 'player2_seq', 'tick'])
+GAME_STATE = struct.Struct(">fffHfHBIII")
+GAME_STATE_SIZE = 33
+_GAME_STATE_MESSAGE = struct.Struct(">BIfffHfHBIII")
+_unpack_game_state = GAME_STATE.unpack_from
+_pack_game_state = _GAME_STATE_MESSAGE.pack
+
+
+def encode_game_state(ball_x, ball_y, player1_y, player1_score, player2_y, player2_score, is_running, player1_seq, player2_seq, tick):
+    """Encode un message GameState complet (en-tête inclus)"""
+    return _pack_game_state(MSG_TYPE_GAME_STATE, GAME_STATE_SIZE, ball_x, ball_y, player1_y, player1_score, player2_y, player2_score, is_running, player1_seq, player2_seq, tick)
+
+
+def decode_game_state(payload, offset=0):
+    """Décode le corps d'un message GameState (lève struct.error si incomplet)"""
+    return GameState._make(_unpack_game_state(payload, offset))
+
+
+# PlayerMove: Mouvement du joueur envoyé par le client
+# - player_id (u8): ID du joueur (1 ou 2)
+# - direction (i8): Direction (1 pour bas, -1 pour haut, 0 pour arrêt)
+# - seq (u32): Numéro de séquence de l'entrée
+# - view_tick (u32): Tick du dernier état affiché par le client lors de l'entrée
+PlayerMove = namedtuple("PlayerMove", ['player_id', 'direction', 'seq', 'view_tick'])
+PLAYER_MOVE = struct.Struct(">BbII")
+PLAYER_MOVE_SIZE = 10
+_PLAYER_MOVE_MESSAGE = struct.Struct(">BIBbII")
+_unpack_player_move = PLAYER_MOVE.unpack_from
+_pack_player_move = _PLAYER_MOVE_MESSAGE.pack
+
+
+def encode_player_move(player_id, direction, seq, view_tick):
+    """Encode un message PlayerMove complet (en-tête inclus)"""
+    return _pack_player_move(MSG_TYPE_PLAYER_MOVE, PLAYER_MOVE_SIZE, player_id, direction, seq, view_tick)
+
+
+def decode_player_move(payload, offset=0):
+    """Décode le corps d'un message PlayerMove (lève struct.error si incomplet)"""
+    return PlayerMove._make(_unpack_player_move(payload, offset))
+
+
+# PlayerJoin: Attribution d'un ID de joueur
+# - player_id (u8): ID du joueur (1 ou 2)
+PlayerJoin = namedtuple("PlayerJoin", ['player_id'])
+PLAYER_JOIN = struct.Struct(">B")
+PLAYER_JOIN_SIZE = 1
+_PLAYER_JOIN_MESSAGE = struct.Struct(">BIB")
+_unpack_player_join = PLAYER_JOIN.unpack_from
+_pack_player_join = _PLAYER_JOIN_MESSAGE.pack
+
+
+def encode_player_join(player_id):
+    """Encode un message PlayerJoin complet (en-tête inclus)"""
+    return _pack_player_join(MSG_TYPE_PLAYER_JOIN, PLAYER_JOIN_SIZE, player_id)
+
+
+def decode_player_join(payload, offset=0):
+    """Décode le corps d'un message PlayerJoin (lève struct.error si incomplet)"""
+    return PlayerJoin._make(_unpack_player_join(payload, offset))
+
+
+# PlayerReady: État de préparation d'un joueur
+# - player_id (u8): ID du joueur (1 ou 2)
+# - ready (u8): 1 si prêt, 0 sinon
+PlayerReady = namedtuple("PlayerReady", ['player_id', 'ready'])
+PLAYER_READY = struct.Struct(">BB")
+PLAYER_READY_SIZE = 2
+_PLAYER_READY_MESSAGE = struct.Struct(">BIBB")
+_unpack_player_ready = PLAYER_READY.unpack_from
+_pack_player_ready = _PLAYER_READY_MESSAGE.pack
+
+
+def encode_player_ready(player_id, ready):
+    """Encode un message PlayerReady complet (en-tête inclus)"""
+    return _pack_player_ready(MSG_TYPE_PLAYER_READY, PLAYER_READY_SIZE, player_id, ready)
+
+
+def decode_player_ready(payload, offset=0):
+    """Décode le corps d'un message PlayerReady (lève struct.error si incomplet)"""
+    return PlayerReady._make(_unpack_player_ready(payload, offset))
+
+
+# Subscribe: Fréquence des états de jeu demandée par le client
+# - rate_hz (u8): Fréquence maximale en Hz (0 pour chaque tick du serveur)
+# - on_change (u8): 1 pour ne recevoir que les états modifiés, 0 sinon
+Subscribe = namedtuple("Subscribe", ['rate_hz', 'on_change'])
+SUBSCRIBE = struct.Struct(">BB")
+SUBSCRIBE_SIZE = 2
+_SUBSCRIBE_MESSAGE = struct.Struct(">BIBB")
+_unpack_subscribe = SUBSCRIBE.unpack_from
+_pack_subscribe = _SUBSCRIBE_MESSAGE.pack
+
+
+def encode_subscribe(rate_hz, on_change):
+    """Encode un message Subscribe complet (en-tête inclus)"""
+    return _pack_subscribe(MSG_TYPE_SUBSCRIBE, SUBSCRIBE_SIZE, rate_hz, on_change)
+
+
+def decode_subscribe(payload, offset=0):
+    """Décode le corps d'un message Subscribe (lève struct.error si incomplet)"""
+    return Subscribe._make(_unpack_subscribe(payload, offset))
+
+
+# DiscoveryPing: Requête de découverte envoyée en UDP par un client
+# - nonce (u32): Identifiant de la requête, renvoyé dans la réponse
+DiscoveryPing = namedtuple("DiscoveryPing", ['nonce'])
+DISCOVERY_PING = struct.Struct(">I")
+DISCOVERY_PING_SIZE = 4
+_DISCOVERY_PING_MESSAGE = struct.Struct(">BII")
+_unpack_discovery_ping = DISCOVERY_PING.unpack_from
+_pack_discovery_ping = _DISCOVERY_PING_MESSAGE.pack
+
+
+def encode_discovery_ping(nonce):
+    """Encode un message DiscoveryPing complet (en-tête inclus)"""
+    return _pack_discovery_ping(MSG_TYPE_DISCOVERY_PING, DISCOVERY_PING_SIZE, nonce)
+
+
+def decode_discovery_ping(payload, offset=0):
+    """Décode le corps d'un message DiscoveryPing (lève struct.error si incomplet)"""
+    return DiscoveryPing._make(_unpack_discovery_ping(payload, offset))
+
+
+# DiscoveryPong: Réponse du serveur à une requête de découverte
+# - nonce (u32): Identifiant de la requête
+# - port (u16): Port TCP du serveur de jeu
+# - players (u8): Nombre de joueurs connectés
+# - free_slots (u8): Nombre de places libres
+DiscoveryPong = namedtuple("DiscoveryPong", ['nonce', 'port', 'players', 'free_slots'])
+DISCOVERY_PONG = struct.Struct(">IHBB")
+DISCOVERY_PONG_SIZE = 8
+_DISCOVERY_PONG_MESSAGE = struct.Struct(">BIIHBB")
+_unpack_discovery_pong = DISCOVERY_PONG.unpack_from
+_pack_discovery_pong = _DISCOVERY_PONG_MESSAGE.pack
+
+
+def encode_discovery_pong(nonce, port, players, free_slots):
+    """Encode un message DiscoveryPong complet (en-tête inclus)"""
+    return _pack_discovery_pong(MSG_TYPE_DISCOVERY_PONG, DISCOVERY_PONG_SIZE, nonce, port, players, free_slots)
+
+
+def decode_discovery_pong(payload, offset=0):
+    """Décode le corps d'un message DiscoveryPong (lève struct.error si incomplet)"""
+    return DiscoveryPong._make(_unpack_discovery_pong(payload, offset))
+
+
+# Taille du corps attendue pour chaque type de message
+MESSAGE_SIZES = {
+    MSG_TYPE_GAME_STATE: GAME_STATE_SIZE,
+    MSG_TYPE_PLAYER_MOVE: PLAYER_MOVE_SIZE,
+    MSG_TYPE_PLAYER_JOIN: PLAYER_JOIN_SIZE,
+    MSG_TYPE_PLAYER_READY: PLAYER_READY_SIZE,
+    MSG_TYPE_SUBSCRIBE: SUBSCRIBE_SIZE,
+    MSG_TYPE_DISCOVERY_PING: DISCOVERY_PING_SIZE,
+    MSG_TYPE_DISCOVERY_PONG: DISCOVERY_PONG_SIZE,
+}
+
+# Décodeur associé à chaque type de message
+DECODERS = {
+    MSG_TYPE_GAME_STATE: decode_game_state,
+    MSG_TYPE_PLAYER_MOVE: decode_player_move,
+    MSG_TYPE_PLAYER_JOIN: decode_player_join,
+    MSG_TYPE_PLAYER_READY: decode_player_ready,
+    MSG_TYPE_SUBSCRIBE: decode_subscribe,
+    MSG_TYPE_DISCOVERY_PING: decode_discovery_ping,
+    MSG_TYPE_DISCOVERY_PONG: decode_discovery_pong,
+}
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Prédiction locale de la raquette avec réconciliation serveur.
+
+Les règles de déplacement reproduisent celles de Player.applyInput côté
+serveur (server-tcp/pkg/game/game.go) : même vitesse et mêmes limites.
+Le serveur applique à chaque tick la dernière entrée reçue, jusqu'à la
+suivante ; le prédicteur rejoue donc les entrées tick par tick sur
+l'horloge locale plutôt qu'un pas par entrée.
+"""
+
+import threading
+import time
+from collections import deque
+
+from game_config import GAME_HEIGHT, PADDLE_HEIGHT, PADDLE_SPEED, TICK_RATE
+
+# Déplacement d'une raquette pendant un tick (px)
+PADDLE_STEP = PADDLE_SPEED / TICK_RATE
+
+
+def move_paddle(position, direction, ticks=1):
+    """Applique `ticks` ticks de mouvement comme Player.applyInput"""
+    new_position = position + direction * PADDLE_STEP * ticks
+
+    # Garder la raquette dans les limites du jeu
+    if new_position < 0:
+        new_position = 0.0
+    elif new_position > GAME_HEIGHT - PADDLE_HEIGHT:
+        new_position = float(GAME_HEIGHT - PADDLE_HEIGHT)
+
+    return new_position
+
+
+def local_ticks():
+    """Horloge locale en ticks"""
+    return time.monotonic() * TICK_RATE
+
+
+class PaddlePredictor:
+    """Position prédite de la raquette locale
+
+    Chaque entrée reçoit un numéro de séquence et le tick local de son
+    envoi ; elle déplace la raquette à chaque tick jusqu'à l'entrée
+    suivante, comme sur le serveur. À chaque état reçu, la position
+    serveur remplace la prédiction : les ticks que le serveur a déjà
+    simulés depuis la première application de l'entrée acquittée sont
+    sautés, les suivants sont rejoués. Une entrée tenue pendant un blocage
+    de l'envoi ou des entrées arrivées groupées ne décalent donc pas la
+    prédiction au-delà de ce que le serveur a réellement appliqué.
+    """
+
+    def __init__(self, position, clock=local_ticks):
+        self.base = float(position)  # Dernière position serveur
+        self.clock = clock
+        self.pending = deque()  # (séquence, direction, tick local) non acquittées
+        self.acked = None  # (séquence, direction, tick local, premier tick serveur l'appliquant)
+        self.server_tick = 0
+        self.next_seq = 1
+        self.lock = threading.Lock()
+
+    @property
+    def position(self):
+        with self.lock:
+            return self._replay(self.clock())
+
+    def apply_input(self, direction):
+        """Applique une entrée localement et retourne sa séquence"""
+        with self.lock:
+            seq = self.next_seq
+            self.next_seq += 1
+            self.pending.append((seq, direction, self.clock()))
+            return seq
+
+    def reconcile(self, server_position, last_seq, tick):
+        """Repart de la position serveur au tick `tick` et rejoue les ticks suivants"""
+        with self.lock:
+            if self.acked is None or self.acked[0] != last_seq:
+                # Premier état acquittant cette entrée : le serveur l'applique
+                # depuis ce tick (les entrées arrivées groupées avant elle
+                # n'ont jamais été appliquées)
+                acked = None
+                while self.pending and self.pending[0][0] <= last_seq:
+                    acked = self.pending.popleft()
+                self.acked = acked + (tick,) if acked is not None and acked[0] == last_seq else None
+
+            self.base = float(server_position)
+            self.server_tick = tick
+
+    def _replay(self, now):
+        """Rejoue les ticks locaux que le serveur n'a pas encore simulés"""
+        entries = list(self.pending)
+        skip = 0
+        if self.acked is not None:
+            seq, direction, sent, first_tick = self.acked
+            entries.insert(0, (seq, direction, sent))
+            skip = self.server_tick - first_tick + 1
+
+        position = self.base
+        for i, (_, direction, sent) in enumerate(entries):
+            end = entries[i + 1][2] if i + 1 < len(entries) else now
+            ticks = max(1, round(end - sent))
+            ticks, skip = max(0, ticks - skip), max(0, skip - ticks)
+            position = move_paddle(position, direction, ticks)
+        return position
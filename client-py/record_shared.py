@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Enregistre une partie en lisant l'état partagé d'un client en cours.
+
+Le client pygame affiche au démarrage le nom de son bloc d'état partagé ;
+ce script s'y attache sans ouvrir de connexion supplémentaire au serveur.
+
+Usage:
+    python record_shared.py <nom_du_bloc> <dossier>
+"""
+
+import sys
+import time
+
+from net_daemon import LINK_DISCONNECTED, SharedState
+from recorder import MatchRecorder
+
+POLL_INTERVAL = 0.001
+
+
+def record(name, directory):
+    state = SharedState(name, track=False)
+    recorder = MatchRecorder(directory)
+    snapshots = 0
+    try:
+        while True:
+            _, record = state.read()
+            if record is not None:
+                if record.snapshots != snapshots:
+                    snapshots = record.snapshots
+                    if record.is_running:
+                        recorder.append(record, t=record.received_at)
+                if record.link == LINK_DISCONNECTED:
+                    break
+            time.sleep(POLL_INTERVAL)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        state.close()
+    return recorder.close()
+
+
+def main(argv):
+    if len(argv) != 2:
+        print(__doc__.strip().splitlines()[-1].strip())
+        return 1
+
+    path = record(argv[0], argv[1])
+    print(f"Partie enregistrée: {path}" if path else "Aucun état enregistré")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
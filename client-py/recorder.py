@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Enregistrement colonnaire des parties.
+
+Chaque partie est écrite dans un fichier unique ``<match_id>.pongrec`` :
+un en-tête de 64 octets suivi de chaque colonne stockée de façon contiguë
+et alignée sur 64 octets, ce qui permet de les projeter directement en
+mémoire avec ``numpy.memmap``. Un index ``index.jsonl`` (une ligne par
+partie) accompagne les fichiers.
+
+Les colonnes sont préallouées pour ``capacity`` lignes ; les états sont
+écrits par blocs de ``CHUNK_ROWS`` lignes puis le nombre de lignes de
+l'en-tête est mis à jour. Après un arrêt brutal, le fichier reste lisible
+et ne perd que le dernier bloc incomplet.
+"""
+
+import json
+import os
+import time
+import uuid
+
+import numpy as np
+
+# Colonnes enregistrées pour chaque état reçu : (nom, dtype)
+COLUMNS = (
+    ("t", "<f8"),              # Instant de réception (secondes, horloge monotone)
+    ("tick", "<u4"),           # Tick de simulation du serveur
+    ("ball_x", "<f4"),
+    ("ball_y", "<f4"),
+    ("player1_y", "<f4"),
+    ("player2_y", "<f4"),
+    ("player1_score", "<u2"),
+    ("player2_score", "<u2"),
+)
+
+# En-tête : MAGIC puis lignes écrites, nombre de colonnes et capacité (<u8)
+MAGIC = b"PONGREC2"
+HEADER_SIZE = 64
+ALIGN = 64
+INDEX_NAME = "index.jsonl"
+EXTENSION = ".pongrec"
+
+CHUNK_ROWS = 256         # Lignes par écriture (environ 4 s à 60 Hz)
+INITIAL_CAPACITY = 8192  # Lignes préallouées (environ 2 min à 60 Hz)
+
+
+def column_offsets(capacity):
+    """Calcule l'offset de chaque colonne dans un fichier de `capacity` lignes"""
+    offsets = {}
+    offset = HEADER_SIZE
+    for name, dtype in COLUMNS:
+        offsets[name] = offset
+        size = capacity * np.dtype(dtype).itemsize
+        offset += (size + ALIGN - 1) // ALIGN * ALIGN
+    return offsets, offset
+
+
+def encode_header(rows, capacity):
+    header = MAGIC + np.array([rows, len(COLUMNS), capacity], dtype="<u8").tobytes()
+    return header.ljust(HEADER_SIZE, b"\0")
+
+
+class MatchRecorder:
+    """Écrit les états d'une partie en colonnes, par blocs de taille fixe"""
+
+    def __init__(self, directory, match_id=None, chunk_rows=CHUNK_ROWS, capacity=INITIAL_CAPACITY):
+        self.directory = directory
+        self.match_id = match_id or time.strftime("%Y%m%d-%H%M%S-") + uuid.uuid4().hex[:8]
+        self.path = os.path.join(directory, self.match_id + EXTENSION)
+        self.started = time.time()
+        self.rows = 0      # Lignes écrites dans le fichier
+        self.pending = 0   # Lignes en attente dans le bloc courant
+        self.first_t = None
+        self.last = None   # Dernière ligne écrite
+        self.chunk = {name: np.empty(chunk_rows, dtype=dtype) for name, dtype in COLUMNS}
+        os.makedirs(directory, exist_ok=True)
+        self.capacity = 0
+        self.file = None
+        self._resize(capacity)
+
+    def append(self, state, t=None):
+        """Ajoute un état décodé (pong_protocol.GameState ou SharedRecord)"""
+        row = self.pending
+        chunk = self.chunk
+        chunk["t"][row] = time.monotonic() if t is None else t
+        chunk["tick"][row] = state.tick
+        chunk["ball_x"][row] = state.ball_x
+        chunk["ball_y"][row] = state.ball_y
+        chunk["player1_y"][row] = state.player1_y
+        chunk["player2_y"][row] = state.player2_y
+        chunk["player1_score"][row] = state.player1_score
+        chunk["player2_score"][row] = state.player2_score
+        if self.first_t is None:
+            self.first_t = float(chunk["t"][row])
+        self.pending = row + 1
+
+        if self.pending == len(chunk["t"]):
+            self.flush()
+
+    def flush(self):
+        """Écrit le bloc courant puis le nouveau nombre de lignes"""
+        if self.pending == 0:
+            return
+        if self.rows + self.pending > self.capacity:
+            capacity = self.capacity
+            while self.rows + self.pending > capacity:
+                capacity *= 2
+            self._resize(capacity)
+
+        offsets, _ = column_offsets(self.capacity)
+        f = self.file
+        for name, dtype in COLUMNS:
+            f.seek(offsets[name] + self.rows * np.dtype(dtype).itemsize)
+            f.write(self.chunk[name][:self.pending].tobytes())
+
+        # L'en-tête n'est mis à jour qu'après les données
+        self.last = {name: self.chunk[name][self.pending - 1].item() for name, _ in COLUMNS}
+        self.rows += self.pending
+        self.pending = 0
+        f.seek(0)
+        f.write(encode_header(self.rows, self.capacity))
+        f.flush()
+
+    def _resize(self, capacity):
+        """Recopie les lignes écrites dans un fichier de `capacity` lignes"""
+        offsets, total = column_offsets(capacity)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(encode_header(self.rows, capacity))
+            if self.file is not None:
+                old_offsets, _ = column_offsets(self.capacity)
+                for name, dtype in COLUMNS:
+                    self.file.seek(old_offsets[name])
+                    data = self.file.read(self.rows * np.dtype(dtype).itemsize)
+                    f.seek(offsets[name])
+                    f.write(data)
+            f.truncate(total)
+
+        if self.file is not None:
+            self.file.close()
+        os.replace(tmp_path, self.path)
+        self.file = open(self.path, "r+b")
+        self.capacity = capacity
+
+    def close(self):
+        """Termine le fichier de la partie et l'ajoute à l'index"""
+        if self.file is None:
+            return None
+
+        self.flush()
+        if self.rows == 0:
+            self.file.close()
+            self.file = None
+            os.remove(self.path)
+            return None
+
+        # Retirer la capacité inutilisée
+        self._resize(self.rows)
+        self.file.close()
+        self.file = None
+
+        entry = {
+            "match_id": self.match_id,
+            "file": os.path.basename(self.path),
+            "rows": self.rows,
+            "started": self.started,
+            "duration": self.last["t"] - self.first_t,
+            "player1_score": self.last["player1_score"],
+            "player2_score": self.last["player2_score"],
+        }
+        with open(os.path.join(self.directory, INDEX_NAME), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+        return self.path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_index(directory):
+    """Lit l'index des parties enregistrées
+
+    Les parties interrompues avant close() n'ont pas de ligne dans l'index :
+    elles sont ajoutées avec leur seul nom de fichier.
+    """
+    path = os.path.join(directory, INDEX_NAME)
+    entries = []
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+
+    indexed = {entry["file"] for entry in entries}
+    for name in sorted(os.listdir(directory)) if os.path.isdir(directory) else []:
+        if name.endswith(EXTENSION) and name not in indexed:
+            entries.append({"match_id": name[:-len(EXTENSION)], "file": name, "interrupted": True})
+    return entries
+
+
+def open_match(path):
+    """Projette les colonnes d'une partie en mémoire (lecture seule)"""
+    with open(path, "rb") as f:
+        header = f.read(HEADER_SIZE)
+    if header[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Fichier d'enregistrement invalide: {path}")
+
+    rows, ncols, capacity = (int(v) for v in np.frombuffer(header, dtype="<u8", count=3, offset=len(MAGIC)))
+    if ncols != len(COLUMNS):
+        raise ValueError(f"Nombre de colonnes inattendu dans {path}: {ncols}")
+
+    offsets, _ = column_offsets(capacity)
+    if rows == 0:
+        return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS}
+    return {
+        name: np.memmap(path, dtype=dtype, mode="r", offset=offsets[name], shape=(rows,))
+        for name, dtype in COLUMNS
+    }
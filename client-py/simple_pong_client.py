@@ -1,22 +1,28 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import socket
-import struct
-import threading
 import time
 import curses
 import sys
 
-# Configuration
-SERVER_HOST = "127.0.0.1"
-SERVER_PORT = 9090
+from discovery import parse_servers
+from game_config import TICK_RATE
+from net_daemon import LINK_CONNECTED, NetworkLink
 
-# Types de messages (doivent correspondre à ceux du serveur)
-MSG_TYPE_GAME_STATE = 1
-MSG_TYPE_PLAYER_JOIN = 2
-MSG_TYPE_PLAYER_MOVE = 3
-MSG_TYPE_PLAYER_READY = 4
+# Configuration : serveurs candidats (variable PONG_SERVERS, voir discovery.py)
+SERVERS = parse_servers()
+
+# Abonnement aux états de jeu (l'écran curses est redessiné toutes les 100 ms)
+SNAPSHOT_RATE = 10  # Hz, 0 pour chaque tick du serveur
+SNAPSHOT_ON_CHANGE = 1  # 1 pour ne recevoir que les états modifiés
+
+# curses ne signale pas le relâchement des touches : l'arrêt est déduit de
+# l'absence de répétition automatique du terminal
+INPUT_TIMEOUT_MS = 10  # Délai d'attente de getch
+DRAW_INTERVAL = 0.1  # Secondes entre deux affichages
+TAP_DURATION = 2 / TICK_RATE  # Mouvement d'un appui isolé (2 ticks)
+REPEAT_GAP = 0.075  # Arrêt si aucune répétition pendant ce délai (répétition à 25-40 Hz)
+REPEAT_DELAY = 0.7  # Au-delà, un nouvel appui n'est plus une répétition
 
 class PongClient:
     def __init__(self):
@@ -32,32 +38,31 @@ class PongClient:
         
         # État du client
         self.player_id = 0
+        self.move_seq = 0
         self.player1_ready = False
         self.player2_ready = False
         self.game_started = False
         self.connected = False
         self.running = True
+        self.snapshots = 0
+        self.link_message = ""
         
-        # Connexion au serveur
-        self.connect_to_server()
-        
-        # Démarrer la boucle de réception
-        self.receive_thread = threading.Thread(target=self.receive_loop)
-        self.receive_thread.daemon = True
-        self.receive_thread.start()
-        
-        # Initialiser curses
+        # Initialiser curses (quitte si le terminal est trop petit), avant de
+        # lancer le démon réseau pour qu'il soit toujours arrêté ci-dessous
         self.setup_curses()
         
         try:
-            # Boucle principale du jeu
-            self.main_loop()
+            # Le démon réseau possède le socket et publie l'état en mémoire partagée
+            self.link = NetworkLink(SERVERS, SNAPSHOT_RATE, SNAPSHOT_ON_CHANGE)
+            try:
+                # Boucle principale du jeu
+                self.main_loop()
+            finally:
+                # Arrêt du démon réseau
+                self.link.close()
         finally:
             # Nettoyage de curses
             curses.endwin()
-            # Fermeture du socket
-            if self.connected:
-                self.sock.close()
     
     def setup_curses(self):
         """Initialise l'interface texte avec curses"""
@@ -65,7 +70,7 @@ class PongClient:
         curses.cbreak()
         curses.noecho()
         self.stdscr.keypad(True)
-        self.stdscr.timeout(100)  # Délai d'attente pour getch en ms
+        self.stdscr.timeout(INPUT_TIMEOUT_MS)  # Délai d'attente pour getch en ms
         curses.curs_set(0)  # Masquer le curseur
         
         # Vérifier la taille du terminal
@@ -75,120 +80,59 @@ class PongClient:
             print("Fenêtre de terminal trop petite. Redimensionnez-la (min 80x24).")
             sys.exit(1)
     
-    def connect_to_server(self):
-        """Établit la connexion avec le serveur"""
-        try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.connect((SERVER_HOST, SERVER_PORT))
-            self.connected = True
-        except Exception as e:
-            self.connected = False
-            self.message = f"Erreur de connexion: {e}"
-    
-    def receive_loop(self):
-        """Boucle de réception des messages du serveur"""
-        while self.running and self.connected:
-            try:
-                # Lire l'en-tête (5 octets)
-                header = self.sock.recv(5)
-                if not header or len(header) < 5:
-                    self.connected = False
-                    self.message = "Connexion fermée par le serveur"
-                    break
-                
-                # Analyser l'en-tête
-                msg_type = header[0]
-                msg_length = struct.unpack(">I", header[1:5])[0]
-                
-                # Lire le contenu du message
-                payload = self.sock.recv(msg_length)
-                if len(payload) < msg_length:
-                    self.message = "Message incomplet reçu"
-                    continue
-                
-                # Traiter le message selon son type
-                if msg_type == MSG_TYPE_GAME_STATE:
-                    self.handle_game_state(payload)
-                elif msg_type == MSG_TYPE_PLAYER_JOIN:
-                    self.handle_player_join(payload)
-                elif msg_type == MSG_TYPE_PLAYER_READY:
-                    self.handle_player_ready(payload)
-            
-            except Exception as e:
-                self.connected = False
-                self.message = f"Erreur dans la boucle de réception: {e}"
-                break
-    
-    def handle_game_state(self, payload):
-        """Traite un message d'état du jeu"""
-        if len(payload) >= 18:
-            self.state["player1_y"] = int(struct.unpack(">f", payload[0:4])[0])
-            self.state["player2_y"] = int(struct.unpack(">f", payload[4:8])[0])
-            self.state["ball_x"] = int(struct.unpack(">f", payload[8:12])[0])
-            self.state["ball_y"] = int(struct.unpack(">f", payload[12:16])[0])
-            self.state["player1_score"] = payload[16]
-            self.state["player2_score"] = payload[17]
-            
-            # Si les deux joueurs sont prêts, le jeu est considéré comme démarré
-            if self.player1_ready and self.player2_ready:
-                self.game_started = True
-    
-    def handle_player_join(self, payload):
-        """Traite un message d'attribution d'ID de joueur"""
-        if len(payload) >= 1:
-            self.player_id = payload[0]
-            self.message = f"Vous êtes le joueur {self.player_id}"
+    def poll_network(self):
+        """Lit le dernier état publié par le démon réseau"""
+        _, record = self.link.read()
+        if record is None:
+            return
+        
+        self.player_id = record.player_id
+        self.player1_ready = record.player1_ready == 1
+        self.player2_ready = record.player2_ready == 1
+        self.connected = record.link == LINK_CONNECTED
+        
+        # Afficher les nouveaux messages du démon
+        if record.message != self.link_message:
+            self.link_message = record.message
+            self.message = record.message
+        
+        if record.snapshots != self.snapshots:
+            self.snapshots = record.snapshots
+            self.handle_game_state(record)
     
-    def handle_player_ready(self, payload):
-        """Traite un message d'état de préparation d'un joueur"""
-        if len(payload) >= 2:
-            player_id = payload[0]
-            is_ready = payload[1] == 1
-            
-            if player_id == 1:
-                self.player1_ready = is_ready
-            elif player_id == 2:
-                self.player2_ready = is_ready
+    def handle_game_state(self, state):
+        """Traite un nouvel état du jeu"""
+        self.state["player1_y"] = int(state.player1_y)
+        self.state["player2_y"] = int(state.player2_y)
+        self.state["ball_x"] = int(state.ball_x)
+        self.state["ball_y"] = int(state.ball_y)
+        self.state["player1_score"] = state.player1_score
+        self.state["player2_score"] = state.player2_score
+        
+        # Si les deux joueurs sont prêts, le jeu est considéré comme démarré
+        if self.player1_ready and self.player2_ready:
+            self.game_started = True
     
     def send_player_move(self, direction):
-        """Envoie un message de mouvement du joueur"""
+        """Transmet un mouvement du joueur au démon réseau"""
         if not self.connected or self.player_id == 0:
             return
         
-        try:
-            # Créer le message
-            payload = struct.pack(">Bb", self.player_id, direction)
-            
-            # Ajouter l'en-tête
-            header = struct.pack(">BI", MSG_TYPE_PLAYER_MOVE, len(payload))
-            
-            # Envoyer le message complet
-            self.sock.sendall(header + payload)
-        except Exception as e:
-            self.message = f"Erreur d'envoi de mouvement: {e}"
+        self.move_seq += 1
+        self.link.send_move(direction, self.move_seq)
     
     def send_player_ready(self, is_ready):
-        """Envoie un message d'état de préparation du joueur"""
+        """Transmet l'état de préparation du joueur au démon réseau"""
         if not self.connected or self.player_id == 0:
             return
         
-        try:
-            # Créer le message
-            payload = struct.pack(">BB", self.player_id, 1 if is_ready else 0)
-            
-            # Ajouter l'en-tête
-            header = struct.pack(">BI", MSG_TYPE_PLAYER_READY, len(payload))
-            
-            # Envoyer le message complet
-            self.sock.sendall(header + payload)
-            
-            # Mettre à jour l'état local
-            if self.player_id == 1:
-                self.player1_ready = is_ready
-            elif self.player_id == 2:
-                self.player2_ready = is_ready
-        except Exception as e:
-            self.message = f"Erreur d'envoi d'état de préparation: {e}"
+        self.link.send_ready(is_ready)
+        
+        # Mettre à jour l'état local
+        if self.player_id == 1:
+            self.player1_ready = is_ready
+        elif self.player_id == 2:
+            self.player2_ready = is_ready
     
     def draw_waiting_screen(self):
         """Affiche l'écran d'attente"""
@@ -286,43 +230,63 @@ class PongClient:
     def main_loop(self):
         """Boucle principale du jeu"""
         last_ready_toggle = time.time() - 1  # Pour éviter les changements rapides d'état
+        last_draw = 0.0
+        direction = 0  # Dernière direction envoyée au serveur
+        held = 0  # Flèche appuyée (répétitions comprises)
+        last_arrow = 0.0  # Instant de la dernière flèche reçue
+        stop_at = 0.0  # Instant où envoyer l'arrêt
         
         while self.running:
-            # Affichage
-            if not self.game_started:
-                self.draw_waiting_screen()
-            else:
-                self.draw_game()
+            # Lire le dernier état publié par le démon réseau
+            self.poll_network()
             
-            # Rafraîchir l'écran
-            self.stdscr.refresh()
+            # Affichage
+            now = time.monotonic()
+            if now - last_draw >= DRAW_INTERVAL:
+                last_draw = now
+                if not self.game_started:
+                    self.draw_waiting_screen()
+                else:
+                    self.draw_game()
+                
+                # Rafraîchir l'écran
+                self.stdscr.refresh()
             
             # Gestion des touches
             try:
                 key = self.stdscr.getch()
+                now = time.monotonic()
                 
                 if key == ord('q') or key == ord('Q'):
                     self.running = False
                 
                 elif key == ord(' '):
                     # Changer l'état de préparation (avec un délai minimum)
-                    now = time.time()
-                    if now - last_ready_toggle > 0.5 and not self.game_started:
+                    if time.time() - last_ready_toggle > 0.5 and not self.game_started:
                         if self.player_id in (1, 2):
                             is_ready = not (self.player1_ready if self.player_id == 1 else self.player2_ready)
                             self.send_player_ready(is_ready)
-                            last_ready_toggle = now
-                
-                elif key == curses.KEY_UP:
-                    self.send_player_move(-1)  # Vers le haut
+                            last_ready_toggle = time.time()
                 
-                elif key == curses.KEY_DOWN:
-                    self.send_player_move(1)   # Vers le bas
+                elif key in (curses.KEY_UP, curses.KEY_DOWN):
+                    pressed = -1 if key == curses.KEY_UP else 1  # -1 vers le haut, 1 vers le bas
+                    if pressed != held or now - last_arrow > REPEAT_DELAY:
+                        # Nouvel appui : déplacement bref, prolongé si la
+                        # répétition automatique suit
+                        held = pressed
+                        stop_at = now + TAP_DURATION
+                    else:
+                        stop_at = now + REPEAT_GAP
+                    last_arrow = now
+                    if direction != pressed:
+                        self.send_player_move(pressed)
+                        direction = pressed
                 
-                elif key == -1:  # Aucune touche pressée
-                    # Si aucune flèche n'est pressée, envoyer un arrêt
-                    if self.connected and self.game_started:
-                        self.send_player_move(0)
+                # Le serveur garde la dernière direction : envoyer un arrêt
+                # dès que la flèche n'est plus répétée
+                if direction != 0 and now >= stop_at and self.connected:
+                    self.send_player_move(0)
+                    direction = 0
             
             except Exception as e:
                 self.message = f"Erreur dans la boucle principale: {e}"
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Classe deux serveurs compilés pour l'occasion, dont un plein.
+
+Le serveur (server-tcp) est compilé avec go dans un dossier temporaire et
+démarré deux fois sur des ports libres ; le test est ignoré si go est
+introuvable.
+
+Usage:
+    python test_discovery.py
+"""
+
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+import unittest
+
+from discovery import connection_order, probe
+from test_move_flood import SERVER_DIR, STARTUP_TIMEOUT, free_port
+
+PLAYERS = 2  # Places d'un serveur
+
+
+def wait_for(port, predicate):
+    """Interroge le serveur jusqu'à ce que sa réponse vérifie `predicate`"""
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        servers = probe([("127.0.0.1", port)], broadcast_port=0)
+        if servers and predicate(servers[0]):
+            return servers[0]
+        time.sleep(0.05)
+    raise TimeoutError(f"serveur {port} : état attendu non atteint")
+
+
+@unittest.skipIf(shutil.which("go") is None, "go introuvable")
+class ConnectionOrderTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        binary = os.path.join(cls.tmp.name, "pongsrv")
+        subprocess.run(["go", "build", "-o", binary, "."], cwd=SERVER_DIR, check=True)
+
+        cls.servers, cls.players = [], []
+        try:
+            cls.full_port, cls.open_port = free_port(), free_port()
+            for port in (cls.full_port, cls.open_port):
+                env = dict(os.environ, PORT=str(port), METRICS_ADDR="")
+                cls.servers.append(subprocess.Popen([binary], env=env, stdout=subprocess.DEVNULL,
+                                                    stderr=subprocess.DEVNULL))
+                wait_for(port, lambda info: True)
+
+            # Occuper toutes les places du premier serveur
+            for _ in range(PLAYERS):
+                cls.players.append(socket.create_connection(("127.0.0.1", cls.full_port)))
+            wait_for(cls.full_port, lambda info: info.free_slots == 0)
+        except BaseException:
+            cls.tearDownClass()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        for sock in cls.players:
+            sock.close()
+        for server in cls.servers:
+            server.terminate()
+            server.wait()
+        cls.tmp.cleanup()
+
+    def test_full_server_is_skipped_by_name(self):
+        # Candidats donnés par nom : le serveur plein ne doit pas revenir
+        # parmi les candidats muets, le serveur libre une seule fois
+        candidates = [("localhost", self.full_port), ("localhost", self.open_port)]
+        order, servers = connection_order(candidates, broadcast_port=0)
+
+        self.assertEqual(order, [("127.0.0.1", self.open_port)])
+        self.assertEqual({(info.port, info.free_slots) for info in servers},
+                         {(self.full_port, 0), (self.open_port, PLAYERS)})
+
+    def test_silent_candidate_is_kept(self):
+        silent = ("localhost", free_port())
+        order, _ = connection_order([silent, ("localhost", self.open_port)], broadcast_port=0)
+        self.assertEqual(order, [("127.0.0.1", self.open_port), silent])
+
+
+if __name__ == "__main__":
+    unittest.main()
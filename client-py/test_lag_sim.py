@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Rejoue dans lag_sim.Game les trajectoires de référence du serveur.
+
+Les états attendus sont produits par server-tcp/pkg/game (voir
+trajectory_test.go) : le portage Python de la physique doit les suivre
+au calcul flottant près (float32 côté serveur, float64 ici).
+
+Usage:
+    python test_lag_sim.py
+"""
+
+import json
+import os
+import random
+import unittest
+
+from lag_sim import Game, miss_rate, play
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TRAJECTORIES_PATH = os.path.join(ROOT, "server-tcp", "pkg", "game", "testdata", "trajectories.json")
+
+# Écart admis entre float32 et float64 (px et px/s)
+TOLERANCE = 0.05
+
+
+def replay(trajectory):
+    """Retourne les états après chaque tick, comme trajectory.run en Go"""
+    game = Game(random.Random(0))
+    game.x, game.y, game.vx, game.vy = trajectory["ball"]
+    game.paddles = list(trajectory["paddles"])
+
+    frames = []
+    while game.tick < trajectory["ticks"]:
+        for entry in trajectory["inputs"]:
+            if entry["tick"] == game.tick + 1:
+                game.set_input(entry["player"] - 1, entry["direction"], entry["seq"], entry["view_tick"])
+        scores = sum(game.scores)
+        game.update()
+
+        scored = sum(game.scores) != scores
+        vx, vy = (0.0, 0.0) if scored else (game.vx, game.vy)
+        frames.append([game.x, game.y, vx, vy, *game.paddles, *game.scores])
+        if scored:
+            break
+    return frames
+
+
+class TrajectoryTest(unittest.TestCase):
+
+    def test_matches_server_physics(self):
+        with open(TRAJECTORIES_PATH, encoding="utf-8") as f:
+            trajectories = json.load(f)
+
+        for trajectory in trajectories:
+            with self.subTest(trajectory["name"]):
+                frames = replay(trajectory)
+                self.assertEqual(len(frames), len(trajectory["frames"]))
+                for tick, (got, want) in enumerate(zip(frames, trajectory["frames"]), start=1):
+                    for a, b in zip(got, want):
+                        self.assertAlmostEqual(a, b, delta=TOLERANCE, msg=f"tick {tick}: {got} != {want}")
+
+
+class CompensationTest(unittest.TestCase):
+
+    def test_no_rewound_hits_without_latency(self):
+        # Sans latence, le joueur ne voit jamais le passage avant la décision
+        game = play(0, 60, 15, seed=1)
+        self.assertEqual(sum(game.rewound_hits), 0)
+        self.assertAlmostEqual(miss_rate(game), miss_rate(play(0, 60, 0, seed=1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
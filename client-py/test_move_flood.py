@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Lance move_flood.py contre un serveur compilé pour l'occasion.
+
+Le serveur (server-tcp) est compilé avec go dans un dossier temporaire et
+démarré sur des ports libres ; le test est ignoré si go est introuvable.
+
+Usage:
+    python test_move_flood.py
+"""
+
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+import unittest
+
+from metrics_scraper import scrape
+from move_flood import check, flood
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVER_DIR = os.path.join(ROOT, "server-tcp")
+
+FLOOD_DURATION = 3.0
+STARTUP_TIMEOUT = 10.0
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@unittest.skipIf(shutil.which("go") is None, "go introuvable")
+class MoveFloodTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        binary = os.path.join(cls.tmp.name, "pongsrv")
+        subprocess.run(["go", "build", "-o", binary, "."], cwd=SERVER_DIR, check=True)
+
+        cls.port = free_port()
+        cls.metrics_url = f"http://127.0.0.1:{free_port()}/metrics"
+        env = dict(os.environ, PORT=str(cls.port), METRICS_ADDR=cls.metrics_url[len("http://"):-len("/metrics")])
+        cls.server = subprocess.Popen([binary], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                scrape(cls.metrics_url)
+                socket.create_connection(("127.0.0.1", cls.port)).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline or cls.server.poll() is not None:
+                    cls.tearDownClass()
+                    raise
+                time.sleep(0.05)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.terminate()
+        cls.server.wait()
+        cls.tmp.cleanup()
+
+    def test_flood_keeps_tick_cadence(self):
+        result = flood("127.0.0.1", self.port, FLOOD_DURATION, self.metrics_url)
+        self.assertGreater(result["states"], 0)
+        self.assertIsNotNone(result["mean_overrun"])
+        self.assertEqual(check(result), [], result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Vérifie l'envoi des entrées par NetworkDaemon en mode vidange.
+
+Le démon se connecte à un serveur TCP local qui ne lit ses messages
+qu'après un délai : les entrées remplissent les tampons du socket et
+sendall doit attendre au lieu de couper la liaison.
+
+Usage:
+    python test_net_daemon.py
+"""
+
+import socket
+import threading
+import time
+import unittest
+from unittest import mock
+
+import net_daemon
+from net_daemon import INPUT_MOVE, RING_SLOTS, InputRing, NetworkDaemon, SharedState
+from pong_protocol import (
+    HEADER_SIZE, PLAYER_MOVE_SIZE, SUBSCRIBE_SIZE, encode_game_state, encode_player_join,
+)
+
+BUFFER_SIZE = 4096  # Tampons réduits des deux côtés de la connexion
+BATCHES = 64  # Lots de RING_SLOTS mouvements, bien au-delà des tampons
+READ_DELAY = 0.3  # Secondes pendant lesquelles le serveur ne lit pas
+
+
+class DrainModeSendTest(unittest.TestCase):
+
+    def setUp(self):
+        self.state = SharedState(create=True)
+        self.ring = InputRing(create=True)
+        self.listener = socket.create_server(("127.0.0.1", 0))
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, BUFFER_SIZE)
+        port = self.listener.getsockname()[1]
+
+        self.daemon = NetworkDaemon(self.state, self.ring, [], 0, 0, drain=True)
+        with mock.patch.object(net_daemon, "connection_order", return_value=([("127.0.0.1", port)], [])):
+            self.daemon.connect()
+        self.daemon.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, BUFFER_SIZE)
+        self.server, _ = self.listener.accept()
+
+    def tearDown(self):
+        if self.daemon.sock is not None:
+            self.daemon.sock.close()
+        self.server.close()
+        self.listener.close()
+        self.state.close(unlink=True)
+        self.ring.close(unlink=True)
+
+    def read_exactly(self, size, received):
+        """Lit `size` octets côté serveur, après READ_DELAY"""
+        time.sleep(READ_DELAY)
+        while len(received) < size:
+            chunk = self.server.recv(65536)
+            if not chunk:
+                break
+            received += chunk
+
+    def test_full_send_buffer_does_not_disconnect(self):
+        self.server.sendall(encode_player_join(1) + encode_game_state(400.0, 300.0, 250.0, 0, 250.0, 0, 1, 0, 0, 7))
+        self.daemon.drain_socket()
+        self.assertEqual((self.daemon.record.player_id, self.daemon.record.tick), (1, 7))
+
+        expected = HEADER_SIZE + SUBSCRIBE_SIZE + BATCHES * RING_SLOTS * (HEADER_SIZE + PLAYER_MOVE_SIZE)
+        received = bytearray()
+        reader = threading.Thread(target=self.read_exactly, args=(expected, received))
+        reader.start()
+        try:
+            for batch in range(BATCHES):
+                for slot in range(RING_SLOTS):
+                    self.ring.push(INPUT_MOVE, 1, batch * RING_SLOTS + slot + 1)
+                self.daemon.process_inputs()
+                self.assertIsNotNone(self.daemon.sock, self.daemon.record.message)
+        finally:
+            if self.daemon.sock is not None:
+                self.daemon.sock.shutdown(socket.SHUT_WR)
+            reader.join()
+
+        self.assertEqual(len(received), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Vérifie pong_protocol contre les vecteurs de protocol/vectors.json.
+
+Les mêmes vecteurs sont testés côté serveur
+(server-tcp/pkg/protocol/messages_gen_test.go) et, si node est installé,
+contre le codec du client navigateur (client-js/pong_protocol.js).
+
+Usage:
+    python test_pong_protocol.py
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import unittest
+
+import pong_protocol
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GENERATOR = os.path.join(ROOT, "protocol", "generate.py")
+VECTORS_PATH = os.path.join(ROOT, "protocol", "vectors.json")
+JS_CODEC_PATH = os.path.join(ROOT, "client-js", "pong_protocol.js")
+sys.path.insert(0, os.path.dirname(GENERATOR))
+from generate import snake_case  # noqa: E402
+
+# Débit de décodage minimal (messages/s), très en deçà du débit mesuré
+MIN_DECODE_RATE = 100_000
+DECODE_ITERATIONS = 200_000
+
+# Exécuté par node après le codec : affiche, pour chaque vecteur, les
+# valeurs décodées et le message réencodé
+JS_VECTORS = """
+const vectors = JSON.parse(require("fs").readFileSync(process.argv[1], "utf8"));
+const results = vectors.map((vector) => {
+    const message = Buffer.from(vector.message, "hex");
+    const view = new DataView(message.buffer, message.byteOffset, message.length);
+    const decoded = DECODERS[vector.id](view, HEADER_SIZE);
+    const encoded = eval("encode" + vector.name)(decoded);
+    return {
+        size: MESSAGE_SIZES[vector.id],
+        fields: Object.values(decoded),
+        message: Buffer.from(encoded).toString("hex"),
+    };
+});
+console.log(JSON.stringify(results));
+"""
+
+
+def load_vectors():
+    with open(VECTORS_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class GoldenVectorsTest(unittest.TestCase):
+
+    def test_every_message_has_a_vector(self):
+        ids = {vector["id"] for vector in load_vectors()}
+        self.assertEqual(ids, set(pong_protocol.MESSAGE_SIZES))
+
+    def test_vectors(self):
+        for vector in load_vectors():
+            with self.subTest(vector["name"]):
+                func = snake_case(vector["name"])
+                message = bytes.fromhex(vector["message"])
+                values = list(vector["fields"].values())
+
+                msg_type, length = pong_protocol.HEADER.unpack_from(message)
+                self.assertEqual(msg_type, vector["id"])
+                self.assertEqual(length, pong_protocol.MESSAGE_SIZES[msg_type])
+                self.assertEqual(len(message), pong_protocol.HEADER_SIZE + length)
+
+                decoded = pong_protocol.DECODERS[msg_type](message, pong_protocol.HEADER_SIZE)
+                self.assertEqual(decoded._fields, tuple(snake_case(name) for name in vector["fields"]))
+                self.assertEqual(list(decoded), values)
+
+                encode = getattr(pong_protocol, f"encode_{func}")
+                self.assertEqual(encode(*values), message)
+
+    def test_decode_throughput(self):
+        vector = next(v for v in load_vectors() if v["name"] == "GameState")
+        payload = bytes.fromhex(vector["message"])[pong_protocol.HEADER_SIZE:]
+        decode = pong_protocol.decode_game_state
+
+        start = time.perf_counter()
+        for _ in range(DECODE_ITERATIONS):
+            decode(payload)
+        rate = DECODE_ITERATIONS / (time.perf_counter() - start)
+
+        print(f"\ndecode_game_state: {rate / 1e6:.2f} M messages/s", file=sys.stderr)
+        self.assertGreater(rate, MIN_DECODE_RATE)
+
+
+@unittest.skipIf(shutil.which("node") is None, "node introuvable")
+class JavaScriptVectorsTest(unittest.TestCase):
+
+    def test_vectors(self):
+        with open(JS_CODEC_PATH, encoding="utf-8") as f:
+            source = f.read() + JS_VECTORS
+        result = subprocess.run(["node", "-e", source, VECTORS_PATH], capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        for vector, got in zip(load_vectors(), json.loads(result.stdout)):
+            with self.subTest(vector["name"]):
+                self.assertEqual(got["size"], pong_protocol.MESSAGE_SIZES[vector["id"]])
+                self.assertEqual(got["fields"], list(vector["fields"].values()))
+                self.assertEqual(got["message"], vector["message"])
+
+
+class GeneratedFilesTest(unittest.TestCase):
+
+    def test_generated_files_up_to_date(self):
+        result = subprocess.run([sys.executable, GENERATOR, "--check"], capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
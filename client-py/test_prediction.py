@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Vérifie la réconciliation de PaddlePredictor contre un serveur simulé.
+
+Le serveur applique à chaque tick la dernière entrée reçue, comme
+Game.applyInputs (server-tcp/pkg/game/game.go), et publie son état sans
+délai ; seules les arrivées des entrées varient.
+
+Usage:
+    python test_prediction.py
+"""
+
+import unittest
+from collections import defaultdict
+
+from prediction import PADDLE_STEP, PaddlePredictor, move_paddle
+
+START = 100.0
+
+
+class Server:
+    """Raquette côté serveur : la dernière entrée reçue est tenue à chaque tick"""
+
+    def __init__(self):
+        self.position = START
+        self.direction = None
+        self.seq = 0
+        self.tick = 0
+
+    def update(self, arrivals):
+        if arrivals:
+            self.seq, self.direction = arrivals[-1]
+        self.tick += 1
+        if self.direction is not None:
+            self.position = move_paddle(self.position, self.direction)
+
+
+def play(inputs, arrival, ticks):
+    """Retourne la position prédite après chaque tick local
+
+    `inputs` associe un tick local à la direction envoyée, `arrival` donne
+    le tick serveur qui applique l'entrée envoyée au tick local indiqué.
+    """
+    clock = [0]
+    predictor = PaddlePredictor(START, lambda: clock[0])
+    server = Server()
+    arrivals = defaultdict(list)
+
+    predicted = []
+    for now in range(ticks):
+        clock[0] = now
+        if now > 0:
+            server.update(arrivals.pop(now, []))
+            predictor.reconcile(server.position, server.seq, server.tick)
+        if now in inputs:
+            seq = predictor.apply_input(inputs[now])
+            arrivals[arrival(now)].append((seq, inputs[now]))
+        predicted.append(predictor.position)
+    return predicted, server
+
+
+class ReconcileTest(unittest.TestCase):
+
+    def assertPositions(self, predicted, steps):
+        for now, (got, want) in enumerate(zip(predicted, steps)):
+            self.assertAlmostEqual(got, START + want * PADDLE_STEP, msg=f"tick local {now}: {predicted}")
+
+    def test_bunched_inputs(self):
+        # Une entrée par tick vers le bas ; celles des ticks 2 et 3 arrivent
+        # groupées avec celle du tick 4. Le serveur tient l'entrée du tick 1
+        # en attendant : la raquette ne doit ni dépasser ni revenir en arrière
+        inputs = {now: 1 for now in range(8)}
+        predicted, server = play(inputs, lambda now: 5 if now in (2, 3) else now + 1, 9)
+        self.assertPositions(predicted, range(1, 9))
+        self.assertAlmostEqual(server.position, START + 8 * PADDLE_STEP)
+
+    def test_stalled_inputs(self):
+        # Aucune entrée entre les ticks 0 et 5 : le serveur continue de
+        # descendre, la prédiction aussi, sans saut à l'acquittement de l'arrêt
+        predicted, server = play({0: 1, 5: 0}, lambda now: now + 1, 9)
+        self.assertPositions(predicted, [1, 1, 2, 3, 4, 5, 5, 5, 5])
+        self.assertAlmostEqual(server.position, START + 5 * PADDLE_STEP)
+
+    def test_latency_replays_pending_inputs(self):
+        # Trois ticks d'aller : les entrées en vol sont rejouées au-dessus
+        # de la position serveur, qui les rattrape sans écart
+        inputs = {now: 1 if now < 4 else -1 if now < 8 else 0 for now in range(12)}
+        predicted, _ = play(inputs, lambda now: now + 3, 12)
+        self.assertPositions(predicted, [1, 2, 3, 4, 3, 2, 1, 0, 0, 0, 0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Génère les codecs Go, Python et JavaScript du protocole à partir de schema.json.
+
+Les constantes du jeu (dimensions, vitesses, fréquences) sont générées au
+même endroit pour que le serveur, les clients et le simulateur partagent
+la même configuration. Des vecteurs de test (protocol/vectors.json) sont
+produits en même temps : les tests Go et Python les comparent à leurs
+codecs respectifs.
+
+Usage:
+    python protocol/generate.py          # régénère les fichiers
+    python protocol/generate.py --check  # échoue si les fichiers générés ne sont plus à jour
+"""
+
+import json
+import os
+import re
+import struct
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA_PATH = os.path.join(ROOT, "protocol", "schema.json")
+GO_OUTPUT = os.path.join(ROOT, "server-tcp", "pkg", "protocol", "messages_gen.go")
+PY_OUTPUT = os.path.join(ROOT, "client-py", "pong_protocol.py")
+GO_CONFIG_OUTPUT = os.path.join(ROOT, "server-tcp", "pkg", "game", "config_gen.go")
+PY_CONFIG_OUTPUT = os.path.join(ROOT, "client-py", "game_config.py")
+VECTORS_OUTPUT = os.path.join(ROOT, "protocol", "vectors.json")
+JS_OUTPUT = os.path.join(ROOT, "client-js", "pong_protocol.js")
+
+# Type du schéma -> (type Go, format struct, taille en octets, accesseur DataView)
+TYPES = {
+    "u8": ("byte", "B", 1, "Uint8"),
+    "i8": ("int8", "b", 1, "Int8"),
+    "u16": ("uint16", "H", 2, "Uint16"),
+    "u32": ("uint32", "I", 4, "Uint32"),
+    "f32": ("float32", "f", 4, "Float32"),
+}
+
+HEADER_FORMAT = ">BI"
+
+
+def snake_case(name):
+    """Convertit un nom CamelCase en snake_case (PlayerID -> player_id)"""
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).lower()
+
+
+def camel_case(name):
+    """Convertit un nom CamelCase en camelCase JavaScript (PlayerID -> playerId)"""
+    first, *rest = snake_case(name).split("_")
+    return first + "".join(word.capitalize() for word in rest)
+
+
+def load_schema(path=SCHEMA_PATH):
+    """Charge le schéma et calcule les offsets de chaque champ"""
+    with open(path, encoding="utf-8") as f:
+        schema = json.load(f)
+
+    ids = set()
+    for message in schema["messages"]:
+        if message["id"] in ids:
+            raise ValueError(f"ID de message dupliqué: {message['id']}")
+        ids.add(message["id"])
+
+        offset = 0
+        for field in message["fields"]:
+            if field["type"] not in TYPES:
+                raise ValueError(f"Type inconnu {field['type']} pour {message['name']}.{field['name']}")
+            field["offset"] = offset
+            offset += TYPES[field["type"]][2]
+        message["size"] = offset
+
+    return schema
+
+
+def format_value(value):
+    """Littéral d'une constante, identique en Go et en Python"""
+    return repr(value)
+
+
+def generate_go_config(schema):
+    """Produit les constantes Go du jeu"""
+    constants = schema["constants"]
+    lines = [
+        "// Code generated by protocol/generate.py from protocol/schema.json. DO NOT EDIT.",
+        "",
+        "package game",
+        "",
+        "// Constantes partagées avec les clients Python (client-py/game_config.py)",
+        "const (",
+    ]
+    width = max(len(c["name"]) for c in constants)
+    value_width = max(len(format_value(c["value"])) for c in constants)
+    for c in constants:
+        value = format_value(c["value"])
+        lines.append(f"\t{c['name']:<{width}} = {value:<{value_width}} // {c['doc']}")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def generate_python_config(schema):
+    """Produit le module Python des constantes du jeu"""
+    lines = [
+        "# -*- coding: utf-8 -*-",
+        "# Code généré par protocol/generate.py à partir de protocol/schema.json. NE PAS MODIFIER.",
+        "",
+        '"""Constantes du jeu partagées avec le serveur (server-tcp/pkg/game/config_gen.go)"""',
+        "",
+    ]
+    for c in schema["constants"]:
+        lines.append(f"{snake_case(c['name']).upper()} = {format_value(c['value'])}  # {c['doc']}")
+    return "\n".join(lines) + "\n"
+
+
+def go_encode_field(field):
+    """Instruction Go écrivant un champ à son offset fixe"""
+    name, offset, kind = field["name"], field["offset"], field["type"]
+    if kind == "u8":
+        return f"\tb[{offset}] = m.{name}"
+    if kind == "i8":
+        return f"\tb[{offset}] = byte(m.{name})"
+    if kind == "u16":
+        return f"\tbinary.BigEndian.PutUint16(b[{offset}:], m.{name})"
+    if kind == "u32":
+        return f"\tbinary.BigEndian.PutUint32(b[{offset}:], m.{name})"
+    return f"\tbinary.BigEndian.PutUint32(b[{offset}:], math.Float32bits(m.{name}))"
+
+
+def go_decode_field(field):
+    """Instruction Go lisant un champ à son offset fixe"""
+    name, offset, kind = field["name"], field["offset"], field["type"]
+    if kind == "u8":
+        return f"\tm.{name} = data[{offset}]"
+    if kind == "i8":
+        return f"\tm.{name} = int8(data[{offset}])"
+    if kind == "u16":
+        return f"\tm.{name} = binary.BigEndian.Uint16(data[{offset}:])"
+    if kind == "u32":
+        return f"\tm.{name} = binary.BigEndian.Uint32(data[{offset}:])"
+    return f"\tm.{name} = math.Float32frombits(binary.BigEndian.Uint32(data[{offset}:]))"
+
+
+def generate_go(schema):
+    """Produit le code Go du protocole"""
+    messages = schema["messages"]
+    lines = [
+        "// Code generated by protocol/generate.py from protocol/schema.json. DO NOT EDIT.",
+        "",
+        "package protocol",
+        "",
+        "import (",
+        '\t"encoding/binary"',
+        '\t"fmt"',
+        '\t"math"',
+        ")",
+        "",
+        "// Définition des types de messages",
+        "const (",
+    ]
+    width = max(len(f"MsgType{m['name']}") for m in messages)
+    for m in messages:
+        lines.append(f"\t{'MsgType' + m['name']:<{width}} byte = {m['id']} // {m['doc']}")
+    lines.append(")")
+    lines.append("")
+    lines.append("// Taille du corps de chaque message en octets")
+    lines.append("const (")
+    width = max(len(f"{m['name']}Size") for m in messages)
+    for m in messages:
+        lines.append(f"\t{m['name'] + 'Size':<{width}} = {m['size']}")
+    lines.append(")")
+    lines.append("")
+    lines.append("// MessageNames associe chaque type de message à son nom")
+    lines.append("var MessageNames = map[byte]string{")
+    width = max(len(f"MsgType{m['name']}:") for m in messages)
+    for m in messages:
+        lines.append(f"\t{'MsgType' + m['name'] + ':':<{width}} \"{m['name']}\",")
+    lines.append("}")
+
+    for m in messages:
+        name = m["name"]
+        lines.append("")
+        lines.append(f"// {name}: {m['doc']}")
+        lines.append("// Format binaire:")
+        for field in m["fields"]:
+            size = TYPES[field["type"]][2]
+            start, end = field["offset"], field["offset"] + size - 1
+            where = f"Octet {start}" if size == 1 else f"Octets {start}-{end}"
+            lines.append(f"// - {where}: {field['doc']} ({TYPES[field['type']][0]})")
+        lines.append(f"type {name} struct {{")
+        width = max(len(field["name"]) for field in m["fields"])
+        for field in m["fields"]:
+            lines.append(f"\t{field['name']:<{width}} {TYPES[field['type']][0]}")
+        lines.append("}")
+        lines.append("")
+        lines.append(f"// Encode{name} encode un {name} avec son en-tête")
+        lines.append(f"func Encode{name}(m *{name}) []byte {{")
+        lines.append(f"\tmessage := make([]byte, HeaderSize+{name}Size)")
+        lines.append(f"\tmessage[0] = MsgType{name}")
+        lines.append(f"\tbinary.BigEndian.PutUint32(message[1:], {name}Size)")
+        lines.append("\tb := message[HeaderSize:]")
+        for field in m["fields"]:
+            lines.append(go_encode_field(field))
+        lines.append("\treturn message")
+        lines.append("}")
+        lines.append("")
+        lines.append(f"// Decode{name} décode le corps d'un message {name}")
+        lines.append(f"func Decode{name}(data []byte) (*{name}, error) {{")
+        lines.append(f"\tif len(data) < {name}Size {{")
+        lines.append(f'\t\treturn nil, fmt.Errorf("données insuffisantes pour décoder {name}")')
+        lines.append("\t}")
+        lines.append("")
+        lines.append(f"\tm := &{name}{{}}")
+        for field in m["fields"]:
+            lines.append(go_decode_field(field))
+        lines.append("\treturn m, nil")
+        lines.append("}")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_python(schema):
+    """Produit le module Python du protocole"""
+    messages = schema["messages"]
+    lines = [
+        "# -*- coding: utf-8 -*-",
+        "# Code généré par protocol/generate.py à partir de protocol/schema.json. NE PAS MODIFIER.",
+        "",
+        '"""Codec binaire du protocole Pong (structures struct précompilées)"""',
+        "",
+        "import struct",
+        "from collections import namedtuple",
+        "",
+        "# " + schema["header"]["doc"],
+        f'HEADER = struct.Struct("{HEADER_FORMAT}")',
+        "HEADER_SIZE = HEADER.size",
+        "",
+        "# Types de messages",
+    ]
+    for m in messages:
+        lines.append(f"MSG_TYPE_{snake_case(m['name']).upper()} = {m['id']}")
+
+    for m in messages:
+        name = m["name"]
+        const = snake_case(name).upper()
+        func = snake_case(name)
+        fields = [snake_case(field["name"]) for field in m["fields"]]
+        body_format = ">" + "".join(TYPES[field["type"]][1] for field in m["fields"])
+        message_format = HEADER_FORMAT + body_format[1:]
+        args = ", ".join(fields)
+
+        lines.append("")
+        lines.append("")
+        lines.append(f"# {name}: {m['doc']}")
+        for field in m["fields"]:
+            lines.append(f"# - {snake_case(field['name'])} ({field['type']}): {field['doc']}")
+        lines.append(f"{name} = namedtuple(\"{name}\", {fields!r})")
+        lines.append(f'{const} = struct.Struct("{body_format}")')
+        lines.append(f"{const}_SIZE = {m['size']}")
+        lines.append(f'_{const}_MESSAGE = struct.Struct("{message_format}")')
+        lines.append(f"_unpack_{func} = {const}.unpack_from")
+        lines.append(f"_pack_{func} = _{const}_MESSAGE.pack")
+        lines.append("")
+        lines.append("")
+        lines.append(f"def encode_{func}({args}):")
+        lines.append(f'    """Encode un message {name} complet (en-tête inclus)"""')
+        lines.append(f"    return _pack_{func}(MSG_TYPE_{const}, {const}_SIZE, {args})")
+        lines.append("")
+        lines.append("")
+        lines.append(f"def decode_{func}(payload, offset=0):")
+        lines.append(f'    """Décode le corps d\'un message {name} (lève struct.error si incomplet)"""')
+        lines.append(f"    return {name}._make(_unpack_{func}(payload, offset))")
+
+    lines.append("")
+    lines.append("")
+    lines.append("# Taille du corps attendue pour chaque type de message")
+    lines.append("MESSAGE_SIZES = {")
+    for m in messages:
+        const = snake_case(m["name"]).upper()
+        lines.append(f"    MSG_TYPE_{const}: {const}_SIZE,")
+    lines.append("}")
+    lines.append("")
+    lines.append("# Décodeur associé à chaque type de message")
+    lines.append("DECODERS = {")
+    for m in messages:
+        lines.append(f"    MSG_TYPE_{snake_case(m['name']).upper()}: decode_{snake_case(m['name'])},")
+    lines.append("}")
+
+    return "\n".join(lines) + "\n"
+
+
+def js_field_range(field):
+    """Octets occupés par un champ, pour les commentaires"""
+    size = TYPES[field["type"]][2]
+    start = field["offset"]
+    return f"octet {start}" if size == 1 else f"octets {start}-{start + size - 1}"
+
+
+def generate_js(schema):
+    """Produit le codec JavaScript du protocole pour le client navigateur"""
+    messages = schema["messages"]
+    lines = [
+        "// Code généré par protocol/generate.py à partir de protocol/schema.json. NE PAS MODIFIER.",
+        "",
+        "// Codec binaire du protocole Pong (DataView, big-endian)",
+        "",
+        "// " + schema["header"]["doc"],
+        f"const HEADER_SIZE = {struct.calcsize(HEADER_FORMAT)};",
+        "",
+        "// Types de messages",
+    ]
+    for m in messages:
+        lines.append(f"const MSG_TYPE_{snake_case(m['name']).upper()} = {m['id']};")
+
+    for m in messages:
+        name = m["name"]
+        const = snake_case(name).upper()
+
+        lines.append("")
+        lines.append(f"// {name}: {m['doc']}")
+        for field in m["fields"]:
+            lines.append(f"// - {camel_case(field['name'])} ({field['type']}, {js_field_range(field)}): {field['doc']}")
+        lines.append(f"const {const}_SIZE = {m['size']};")
+        lines.append("")
+        lines.append(f"// Encode un message {name} complet (en-tête inclus)")
+        lines.append(f"function encode{name}(m) {{")
+        lines.append(f"    const message = new Uint8Array(HEADER_SIZE + {const}_SIZE);")
+        lines.append("    const view = new DataView(message.buffer);")
+        lines.append(f"    view.setUint8(0, MSG_TYPE_{const});")
+        lines.append(f"    view.setUint32(1, {const}_SIZE, false);")
+        for field in m["fields"]:
+            accessor, size = TYPES[field["type"]][3], TYPES[field["type"]][2]
+            endian = "" if size == 1 else ", false"
+            lines.append(f"    view.set{accessor}(HEADER_SIZE + {field['offset']}, m.{camel_case(field['name'])}{endian});")
+        lines.append("    return message;")
+        lines.append("}")
+        lines.append("")
+        lines.append(f"// Décode le corps d'un message {name} (lève RangeError si incomplet)")
+        lines.append(f"function decode{name}(view, offset = 0) {{")
+        lines.append("    return {")
+        for field in m["fields"]:
+            accessor, size = TYPES[field["type"]][3], TYPES[field["type"]][2]
+            endian = "" if size == 1 else ", false"
+            lines.append(f"        {camel_case(field['name'])}: view.get{accessor}(offset + {field['offset']}{endian}),")
+        lines.append("    };")
+        lines.append("}")
+
+    lines.append("")
+    lines.append("// Taille du corps attendue pour chaque type de message")
+    lines.append("const MESSAGE_SIZES = {")
+    for m in messages:
+        const = snake_case(m["name"]).upper()
+        lines.append(f"    [MSG_TYPE_{const}]: {const}_SIZE,")
+    lines.append("};")
+    lines.append("")
+    lines.append("// Décodeur associé à chaque type de message")
+    lines.append("const DECODERS = {")
+    for m in messages:
+        lines.append(f"    [MSG_TYPE_{snake_case(m['name']).upper()}]: decode{m['name']},")
+    lines.append("};")
+
+    return "\n".join(lines) + "\n"
+
+
+def sample_value(kind, index):
+    """Valeur de test déterministe pour le champ d'indice `index`
+
+    Les entiers non signés ont le bit de poids fort à 1, les entiers signés
+    sont négatifs et les flottants exactement représentables en float32.
+    """
+    if kind == "u8":
+        return 0x81 + index
+    if kind == "i8":
+        return -1 - index
+    if kind == "u16":
+        return 0x8102 + index * 0x0101
+    if kind == "u32":
+        return 0x81020304 + index * 0x01010101
+    return (index + 1) * 1.25 * (-1 if index % 2 else 1)
+
+
+def generate_vectors(schema):
+    """Produit les vecteurs de test : valeurs des champs et message encodé"""
+    vectors = []
+    for m in schema["messages"]:
+        fields = {}
+        message = struct.pack(HEADER_FORMAT, m["id"], m["size"])
+        for index, field in enumerate(m["fields"]):
+            value = sample_value(field["type"], index)
+            fields[field["name"]] = value
+            message += struct.pack(">" + TYPES[field["type"]][1], value)
+        vectors.append({"name": m["name"], "id": m["id"], "fields": fields, "message": message.hex()})
+    return json.dumps(vectors, indent=2) + "\n"
+
+
+def main(argv):
+    schema = load_schema()
+    outputs = {
+        GO_OUTPUT: generate_go(schema),
+        PY_OUTPUT: generate_python(schema),
+        JS_OUTPUT: generate_js(schema),
+        GO_CONFIG_OUTPUT: generate_go_config(schema),
+        PY_CONFIG_OUTPUT: generate_python_config(schema),
+        VECTORS_OUTPUT: generate_vectors(schema),
+    }
+
+    check = "--check" in argv
+    stale = []
+    for path, content in outputs.items():
+        current = None
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                current = f.read()
+        if current == content:
+            continue
+        if check:
+            stale.append(os.path.relpath(path, ROOT))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            print(f"Généré: {os.path.relpath(path, ROOT)}")
+
+    if stale:
+        print("Fichiers générés obsolètes, relancez protocol/generate.py:")
+        for path in stale:
+            print(f"  {path}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
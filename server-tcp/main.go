@@ -16,8 +16,21 @@ func main() {
 		address = ":" + port
 	}
 
+	// Adresse des métriques (METRICS_ADDR, vide pour les désactiver)
+	metricsAddress := "127.0.0.1:9100"
+	if addr, ok := os.LookupEnv("METRICS_ADDR"); ok {
+		metricsAddress = addr
+	}
+
 	// Créer et démarrer le serveur
 	server := network.NewServer(address)
+	if metricsAddress != "" {
+		if err := server.ServeMetrics(metricsAddress); err != nil {
+			log.Printf("Métriques indisponibles: %v", err)
+		} else {
+			log.Printf("Métriques exposées sur http://%s/metrics", metricsAddress)
+		}
+	}
 	
 	// Canal pour les signaux d'arrêt
 	sigChan := make(chan os.Signal, 1)
@@ -0,0 +1,16 @@
+// Code generated by protocol/generate.py from protocol/schema.json. DO NOT EDIT.
+
+package game
+
+// Constantes partagées avec les clients Python (client-py/game_config.py)
+const (
+	GameWidth     = 800   // Largeur du terrain (px)
+	GameHeight    = 600   // Hauteur du terrain (px)
+	PaddleWidth   = 15    // Largeur d'une raquette (px)
+	PaddleHeight  = 100   // Hauteur d'une raquette (px)
+	BallSize      = 10    // Côté de la balle (px)
+	BallSpeed     = 300.0 // Vitesse de la balle (px/s)
+	PaddleSpeed   = 480.0 // Vitesse d'une raquette (px/s)
+	TickRate      = 60    // Fréquence de la simulation (Hz)
+	BroadcastRate = 60    // Fréquence maximale de diffusion des états (Hz)
+)
@@ -4,25 +4,42 @@ import (
 	"math"
 	"math/rand"
 	"sync"
+	"sync/atomic"
 	"time"
 )
 
+// Les dimensions, vitesses et fréquences sont générées dans config_gen.go
+// à partir de protocol/schema.json.
 const (
-	// Dimensions du jeu
-	GameWidth  = 800
-	GameHeight = 600
+	// Durée d'un tick de simulation en secondes
+	TickSeconds = 1.0 / TickRate
 
-	// Dimensions de la raquette
-	PaddleWidth  = 15
-	PaddleHeight = 100
+	// Ticks rattrapés au plus par appel à Advance, en plus des ticks d'un
+	// réveil normal de la boucle de jeu ; au-delà, le retard est abandonné
+	MaxCatchUpTicks = 5
 
-	// Dimensions de la balle
-	BallSize = 10
+	// Compensation de latence
+	MaxRewindTicks = TickRate / 4 // Retard maximal compensé (250 ms)
+	HistorySize    = 64           // Ticks conservés dans l'historique (> MaxRewindTicks)
+)
 
-	// Vitesse
-	BallSpeed       = 5.0
-	PaddleSpeed     = 8.0
-	UpdateFrequency = 60 // FPS
+// Contacts rencontrés par la balle au cours d'un balayage
+const (
+	sweepNone = iota
+	sweepLeft
+	sweepRight
+	sweepTop
+	sweepBottom
+
+	// Contacts traités au plus par balayage
+	maxSweepEvents = 8
+)
+
+// États d'un bord du terrain vis-à-vis de la balle
+const (
+	edgeClear   = iota // Aucune balle manquée
+	edgePending        // Balle passée hors de la raquette, en attente de la vue du joueur
+	edgeMissed         // Balle manquée confirmée, le point sera marqué
 )
 
 // Ball représente la balle
@@ -38,16 +55,53 @@ type Player struct {
 	Position float32
 	Score    uint16
 	Ready    bool
+	LastSeq  uint32 // Numéro de séquence de la dernière entrée appliquée
+	ViewTick uint32 // Dernier tick affiché par le client lors de cette entrée
+}
+
+// Input est la dernière entrée reçue d'un joueur
+type Input struct {
+	Direction int8
+	Seq       uint32
+	ViewTick  uint32
+}
+
+// Frame mémorise la balle au début d'un tick pour pouvoir le rejouer
+type Frame struct {
+	Tick uint32
+	Ball Ball
+}
+
+// edge suit une balle manquée de chaque côté du terrain
+type edge struct {
+	state  uint8
+	tick   uint32  // Tick où la balle a dépassé la raquette
+	seen   bool    // Le joueur a envoyé une entrée après avoir vu ce tick
+	paddle float32 // Raquette juste avant cette entrée
 }
 
 // Game représente l'état complet du jeu
 type Game struct {
-	Ball       Ball
-	Player1    Player
-	Player2    Player
-	IsRunning  bool
-	UpdateRate time.Duration
-	Mu         sync.Mutex // Rendu public pour y accéder depuis le package network
+	Ball         Ball
+	Player1      Player
+	Player2      Player
+	IsRunning    bool
+	UpdateRate   time.Duration
+	WakeInterval time.Duration // Période des appels à Advance par la boucle de jeu
+	Mu           sync.Mutex    // Rendu public pour y accéder depuis le package network
+	Tick         uint32        // Numéro du tick courant
+
+	// Temps réel écoulé non encore simulé (voir Advance)
+	accumulator time.Duration
+
+	// Dernière entrée reçue pour chaque joueur, appliquée une fois par tick.
+	// Publiée par pointeur pour être écrite sans prendre Mu.
+	inputs [2]atomic.Pointer[Input]
+
+	// Historique circulaire des positions de la balle, indexé par tick
+	history [HistorySize]Frame
+	// Balles manquées en attente de décision (0: gauche, 1: droite)
+	edges [2]edge
 }
 
 // NewGame crée une nouvelle instance de jeu
@@ -67,8 +121,9 @@ func NewGame() *Game {
 			Score:    0,
 			Ready:    false,
 		},
-		IsRunning:  false,
-		UpdateRate: time.Second / UpdateFrequency,
+		IsRunning:    false,
+		UpdateRate:   time.Second / TickRate,
+		WakeInterval: time.Second / BroadcastRate,
 	}
 }
 
@@ -77,6 +132,11 @@ func (g *Game) ResetBall() {
 	g.Mu.Lock()
 	defer g.Mu.Unlock()
 
+	g.resetBall()
+}
+
+// resetBall replace la balle au centre (le verrou doit être détenu)
+func (g *Game) resetBall() {
 	g.Ball.X = GameWidth / 2
 	g.Ball.Y = GameHeight / 2
 
@@ -90,37 +150,85 @@ func (g *Game) ResetBall() {
 
 	g.Ball.VelocityX = float32(BallSpeed * math.Cos(angle))
 	g.Ball.VelocityY = float32(BallSpeed * math.Sin(angle))
+	g.edges = [2]edge{}
 }
 
 // Start démarre le jeu
 func (g *Game) Start() {
 	g.Mu.Lock()
 	defer g.Mu.Unlock()
-	
+
+	g.start()
+}
+
+// start démarre le jeu (le verrou doit être détenu)
+func (g *Game) start() {
 	// Réinitialiser les scores
 	g.Player1.Score = 0
 	g.Player2.Score = 0
-	g.ResetBall()
+	g.resetBall()
 	g.IsRunning = true
 }
 
-// MovePaddle déplace la raquette d'un joueur
-func (g *Game) MovePaddle(playerID byte, direction int8) {
+// SetInput enregistre la direction courante d'un joueur. Seule la dernière
+// entrée reçue est conservée ; elle est appliquée une fois par tick dans
+// Update, quelle que soit la fréquence d'envoi du client. viewTick est le
+// tick du dernier état affiché par le client au moment de l'entrée.
+func (g *Game) SetInput(playerID byte, direction int8, seq uint32, viewTick uint32) {
+	if playerID != 1 && playerID != 2 {
+		return
+	}
+
+	g.inputs[playerID-1].Store(&Input{Direction: direction, Seq: seq, ViewTick: viewTick})
+}
+
+// ResetPlayer oublie l'entrée, la séquence acquittée et le tick affiché
+// d'un joueur qui se déconnecte : la connexion suivante sur cet ID repart
+// de la séquence 0 et la raquette reste immobile jusqu'à sa première entrée
+func (g *Game) ResetPlayer(playerID byte) {
+	if playerID != 1 && playerID != 2 {
+		return
+	}
+
 	g.Mu.Lock()
 	defer g.Mu.Unlock()
 
-	var player *Player
-	if playerID == 1 {
-		player = &g.Player1
-	} else if playerID == 2 {
+	g.inputs[playerID-1].Store(nil)
+	player := &g.Player1
+	if playerID == 2 {
 		player = &g.Player2
-	} else {
+	}
+	player.LastSeq = 0
+	player.ViewTick = 0
+}
+
+// applyInputs déplace les raquettes selon la dernière entrée de chaque
+// joueur (le verrou doit être détenu)
+func (g *Game) applyInputs() {
+	for side, p := range [2]*Player{&g.Player1, &g.Player2} {
+		input := g.inputs[side].Load()
+
+		// La première entrée faite en voyant la balle passer a été décidée
+		// trop tard pour la renvoyer : resolveMiss juge la raquette d'avant
+		e := &g.edges[side]
+		if e.state == edgePending && !e.seen && input != nil && int32(input.ViewTick-e.tick) >= 0 {
+			e.seen, e.paddle = true, p.Position
+		}
+		p.applyInput(input)
+	}
+}
+
+// applyInput déplace la raquette d'un tick dans la direction demandée et
+// mémorise le numéro de séquence de l'entrée pour que le client puisse
+// réconcilier sa prédiction
+func (p *Player) applyInput(input *Input) {
+	if input == nil {
 		return
 	}
 
 	// Direction: 1 pour bas, -1 pour haut
-	movement := float32(direction) * PaddleSpeed
-	newPosition := player.Position + movement
+	movement := float32(input.Direction) * (PaddleSpeed * TickSeconds)
+	newPosition := p.Position + movement
 
 	// Garder la raquette dans les limites du jeu
 	if newPosition < 0 {
@@ -129,7 +237,9 @@ func (g *Game) MovePaddle(playerID byte, direction int8) {
 		newPosition = GameHeight - PaddleHeight
 	}
 
-	player.Position = newPosition
+	p.Position = newPosition
+	p.LastSeq = input.Seq
+	p.ViewTick = input.ViewTick
 }
 
 // SetPlayerReady définit l'état de préparation d'un joueur
@@ -145,60 +255,229 @@ func (g *Game) SetPlayerReady(playerID byte, ready bool) {
 
 	// Si les deux joueurs sont prêts, démarrer le jeu
 	if g.Player1.Ready && g.Player2.Ready && !g.IsRunning {
-		g.Start()
+		g.start()
 	}
 }
 
-// Update met à jour l'état du jeu pour un cycle
-func (g *Game) Update() {
+// Advance fait progresser la simulation du temps réel écoulé, par pas fixes
+// de UpdateRate, et retourne le nombre de ticks simulés. Le reliquat est
+// conservé pour l'appel suivant, ce qui rend la simulation indépendante de
+// la fréquence d'appel. Le retard accumulé est borné à un réveil de
+// WakeInterval plus un tick, et au moins MaxCatchUpTicks ticks, pour ne
+// jamais écourter un réveil normal.
+func (g *Game) Advance(elapsed time.Duration) int {
 	g.Mu.Lock()
 	defer g.Mu.Unlock()
 
-	if !g.IsRunning {
-		return
+	perWake := int((g.WakeInterval + g.UpdateRate - 1) / g.UpdateRate)
+	g.accumulator += elapsed
+	if limit := time.Duration(max(MaxCatchUpTicks, perWake+1)) * g.UpdateRate; g.accumulator > limit {
+		g.accumulator = limit
 	}
 
-	// Mettre à jour la position de la balle
-	g.Ball.X += g.Ball.VelocityX
-	g.Ball.Y += g.Ball.VelocityY
-
-	// Collision avec les murs (haut/bas)
-	if g.Ball.Y <= 0 || g.Ball.Y >= GameHeight-BallSize {
-		g.Ball.VelocityY = -g.Ball.VelocityY
+	steps := 0
+	for g.accumulator >= g.UpdateRate {
+		g.accumulator -= g.UpdateRate
+		g.update()
+		steps++
 	}
+	return steps
+}
+
+// Update met à jour l'état du jeu pour un cycle
+func (g *Game) Update() {
+	g.Mu.Lock()
+	defer g.Mu.Unlock()
+
+	g.update()
+}
 
-	// Collision avec les raquettes
-	// Raquette gauche (Player 1)
-	if g.Ball.X <= PaddleWidth && g.Ball.Y+BallSize >= g.Player1.Position && g.Ball.Y <= g.Player1.Position+PaddleHeight {
-		// Calculer la position relative de collision sur la raquette (de -0.5 à 0.5)
-		relativeIntersection := (g.Player1.Position + PaddleHeight/2 - g.Ball.Y) / (PaddleHeight / 2)
-		// Calculer l'angle en fonction de la position d'impact
-		bounceAngle := float64(relativeIntersection) * math.Pi / 4 // -π/4 à π/4
+// update avance le jeu d'un tick (le verrou doit être détenu)
+func (g *Game) update() {
+	g.Tick++
 
-		g.Ball.VelocityX = float32(BallSpeed * math.Cos(bounceAngle))
-		g.Ball.VelocityY = float32(-BallSpeed * math.Sin(bounceAngle))
+	// Les raquettes se déplacent même avant le début de la partie
+	g.applyInputs()
+
+	if !g.IsRunning {
+		return
 	}
 
-	// Raquette droite (Player 2)
-	if g.Ball.X >= GameWidth-PaddleWidth-BallSize && g.Ball.Y+BallSize >= g.Player2.Position && g.Ball.Y <= g.Player2.Position+PaddleHeight {
-		// Calculer la position relative de collision sur la raquette (de -0.5 à 0.5)
-		relativeIntersection := (g.Player2.Position + PaddleHeight/2 - g.Ball.Y) / (PaddleHeight / 2)
-		// Calculer l'angle en fonction de la position d'impact
-		bounceAngle := float64(relativeIntersection) * math.Pi / 4 // -π/4 à π/4
+	// Mémoriser la balle avant ce tick pour pouvoir le rejouer
+	g.history[g.Tick%HistorySize] = Frame{Tick: g.Tick, Ball: g.Ball}
 
-		g.Ball.VelocityX = float32(-BallSpeed * math.Cos(bounceAngle))
-		g.Ball.VelocityY = float32(-BallSpeed * math.Sin(bounceAngle))
+	// Une balle qui dépasse une raquette n'est pas perdue tout de suite : la
+	// décision attend que le joueur ait vu ce tick (voir resolveMiss).
+	passed := g.sweepBall(TickSeconds)
+	for side := range passed {
+		if passed[side] && g.edges[side].state == edgeClear {
+			g.edges[side] = edge{state: edgePending, tick: g.Tick}
+		}
 	}
 
+	g.resolveMiss(0, &g.Player1)
+	g.resolveMiss(1, &g.Player2)
+
 	// Vérifier si un joueur a marqué
-	if g.Ball.X <= 0 {
+	if g.Ball.X <= 0 && g.edges[0].state != edgePending {
 		// Player 2 marque
 		g.Player2.Score++
-		g.ResetBall()
-	} else if g.Ball.X >= GameWidth {
+		g.resetBall()
+	} else if g.Ball.X >= GameWidth && g.edges[1].state != edgePending {
 		// Player 1 marque
 		g.Player1.Score++
-		g.ResetBall()
+		g.resetBall()
+	}
+}
+
+// sweepBall avance la balle de dt secondes par balayage continu : le trajet
+// est découpé aux instants exacts de contact avec les murs et la face des
+// raquettes, si bien qu'aucun obstacle n'est traversé quelle que soit la
+// vitesse ou la durée du tick. Retourne les côtés (0: gauche, 1: droite) où
+// la balle a franchi la ligne de raquette sans la toucher.
+func (g *Game) sweepBall(dt float32) (passed [2]bool) {
+	const (
+		leftLine  = PaddleWidth
+		rightLine = GameWidth - PaddleWidth - BallSize
+		floor     = GameHeight - BallSize
+	)
+
+	b := &g.Ball
+	var crossed [2]bool // Ligne de raquette déjà traitée pendant ce balayage
+	for i := 0; i < maxSweepEvents && dt > 0; i++ {
+		// Chercher le premier contact horizontal et vertical dans le temps
+		// restant ; une balle posée sur une ligne la franchit encore
+		tx, horizontal := dt, sweepNone
+		if b.VelocityX < 0 && b.X >= leftLine && !crossed[0] {
+			if tc := (leftLine - b.X) / b.VelocityX; tc <= tx {
+				tx, horizontal = tc, sweepLeft
+			}
+		} else if b.VelocityX > 0 && b.X <= rightLine && !crossed[1] {
+			if tc := (rightLine - b.X) / b.VelocityX; tc <= tx {
+				tx, horizontal = tc, sweepRight
+			}
+		}
+		ty, vertical := dt, sweepNone
+		if b.VelocityY < 0 && b.Y >= 0 {
+			if tc := -b.Y / b.VelocityY; tc <= ty {
+				ty, vertical = tc, sweepTop
+			}
+		} else if b.VelocityY > 0 && b.Y <= floor {
+			if tc := (floor - b.Y) / b.VelocityY; tc <= ty {
+				ty, vertical = tc, sweepBottom
+			}
+		}
+
+		// Des contacts simultanés (balle arrivant dans un coin) sont tous traités
+		t := min(tx, ty)
+		if tx > t {
+			horizontal = sweepNone
+		}
+		if ty > t {
+			vertical = sweepNone
+		}
+
+		b.X += b.VelocityX * t
+		b.Y += b.VelocityY * t
+		dt -= t
+
+		// Le mur d'abord : un rebond sur la raquette fixe la nouvelle vitesse
+		switch vertical {
+		case sweepTop:
+			b.Y = 0
+			b.VelocityY = -b.VelocityY
+		case sweepBottom:
+			b.Y = floor
+			b.VelocityY = -b.VelocityY
+		}
+
+		switch horizontal {
+		case sweepLeft:
+			crossed[0] = true
+			b.X = leftLine
+			if g.overlaps(b.Y, &g.Player1) {
+				g.bounceLeft()
+			} else {
+				passed[0] = true
+			}
+		case sweepRight:
+			crossed[1] = true
+			b.X = rightLine
+			if g.overlaps(b.Y, &g.Player2) {
+				g.bounceRight()
+			} else {
+				passed[1] = true
+			}
+		}
+	}
+	return passed
+}
+
+// overlaps indique si une balle à la hauteur ballY touche la raquette
+func (g *Game) overlaps(ballY float32, p *Player) bool {
+	return ballY+BallSize >= p.Position && ballY <= p.Position+PaddleHeight
+}
+
+// bounceAngle calcule l'angle de rebond selon la position d'impact sur la raquette
+func bounceAngle(ballY float32, p *Player) float64 {
+	// Calculer la position relative de collision sur la raquette (de -0.5 à 0.5)
+	relativeIntersection := (p.Position + PaddleHeight/2 - ballY) / (PaddleHeight / 2)
+	return float64(relativeIntersection) * math.Pi / 4 // -π/4 à π/4
+}
+
+// bounceLeft renvoie la balle depuis la raquette gauche
+func (g *Game) bounceLeft() {
+	angle := bounceAngle(g.Ball.Y, &g.Player1)
+	g.Ball.VelocityX = float32(BallSpeed * math.Cos(angle))
+	g.Ball.VelocityY = float32(-BallSpeed * math.Sin(angle))
+	g.edges[0] = edge{}
+}
+
+// bounceRight renvoie la balle depuis la raquette droite
+func (g *Game) bounceRight() {
+	angle := bounceAngle(g.Ball.Y, &g.Player2)
+	g.Ball.VelocityX = float32(-BallSpeed * math.Cos(angle))
+	g.Ball.VelocityY = float32(-BallSpeed * math.Sin(angle))
+	g.edges[1] = edge{}
+}
+
+// resolveMiss décide du sort d'une balle passée hors d'une raquette.
+// Dès que le joueur a envoyé une entrée après avoir vu le tick du passage,
+// ce tick est rejoué depuis l'historique avec la raquette d'avant cette
+// entrée, c'est-à-dire où le joueur l'avait amenée sans encore voir la
+// balle passer. Si la balle est renvoyée, les ticks écoulés depuis sont
+// rejoués. Sans nouvelle du joueur après MaxRewindTicks, le point est perdu.
+func (g *Game) resolveMiss(side int, p *Player) {
+	e := &g.edges[side]
+	if e.state != edgePending {
+		return
+	}
+
+	elapsed := g.Tick - e.tick
+	if !e.seen {
+		if elapsed >= MaxRewindTicks {
+			e.state = edgeMissed
+		}
+		return
+	}
+
+	frame := g.history[e.tick%HistorySize]
+	if frame.Tick != e.tick {
+		e.state = edgeMissed
+		return
+	}
+
+	current, position := g.Ball, p.Position
+	g.Ball, p.Position = frame.Ball, e.paddle
+	missed := g.sweepBall(TickSeconds)[side]
+	p.Position = position
+	if missed {
+		g.Ball = current
+		e.state = edgeMissed
+		return
+	}
+	for i := uint32(0); i < elapsed; i++ {
+		g.sweepBall(TickSeconds)
 	}
 }
 
@@ -0,0 +1,107 @@
+package game
+
+import (
+	"testing"
+	"time"
+)
+
+func TestAdvanceCoarseWakeKeepsTickRate(t *testing.T) {
+	for _, wakeHz := range []int{60, 30, 10, 4} {
+		g := NewGame()
+		g.WakeInterval = time.Second / time.Duration(wakeHz)
+
+		steps := 0
+		for i := 0; i < wakeHz; i++ {
+			steps += g.Advance(g.WakeInterval)
+		}
+		// Une seconde simulée, au tick d'arrondi près
+		if steps < TickRate-1 || steps > TickRate {
+			t.Errorf("réveil à %d Hz: %d ticks en 1 s, attendu %d", wakeHz, steps, TickRate)
+		}
+	}
+}
+
+func TestAdvanceDropsStalls(t *testing.T) {
+	g := NewGame()
+	g.WakeInterval = time.Second / 10
+
+	// Après un blocage de 2 s, seul un réveil plus une marge est rattrapé
+	perWake := TickRate / 10
+	if steps := g.Advance(2 * time.Second); steps < perWake || steps > perWake+MaxCatchUpTicks {
+		t.Errorf("%d ticks rattrapés après un blocage, attendu entre %d et %d", steps, perWake, perWake+MaxCatchUpTicks)
+	}
+}
+
+func TestSweepCornerHitsPaddle(t *testing.T) {
+	// La balle atteint le mur du haut et la ligne de la raquette gauche au
+	// même instant : le contact avec la raquette doit être testé
+	g := NewGame()
+	g.Player1.Position = 0
+	g.Ball = Ball{X: 16, Y: 1, VelocityX: -300, VelocityY: -300}
+
+	passed := g.sweepBall(TickSeconds)
+	if passed[0] || g.Ball.VelocityX <= 0 {
+		t.Fatalf("balle non renvoyée: passed=%v, balle %+v", passed, g.Ball)
+	}
+	if g.Ball.X < PaddleWidth || g.Ball.Y < 0 {
+		t.Errorf("balle sortie du terrain: %+v", g.Ball)
+	}
+}
+
+func TestSweepCornerMissIsReported(t *testing.T) {
+	// Même trajectoire, raquette ailleurs : le passage doit être signalé
+	// pour que la compensation de latence puisse en décider
+	g := NewGame()
+	g.Player1.Position = GameHeight - PaddleHeight
+	g.Ball = Ball{X: 16, Y: 1, VelocityX: -300, VelocityY: -300}
+
+	if passed := g.sweepBall(TickSeconds); !passed[0] {
+		t.Fatalf("passage non signalé, balle %+v", g.Ball)
+	}
+	if g.Ball.VelocityY <= 0 {
+		t.Errorf("rebond sur le mur perdu: %+v", g.Ball)
+	}
+}
+
+// missSetup lance une partie où la balle dépasse la raquette gauche au
+// prochain tick, la raquette étant 4 px trop bas (moins d'un pas)
+func missSetup(t *testing.T) (*Game, uint32) {
+	t.Helper()
+	g := NewGame()
+	g.start()
+	g.Player1.Position = 300 + BallSize + 4
+	g.Ball = Ball{X: PaddleWidth + 3, Y: 300, VelocityX: -BallSpeed}
+
+	g.update()
+	if g.edges[0].state != edgePending {
+		t.Fatalf("balle non passée: %+v", g.Ball)
+	}
+	return g, g.Tick
+}
+
+func TestRewindIgnoresReactionToPass(t *testing.T) {
+	g, passTick := missSetup(t)
+
+	// Entrée décidée en voyant la balle passer : elle ne doit pas la rattraper
+	g.SetInput(1, -1, 1, passTick)
+	for i := 0; i < MaxRewindTicks && g.Player2.Score == 0; i++ {
+		g.update()
+	}
+	if g.Player2.Score != 1 {
+		t.Fatalf("balle rattrapée grâce à une entrée postérieure au passage: %+v", g.Ball)
+	}
+}
+
+func TestRewindHitsWithPaddleBeforeReaction(t *testing.T) {
+	g, passTick := missSetup(t)
+
+	// Raquette amenée à portée avant de voir le passage, puis arrêt décidé
+	// en le voyant : le tick du passage est rejoué avec la raquette à portée
+	g.SetInput(1, -1, 1, passTick-1)
+	g.update()
+	g.SetInput(1, 0, 2, passTick)
+	g.update()
+	if g.Ball.VelocityX <= 0 || g.Player2.Score != 0 {
+		t.Fatalf("balle non renvoyée après rejeu: %+v, score %d", g.Ball, g.Player2.Score)
+	}
+}
@@ -0,0 +1,142 @@
+package game
+
+import (
+	"bytes"
+	"encoding/json"
+	"flag"
+	"math"
+	"os"
+	"path/filepath"
+	"testing"
+)
+
+// Les trajectoires de testdata/trajectories.json sont aussi rejouées par le
+// simulateur Python (client-py/test_lag_sim.py) : les deux physiques ne
+// peuvent pas diverger. Après un changement voulu de la physique :
+//
+//	go test ./pkg/game -run TestTrajectories -update
+var update = flag.Bool("update", false, "réécrire les trajectoires attendues")
+
+var trajectoriesPath = filepath.Join("testdata", "trajectories.json")
+
+// trajectoryInput est une entrée appliquée au tick indiqué
+type trajectoryInput struct {
+	Tick      uint32 `json:"tick"`
+	Player    byte   `json:"player"`
+	Direction int8   `json:"direction"`
+	Seq       uint32 `json:"seq"`
+	ViewTick  uint32 `json:"view_tick"`
+}
+
+// trajectory décrit une situation de départ et les états attendus après
+// chaque tick : X, Y, VX, VY de la balle, raquettes et scores. Le scénario
+// s'arrête au premier point, dont la vitesse de relance aléatoire est notée 0.
+type trajectory struct {
+	Name    string            `json:"name"`
+	Ball    [4]float32        `json:"ball"`
+	Paddles [2]float32        `json:"paddles"`
+	Ticks   int               `json:"ticks"`
+	Inputs  []trajectoryInput `json:"inputs"`
+	Frames  [][8]float64      `json:"frames,omitempty"`
+}
+
+func (tr *trajectory) run() [][8]float64 {
+	g := NewGame()
+	g.start()
+	g.Ball = Ball{X: tr.Ball[0], Y: tr.Ball[1], VelocityX: tr.Ball[2], VelocityY: tr.Ball[3]}
+	g.Player1.Position, g.Player2.Position = tr.Paddles[0], tr.Paddles[1]
+
+	var frames [][8]float64
+	for g.Tick < uint32(tr.Ticks) {
+		for _, in := range tr.Inputs {
+			if in.Tick == g.Tick+1 {
+				g.SetInput(in.Player, in.Direction, in.Seq, in.ViewTick)
+			}
+		}
+		scores := g.Player1.Score + g.Player2.Score
+		g.update()
+
+		b := g.Ball
+		scored := g.Player1.Score+g.Player2.Score != scores
+		if scored {
+			b.VelocityX, b.VelocityY = 0, 0
+		}
+		frames = append(frames, [8]float64{
+			float64(b.X), float64(b.Y), float64(b.VelocityX), float64(b.VelocityY),
+			float64(g.Player1.Position), float64(g.Player2.Position),
+			float64(g.Player1.Score), float64(g.Player2.Score),
+		})
+		if scored {
+			break
+		}
+	}
+	return frames
+}
+
+// writeTrajectories écrit le fichier avec un état par ligne
+func writeTrajectories(t *testing.T, trajectories []trajectory) {
+	var b bytes.Buffer
+	b.WriteString("[\n")
+	for i, tr := range trajectories {
+		frames := tr.Frames
+		tr.Frames = nil
+		head, err := json.Marshal(tr)
+		if err != nil {
+			t.Fatal(err)
+		}
+		b.Write(head[:len(head)-1])
+		b.WriteString(`,"frames":[`)
+		for j, frame := range frames {
+			line, _ := json.Marshal(frame)
+			b.WriteString("\n    ")
+			b.Write(line)
+			if j < len(frames)-1 {
+				b.WriteString(",")
+			}
+		}
+		b.WriteString("]}")
+		if i < len(trajectories)-1 {
+			b.WriteString(",")
+		}
+		b.WriteString("\n")
+	}
+	b.WriteString("]\n")
+	if err := os.WriteFile(trajectoriesPath, b.Bytes(), 0o644); err != nil {
+		t.Fatal(err)
+	}
+}
+
+func TestTrajectories(t *testing.T) {
+	data, err := os.ReadFile(trajectoriesPath)
+	if err != nil {
+		t.Fatal(err)
+	}
+	var trajectories []trajectory
+	if err := json.Unmarshal(data, &trajectories); err != nil {
+		t.Fatal(err)
+	}
+
+	if *update {
+		for i := range trajectories {
+			trajectories[i].Frames = trajectories[i].run()
+		}
+		writeTrajectories(t, trajectories)
+		return
+	}
+
+	for _, tr := range trajectories {
+		t.Run(tr.Name, func(t *testing.T) {
+			got := tr.run()
+			if len(got) != len(tr.Frames) {
+				t.Fatalf("%d ticks simulés, %d attendus", len(got), len(tr.Frames))
+			}
+			for i := range got {
+				for j := range got[i] {
+					if math.Abs(got[i][j]-tr.Frames[i][j]) > 1e-4 {
+						t.Fatalf("tick %d: %v, attendu %v", i+1, got[i], tr.Frames[i])
+					}
+				}
+			}
+		})
+	}
+}
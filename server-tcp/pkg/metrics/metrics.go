@@ -0,0 +1,315 @@
+package metrics
+
+import (
+	"bytes"
+	"fmt"
+	"math"
+	"net/http"
+	"sort"
+	"strconv"
+	"strings"
+	"sync"
+	"sync/atomic"
+)
+
+// Registry regroupe les métriques exposées au format texte de Prometheus
+type Registry struct {
+	mu      sync.Mutex
+	metrics []metric
+}
+
+// metric est une métrique capable de s'écrire au format texte
+type metric interface {
+	write(b *bytes.Buffer)
+}
+
+// desc décrit une famille de métriques
+type desc struct {
+	name string
+	help string
+	kind string
+}
+
+func (d *desc) writeHeader(b *bytes.Buffer) {
+	fmt.Fprintf(b, "# HELP %s %s\n# TYPE %s %s\n", d.name, d.help, d.name, d.kind)
+}
+
+// NewRegistry crée un registre vide
+func NewRegistry() *Registry {
+	return &Registry{}
+}
+
+func (r *Registry) register(m metric) {
+	r.mu.Lock()
+	r.metrics = append(r.metrics, m)
+	r.mu.Unlock()
+}
+
+// Counter crée un compteur
+func (r *Registry) Counter(name, help string) *Counter {
+	c := &Counter{desc: desc{name, help, "counter"}}
+	r.register(c)
+	return c
+}
+
+// CounterVec crée une famille de compteurs distingués par une étiquette
+func (r *Registry) CounterVec(name, help, label string) *CounterVec {
+	v := &CounterVec{desc: desc{name, help, "counter"}, label: label, children: make(map[string]*Counter)}
+	r.register(v)
+	return v
+}
+
+// Gauge crée une jauge
+func (r *Registry) Gauge(name, help string) *Gauge {
+	g := &Gauge{desc: desc{name, help, "gauge"}}
+	r.register(g)
+	return g
+}
+
+// GaugeFunc crée une jauge dont la valeur est lue à chaque collecte
+func (r *Registry) GaugeFunc(name, help string, fn func() float64) {
+	r.register(&gaugeFunc{desc: desc{name, help, "gauge"}, fn: fn})
+}
+
+// Histogram crée un histogramme ; buckets contient les bornes supérieures croissantes
+func (r *Registry) Histogram(name, help string, buckets []float64) *Histogram {
+	h := newHistogram(desc{name, help, "histogram"}, buckets)
+	r.register(h)
+	return h
+}
+
+// HistogramVec crée une famille d'histogrammes distingués par une étiquette
+func (r *Registry) HistogramVec(name, help, label string, buckets []float64) *HistogramVec {
+	v := &HistogramVec{desc: desc{name, help, "histogram"}, label: label, buckets: buckets, children: make(map[string]*Histogram)}
+	r.register(v)
+	return v
+}
+
+// Write produit l'ensemble des métriques au format texte
+func (r *Registry) Write(b *bytes.Buffer) {
+	r.mu.Lock()
+	metrics := r.metrics
+	r.mu.Unlock()
+
+	for _, m := range metrics {
+		m.write(b)
+	}
+}
+
+// Handler retourne le gestionnaire HTTP qui expose les métriques
+func (r *Registry) Handler() http.Handler {
+	return http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+		var b bytes.Buffer
+		r.Write(&b)
+		w.Header().Set("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+		w.Write(b.Bytes())
+	})
+}
+
+// Counter est un compteur croissant, utilisable sans verrou
+type Counter struct {
+	desc
+	value atomic.Uint64
+}
+
+// Add incrémente le compteur de n
+func (c *Counter) Add(n uint64) {
+	c.value.Add(n)
+}
+
+// Inc incrémente le compteur de 1
+func (c *Counter) Inc() {
+	c.value.Add(1)
+}
+
+func (c *Counter) write(b *bytes.Buffer) {
+	c.writeHeader(b)
+	fmt.Fprintf(b, "%s %d\n", c.name, c.value.Load())
+}
+
+// CounterVec est une famille de compteurs à une étiquette
+type CounterVec struct {
+	desc
+	label    string
+	mu       sync.Mutex
+	children map[string]*Counter
+}
+
+// With retourne le compteur associé à une valeur d'étiquette
+func (v *CounterVec) With(value string) *Counter {
+	v.mu.Lock()
+	defer v.mu.Unlock()
+
+	c, ok := v.children[value]
+	if !ok {
+		c = &Counter{desc: v.desc}
+		v.children[value] = c
+	}
+	return c
+}
+
+func (v *CounterVec) write(b *bytes.Buffer) {
+	v.writeHeader(b)
+	for _, value := range v.values() {
+		fmt.Fprintf(b, "%s{%s} %d\n", v.name, labelPair(v.label, value), v.With(value).value.Load())
+	}
+}
+
+func (v *CounterVec) values() []string {
+	v.mu.Lock()
+	defer v.mu.Unlock()
+
+	values := make([]string, 0, len(v.children))
+	for value := range v.children {
+		values = append(values, value)
+	}
+	sort.Strings(values)
+	return values
+}
+
+// Gauge est une valeur qui monte et descend, utilisable sans verrou
+type Gauge struct {
+	desc
+	bits atomic.Uint64 // Bits d'un float64
+}
+
+// Set fixe la valeur de la jauge
+func (g *Gauge) Set(v float64) {
+	g.bits.Store(math.Float64bits(v))
+}
+
+// Add ajoute delta (éventuellement négatif) à la jauge
+func (g *Gauge) Add(delta float64) {
+	addFloat(&g.bits, delta)
+}
+
+func (g *Gauge) write(b *bytes.Buffer) {
+	g.writeHeader(b)
+	fmt.Fprintf(b, "%s %s\n", g.name, formatFloat(math.Float64frombits(g.bits.Load())))
+}
+
+// gaugeFunc est une jauge calculée au moment de la collecte
+type gaugeFunc struct {
+	desc
+	fn func() float64
+}
+
+func (g *gaugeFunc) write(b *bytes.Buffer) {
+	g.writeHeader(b)
+	fmt.Fprintf(b, "%s %s\n", g.name, formatFloat(g.fn()))
+}
+
+// Histogram compte des observations par intervalles, utilisable sans verrou
+type Histogram struct {
+	desc
+	buckets []float64
+	counts  []atomic.Uint64 // Non cumulés, un de plus que buckets pour +Inf
+	count   atomic.Uint64
+	sum     atomic.Uint64 // Bits d'un float64
+}
+
+func newHistogram(d desc, buckets []float64) *Histogram {
+	return &Histogram{desc: d, buckets: buckets, counts: make([]atomic.Uint64, len(buckets)+1)}
+}
+
+// Observe enregistre une valeur
+func (h *Histogram) Observe(v float64) {
+	h.counts[sort.SearchFloat64s(h.buckets, v)].Add(1)
+	h.count.Add(1)
+	addFloat(&h.sum, v)
+}
+
+func (h *Histogram) write(b *bytes.Buffer) {
+	h.writeHeader(b)
+	h.writeSamples(b, "")
+}
+
+// writeSamples écrit les intervalles cumulés, la somme et le nombre
+// d'observations ; labels précède l'étiquette le
+func (h *Histogram) writeSamples(b *bytes.Buffer, labels string) {
+	var cumulative uint64
+	for i, upper := range h.buckets {
+		cumulative += h.counts[i].Load()
+		fmt.Fprintf(b, "%s_bucket{%sle=\"%s\"} %d\n", h.name, labels, formatFloat(upper), cumulative)
+	}
+	cumulative += h.counts[len(h.buckets)].Load()
+	fmt.Fprintf(b, "%s_bucket{%sle=\"+Inf\"} %d\n", h.name, labels, cumulative)
+
+	braces := ""
+	if labels != "" {
+		braces = "{" + strings.TrimSuffix(labels, ",") + "}"
+	}
+	fmt.Fprintf(b, "%s_sum%s %s\n", h.name, braces, formatFloat(math.Float64frombits(h.sum.Load())))
+	fmt.Fprintf(b, "%s_count%s %d\n", h.name, braces, h.count.Load())
+}
+
+// HistogramVec est une famille d'histogrammes à une étiquette
+type HistogramVec struct {
+	desc
+	label    string
+	buckets  []float64
+	mu       sync.Mutex
+	children map[string]*Histogram
+}
+
+// With retourne l'histogramme associé à une valeur d'étiquette
+func (v *HistogramVec) With(value string) *Histogram {
+	v.mu.Lock()
+	defer v.mu.Unlock()
+
+	h, ok := v.children[value]
+	if !ok {
+		h = newHistogram(v.desc, v.buckets)
+		v.children[value] = h
+	}
+	return h
+}
+
+func (v *HistogramVec) write(b *bytes.Buffer) {
+	v.writeHeader(b)
+
+	v.mu.Lock()
+	values := make([]string, 0, len(v.children))
+	for value := range v.children {
+		values = append(values, value)
+	}
+	v.mu.Unlock()
+	sort.Strings(values)
+
+	for _, value := range values {
+		v.With(value).writeSamples(b, labelPair(v.label, value)+",")
+	}
+}
+
+// ExponentialBuckets retourne n bornes commençant à start et multipliées par factor
+func ExponentialBuckets(start, factor float64, n int) []float64 {
+	buckets := make([]float64, n)
+	for i := range buckets {
+		buckets[i] = start
+		start *= factor
+	}
+	return buckets
+}
+
+// addFloat ajoute delta au float64 dont bits contient la représentation
+func addFloat(bits *atomic.Uint64, delta float64) {
+	for {
+		old := bits.Load()
+		if bits.CompareAndSwap(old, math.Float64bits(math.Float64frombits(old)+delta)) {
+			return
+		}
+	}
+}
+
+var labelEscaper = strings.NewReplacer(`\`, `\\`, `"`, `\"`, "\n", `\n`)
+
+func labelPair(label, value string) string {
+	return label + `="` + labelEscaper.Replace(value) + `"`
+}
+
+func formatFloat(v float64) string {
+	if math.IsInf(v, 1) {
+		return "+Inf"
+	}
+	return strconv.FormatFloat(v, 'g', -1, 64)
+}
@@ -0,0 +1,53 @@
+package network
+
+import (
+	"log"
+	"net"
+
+	"pong-game/pkg/protocol"
+)
+
+// MaxPlayers est le nombre de joueurs acceptés par le serveur
+const MaxPlayers = 2
+
+// serveDiscovery répond aux requêtes de découverte UDP reçues sur la même
+// adresse que le serveur TCP. Chaque DiscoveryPing reçoit un DiscoveryPong
+// contenant le port TCP et le nombre de places libres ; le client mesure le
+// temps d'aller-retour pour choisir le serveur le plus proche.
+func (s *Server) serveDiscovery(conn net.PacketConn, tcpPort uint16) {
+	buf := make([]byte, 512)
+	for {
+		n, addr, err := conn.ReadFrom(buf)
+		if err != nil {
+			if !s.isRunning {
+				return
+			}
+			log.Printf("Erreur de lecture de découverte: %v", err)
+			continue
+		}
+
+		// Ignorer tout ce qui n'est pas un DiscoveryPing valide
+		header, err := protocol.DecodeHeader(buf[:n])
+		if err != nil || header.Type != protocol.MsgTypeDiscoveryPing {
+			continue
+		}
+		ping, err := protocol.DecodeDiscoveryPing(buf[protocol.HeaderSize:n])
+		if err != nil {
+			continue
+		}
+
+		s.clientsMutex.Lock()
+		players := len(s.clients)
+		s.clientsMutex.Unlock()
+
+		pong := &protocol.DiscoveryPong{
+			Nonce:     ping.Nonce,
+			Port:      tcpPort,
+			Players:   byte(players),
+			FreeSlots: byte(MaxPlayers - players),
+		}
+		if _, err := conn.WriteTo(protocol.EncodeDiscoveryPong(pong), addr); err != nil {
+			log.Printf("Erreur d'envoi de la réponse de découverte: %v", err)
+		}
+	}
+}
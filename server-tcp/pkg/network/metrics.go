@@ -0,0 +1,81 @@
+package network
+
+import (
+	"fmt"
+	"net"
+	"net/http"
+	"strconv"
+
+	"pong-game/pkg/metrics"
+	"pong-game/pkg/protocol"
+)
+
+// Intervalles des histogrammes de durée, de 50 µs à environ 3,3 s
+var durationBuckets = metrics.ExponentialBuckets(0.00005, 2, 17)
+
+// serverMetrics regroupe les métriques exposées par le serveur
+type serverMetrics struct {
+	registry *metrics.Registry
+
+	ticks        *metrics.Counter
+	tickDuration *metrics.Histogram
+	tickOverrun  *metrics.Histogram
+	clients      *metrics.Gauge
+	writeLatency *metrics.HistogramVec
+	bytesSent    *metrics.CounterVec
+	messages     *metrics.CounterVec
+}
+
+// newServerMetrics crée les métriques du serveur
+func newServerMetrics(s *Server) *serverMetrics {
+	r := metrics.NewRegistry()
+	m := &serverMetrics{
+		registry: r,
+		ticks: r.Counter("pong_ticks_total",
+			"Ticks de simulation exécutés"),
+		tickDuration: r.Histogram("pong_tick_duration_seconds",
+			"Durée d'un passage de la boucle de jeu (simulation et mise en file de l'état)", durationBuckets),
+		tickOverrun: r.Histogram("pong_tick_overrun_seconds",
+			"Retard du réveil de la boucle de jeu sur la période prévue", durationBuckets),
+		clients: r.Gauge("pong_connected_clients",
+			"Clients connectés"),
+		writeLatency: r.HistogramVec("pong_client_write_seconds",
+			"Durée des écritures sur le socket d'un client", "player", durationBuckets),
+		bytesSent: r.CounterVec("pong_client_sent_bytes_total",
+			"Octets envoyés à un client", "player"),
+		messages: r.CounterVec("pong_messages_received_total",
+			"Messages reçus des clients par type", "type"),
+	}
+	r.GaugeFunc("pong_broadcast_queue_depth", "Messages en attente dans la file de diffusion", func() float64 {
+		return float64(len(s.broadcastChan))
+	})
+	return m
+}
+
+// messageName retourne le nom d'un type de message pour les métriques
+func messageName(msgType byte) string {
+	if name, ok := protocol.MessageNames[msgType]; ok {
+		return name
+	}
+	return "unknown"
+}
+
+// ServeMetrics expose les métriques au format texte de Prometheus sur
+// http://address/metrics
+func (s *Server) ServeMetrics(address string) error {
+	listener, err := net.Listen("tcp", address)
+	if err != nil {
+		return fmt.Errorf("erreur lors du démarrage des métriques: %v", err)
+	}
+	s.metricsListener = listener
+
+	mux := http.NewServeMux()
+	mux.Handle("/metrics", s.metrics.registry.Handler())
+	go http.Serve(listener, mux)
+	return nil
+}
+
+// playerLabel retourne l'étiquette d'un client dans les métriques
+func (c *Client) playerLabel() string {
+	return strconv.Itoa(int(c.playerID))
+}
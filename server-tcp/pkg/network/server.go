@@ -1,6 +1,7 @@
 package network
 
 import (
+	"bufio"
 	"fmt"
 	"io"
 	"log"
@@ -9,6 +10,7 @@ import (
 	"time"
 
 	"pong-game/pkg/game"
+	"pong-game/pkg/metrics"
 	"pong-game/pkg/protocol"
 )
 
@@ -17,28 +19,46 @@ type Client struct {
 	conn     net.Conn
 	playerID byte
 	server   *Server
+
+	// Abonnement aux états de jeu (modifié par la goroutine du client)
+	subMu         sync.Mutex
+	stateInterval time.Duration // 0: chaque tick
+	stateOnChange bool
+
+	// Suivi des envois (utilisé uniquement par broadcastLoop)
+	nextState time.Time
+	lastState *visibleState
+
+	// Métriques propres au client
+	writeLatency *metrics.Histogram
+	bytesSent    *metrics.Counter
 }
 
 // Server gère les connexions clients et l'état du jeu
 type Server struct {
-	game           *game.Game
-	clients        map[byte]*Client // Clé: playerID
-	listener       net.Listener
-	clientsMutex   sync.Mutex
-	broadcastChan  chan []byte
-	shutdownChan   chan struct{}
-	isRunning      bool
+	game            *game.Game
+	clients         map[byte]*Client // Clé: playerID
+	listener        net.Listener
+	discoveryConn   net.PacketConn
+	metricsListener net.Listener
+	metrics         *serverMetrics
+	clientsMutex    sync.Mutex
+	broadcastChan   chan []byte
+	shutdownChan    chan struct{}
+	isRunning       bool
 }
 
 // NewServer crée un nouveau serveur
 func NewServer(address string) *Server {
-	return &Server{
+	s := &Server{
 		game:          game.NewGame(),
 		clients:       make(map[byte]*Client),
 		broadcastChan: make(chan []byte, 100),
 		shutdownChan:  make(chan struct{}),
 		isRunning:     false,
 	}
+	s.metrics = newServerMetrics(s)
+	return s
 }
 
 // Start démarre le serveur
@@ -51,6 +71,15 @@ func (s *Server) Start(address string) error {
 
 	s.isRunning = true
 
+	// Répondre aux requêtes de découverte UDP sur la même adresse
+	tcpAddr := s.listener.Addr().(*net.TCPAddr)
+	s.discoveryConn, err = net.ListenPacket("udp", tcpAddr.String())
+	if err != nil {
+		log.Printf("Découverte UDP indisponible: %v", err)
+	} else {
+		go s.serveDiscovery(s.discoveryConn, uint16(tcpAddr.Port))
+	}
+
 	// Goroutine pour la boucle de jeu
 	go s.gameLoop()
 
@@ -80,6 +109,12 @@ func (s *Server) Stop() {
 	if s.listener != nil {
 		s.listener.Close()
 	}
+	if s.discoveryConn != nil {
+		s.discoveryConn.Close()
+	}
+	if s.metricsListener != nil {
+		s.metricsListener.Close()
+	}
 	
 	// Fermer toutes les connexions clients
 	s.clientsMutex.Lock()
@@ -89,19 +124,37 @@ func (s *Server) Stop() {
 	s.clientsMutex.Unlock()
 }
 
-// gameLoop met à jour l'état du jeu à intervalles réguliers
+// gameLoop met à jour l'état du jeu à intervalles réguliers. La simulation
+// avance par pas fixes de game.TickRate selon le temps réellement écoulé ;
+// les états sont diffusés au plus à game.BroadcastRate.
 func (s *Server) gameLoop() {
-	ticker := time.NewTicker(s.game.UpdateRate)
+	interval := s.game.WakeInterval
+	ticker := time.NewTicker(interval)
 	defer ticker.Stop()
 
+	last := time.Now()
+	lastWake := last
 	for {
 		select {
-		case <-ticker.C:
+		case now := <-ticker.C:
+			wake := time.Now()
+			if overrun := wake.Sub(lastWake) - interval; overrun > 0 {
+				s.metrics.tickOverrun.Observe(overrun.Seconds())
+			} else {
+				s.metrics.tickOverrun.Observe(0)
+			}
+			lastWake = wake
+
 			// Mettre à jour l'état du jeu
-			s.game.Update()
+			steps := s.game.Advance(now.Sub(last))
+			last = now
+			s.metrics.ticks.Add(uint64(steps))
 			
-			// Préparer l'état du jeu à envoyer
-			s.broadcastGameState()
+			// Préparer l'état du jeu à envoyer s'il a changé
+			if steps > 0 {
+				s.broadcastGameState()
+			}
+			s.metrics.tickDuration.Observe(time.Since(wake).Seconds())
 		case <-s.shutdownChan:
 			return
 		}
@@ -144,23 +197,28 @@ func (s *Server) handleClient(conn net.Conn) {
 		playerID: playerID,
 		server:   s,
 	}
+	client.writeLatency = s.metrics.writeLatency.With(client.playerLabel())
+	client.bytesSent = s.metrics.bytesSent.With(client.playerLabel())
 	s.clients[playerID] = client
 	s.clientsMutex.Unlock()
+	s.metrics.clients.Add(1)
 
 	// Envoyer l'ID du joueur au client
 	playerJoin := &protocol.PlayerJoin{
 		PlayerID: playerID,
 	}
 	joinMsg := protocol.EncodePlayerJoin(playerJoin)
-	conn.Write(joinMsg)
+	client.write(joinMsg)
 
-	// Buffer pour lire les messages
+	// Lecture tamponnée : un flot de petits messages (mouvements) ne coûte
+	// pas deux appels système par message
+	reader := bufio.NewReader(conn)
 	headerBuf := make([]byte, protocol.HeaderSize)
 	
 	// Boucle de lecture des messages
 	for {
 		// Lire l'en-tête du message
-		_, err := io.ReadFull(conn, headerBuf)
+		_, err := io.ReadFull(reader, headerBuf)
 		if err != nil {
 			if err == io.EOF {
 				log.Printf("Client déconnecté: %s", conn.RemoteAddr())
@@ -179,7 +237,7 @@ func (s *Server) handleClient(conn net.Conn) {
 		
 		// Lire le corps du message
 		msgBuf := make([]byte, header.Length)
-		_, err = io.ReadFull(conn, msgBuf)
+		_, err = io.ReadFull(reader, msgBuf)
 		if err != nil {
 			log.Printf("Erreur de lecture du corps du message: %v", err)
 			break
@@ -189,16 +247,20 @@ func (s *Server) handleClient(conn net.Conn) {
 		client.handleMessage(header.Type, msgBuf)
 	}
 	
-	// Déconnexion du client
+	// Déconnexion du client : libérer l'ID avant qu'un autre client le reprenne
+	s.game.ResetPlayer(playerID)
 	s.clientsMutex.Lock()
 	delete(s.clients, playerID)
 	s.clientsMutex.Unlock()
+	s.metrics.clients.Add(-1)
 	conn.Close()
 	log.Printf("Client %d déconnecté: %s", playerID, conn.RemoteAddr())
 }
 
 // handleMessage traite un message reçu d'un client
 func (c *Client) handleMessage(msgType byte, data []byte) {
+	c.server.metrics.messages.With(messageName(msgType)).Inc()
+
 	switch msgType {
 	case protocol.MsgTypePlayerMove:
 		// Décoder le mouvement
@@ -214,8 +276,8 @@ func (c *Client) handleMessage(msgType byte, data []byte) {
 			return
 		}
 		
-		// Appliquer le mouvement
-		c.server.game.MovePaddle(move.PlayerID, move.Direction)
+		// Enregistrer la direction, appliquée au prochain tick
+		c.server.game.SetInput(move.PlayerID, move.Direction, move.Seq, move.ViewTick)
 	
 	case protocol.MsgTypePlayerReady:
 		// Décoder l'état de préparation
@@ -236,7 +298,80 @@ func (c *Client) handleMessage(msgType byte, data []byte) {
 		
 		// Diffuser l'état de préparation à tous les clients
 		c.server.broadcastPlayerReady(ready)
+
+	case protocol.MsgTypeSubscribe:
+		// Décoder l'abonnement
+		sub, err := protocol.DecodeSubscribe(data)
+		if err != nil {
+			log.Printf("Erreur de décodage de l'abonnement: %v", err)
+			return
+		}
+
+		c.setSubscription(sub)
+	}
+}
+
+// setSubscription enregistre la fréquence d'états demandée par le client
+func (c *Client) setSubscription(sub *protocol.Subscribe) {
+	c.subMu.Lock()
+	defer c.subMu.Unlock()
+
+	c.stateInterval = 0
+	if sub.RateHz > 0 {
+		c.stateInterval = time.Second / time.Duration(sub.RateHz)
 	}
+	c.stateOnChange = sub.OnChange == 1
+}
+
+// visibleState regroupe les champs d'un état de jeu visibles à l'écran ;
+// les séquences acquittées et le tick, qui changent à chaque tick dès
+// qu'un joueur envoie des entrées, n'en font pas partie
+type visibleState struct {
+	BallX, BallY       float32
+	Player1Y, Player2Y float32
+	Player1Score       uint16
+	Player2Score       uint16
+	IsRunning          byte
+}
+
+// visibleFields extrait les champs visibles d'un état de jeu
+func visibleFields(state *protocol.GameState) visibleState {
+	return visibleState{
+		BallX:        state.BallX,
+		BallY:        state.BallY,
+		Player1Y:     state.Player1Y,
+		Player2Y:     state.Player2Y,
+		Player1Score: state.Player1Score,
+		Player2Score: state.Player2Score,
+		IsRunning:    state.IsRunning,
+	}
+}
+
+// wantsGameState indique si un état de jeu doit être envoyé au client
+// compte tenu de son abonnement
+func (c *Client) wantsGameState(visible visibleState, now time.Time) bool {
+	c.subMu.Lock()
+	interval, onChange := c.stateInterval, c.stateOnChange
+	c.subMu.Unlock()
+
+	if interval > 0 && now.Before(c.nextState) {
+		return false
+	}
+	if onChange && c.lastState != nil && *c.lastState == visible {
+		return false
+	}
+
+	if interval > 0 {
+		// Avancer d'un intervalle fixe pour conserver la fréquence moyenne
+		c.nextState = c.nextState.Add(interval)
+		if c.nextState.Before(now) {
+			c.nextState = now.Add(interval)
+		}
+	}
+	if onChange {
+		c.lastState = &visible
+	}
+	return true
 }
 
 // broadcastGameState envoie l'état actuel du jeu à tous les clients
@@ -252,6 +387,9 @@ func (s *Server) broadcastGameState() {
 		Player1Score: s.game.Player1.Score,
 		Player2Y:     s.game.Player2.Position,
 		Player2Score: s.game.Player2.Score,
+		Player1Seq:   s.game.Player1.LastSeq,
+		Player2Seq:   s.game.Player2.LastSeq,
+		Tick:         s.game.Tick,
 	}
 	
 	if s.game.IsRunning {
@@ -275,14 +413,38 @@ func (s *Server) broadcastPlayerReady(ready *protocol.PlayerReady) {
 }
 
 // sendToAllClients envoie un message à tous les clients connectés
+// Les états de jeu ne sont envoyés qu'aux clients dont l'abonnement le permet
 func (s *Server) sendToAllClients(data []byte) {
 	s.clientsMutex.Lock()
 	defer s.clientsMutex.Unlock()
 	
+	var visible visibleState
+	isState := data[0] == protocol.MsgTypeGameState
+	if isState {
+		state, err := protocol.DecodeGameState(data[protocol.HeaderSize:])
+		if err != nil {
+			log.Printf("Erreur de décodage de l'état du jeu: %v", err)
+			return
+		}
+		visible = visibleFields(state)
+	}
+	now := time.Now()
 	for _, client := range s.clients {
-		_, err := client.conn.Write(data)
+		if isState && !client.wantsGameState(visible, now) {
+			continue
+		}
+		err := client.write(data)
 		if err != nil {
 			log.Printf("Erreur d'envoi au client %d: %v", client.playerID, err)
 		}
 	}
 }
+
+// write envoie des données au client en mesurant la durée de l'écriture
+func (c *Client) write(data []byte) error {
+	start := time.Now()
+	n, err := c.conn.Write(data)
+	c.writeLatency.Observe(time.Since(start).Seconds())
+	c.bytesSent.Add(uint64(n))
+	return err
+}
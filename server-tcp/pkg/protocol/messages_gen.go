@@ -0,0 +1,306 @@
+// Code generated by protocol/generate.py from protocol/schema.json. DO NOT EDIT.
+
+package protocol
+
+import (
+	"encoding/binary"
+	"fmt"
+	"math"
+)
+
+// Définition des types de messages
+const (
+	MsgTypeGameState     byte = 1 // État complet du jeu envoyé par le serveur
+	MsgTypePlayerMove    byte = 2 // Mouvement du joueur envoyé par le client
+	MsgTypePlayerJoin    byte = 3 // Attribution d'un ID de joueur
+	MsgTypePlayerReady   byte = 4 // État de préparation d'un joueur
+	MsgTypeSubscribe     byte = 5 // Fréquence des états de jeu demandée par le client
+	MsgTypeDiscoveryPing byte = 6 // Requête de découverte envoyée en UDP par un client
+	MsgTypeDiscoveryPong byte = 7 // Réponse du serveur à une requête de découverte
+)
+
+// Taille du corps de chaque message en octets
+const (
+	GameStateSize     = 33
+	PlayerMoveSize    = 10
+	PlayerJoinSize    = 1
+	PlayerReadySize   = 2
+	SubscribeSize     = 2
+	DiscoveryPingSize = 4
+	DiscoveryPongSize = 8
+)
+
+// MessageNames associe chaque type de message à son nom
+var MessageNames = map[byte]string{
+	MsgTypeGameState:     "GameState",
+	MsgTypePlayerMove:    "PlayerMove",
+	MsgTypePlayerJoin:    "PlayerJoin",
+	MsgTypePlayerReady:   "PlayerReady",
+	MsgTypeSubscribe:     "Subscribe",
+	MsgTypeDiscoveryPing: "DiscoveryPing",
+	MsgTypeDiscoveryPong: "DiscoveryPong",
+}
+
+// GameState: État complet du jeu envoyé par le serveur
+// Format binaire:
+// - Octets 0-3: Position X de la balle (float32)
+// - Octets 4-7: Position Y de la balle (float32)
+// - Octets 8-11: Position Y du joueur 1 (float32)
+// - Octets 12-13: Score du joueur 1 (uint16)
+// - Octets 14-17: Position Y du joueur 2 (float32)
+// - Octets 18-19: Score du joueur 2 (uint16)
+// - Octet 20: 1 si le jeu est en cours, 0 sinon (byte)
+// - Octets 21-24: Dernière séquence d'entrée appliquée pour le joueur 1 (uint32)
+// - Octets 25-28: Dernière séquence d'entrée appliquée pour le joueur 2 (uint32)
+// - Octets 29-32: Numéro du tick de simulation de cet état (uint32)
+type GameState struct {
+	BallX        float32
+	BallY        float32
+	Player1Y     float32
+	Player1Score uint16
+	Player2Y     float32
+	Player2Score uint16
+	IsRunning    byte
+	Player1Seq   uint32
+	Player2Seq   uint32
+	Tick         uint32
+}
+
+// EncodeGameState encode un GameState avec son en-tête
+func EncodeGameState(m *GameState) []byte {
+	message := make([]byte, HeaderSize+GameStateSize)
+	message[0] = MsgTypeGameState
+	binary.BigEndian.PutUint32(message[1:], GameStateSize)
+	b := message[HeaderSize:]
+	binary.BigEndian.PutUint32(b[0:], math.Float32bits(m.BallX))
+	binary.BigEndian.PutUint32(b[4:], math.Float32bits(m.BallY))
+	binary.BigEndian.PutUint32(b[8:], math.Float32bits(m.Player1Y))
+	binary.BigEndian.PutUint16(b[12:], m.Player1Score)
+	binary.BigEndian.PutUint32(b[14:], math.Float32bits(m.Player2Y))
+	binary.BigEndian.PutUint16(b[18:], m.Player2Score)
+	b[20] = m.IsRunning
+	binary.BigEndian.PutUint32(b[21:], m.Player1Seq)
+	binary.BigEndian.PutUint32(b[25:], m.Player2Seq)
+	binary.BigEndian.PutUint32(b[29:], m.Tick)
+	return message
+}
+
+// DecodeGameState décode le corps d'un message GameState
+func DecodeGameState(data []byte) (*GameState, error) {
+	if len(data) < GameStateSize {
+		return nil, fmt.Errorf("données insuffisantes pour décoder GameState")
+	}
+
+	m := &GameState{}
+	m.BallX = math.Float32frombits(binary.BigEndian.Uint32(data[0:]))
+	m.BallY = math.Float32frombits(binary.BigEndian.Uint32(data[4:]))
+	m.Player1Y = math.Float32frombits(binary.BigEndian.Uint32(data[8:]))
+	m.Player1Score = binary.BigEndian.Uint16(data[12:])
+	m.Player2Y = math.Float32frombits(binary.BigEndian.Uint32(data[14:]))
+	m.Player2Score = binary.BigEndian.Uint16(data[18:])
+	m.IsRunning = data[20]
+	m.Player1Seq = binary.BigEndian.Uint32(data[21:])
+	m.Player2Seq = binary.BigEndian.Uint32(data[25:])
+	m.Tick = binary.BigEndian.Uint32(data[29:])
+	return m, nil
+}
+
+// PlayerMove: Mouvement du joueur envoyé par le client
+// Format binaire:
+// - Octet 0: ID du joueur (1 ou 2) (byte)
+// - Octet 1: Direction (1 pour bas, -1 pour haut, 0 pour arrêt) (int8)
+// - Octets 2-5: Numéro de séquence de l'entrée (uint32)
+// - Octets 6-9: Tick du dernier état affiché par le client lors de l'entrée (uint32)
+type PlayerMove struct {
+	PlayerID  byte
+	Direction int8
+	Seq       uint32
+	ViewTick  uint32
+}
+
+// EncodePlayerMove encode un PlayerMove avec son en-tête
+func EncodePlayerMove(m *PlayerMove) []byte {
+	message := make([]byte, HeaderSize+PlayerMoveSize)
+	message[0] = MsgTypePlayerMove
+	binary.BigEndian.PutUint32(message[1:], PlayerMoveSize)
+	b := message[HeaderSize:]
+	b[0] = m.PlayerID
+	b[1] = byte(m.Direction)
+	binary.BigEndian.PutUint32(b[2:], m.Seq)
+	binary.BigEndian.PutUint32(b[6:], m.ViewTick)
+	return message
+}
+
+// DecodePlayerMove décode le corps d'un message PlayerMove
+func DecodePlayerMove(data []byte) (*PlayerMove, error) {
+	if len(data) < PlayerMoveSize {
+		return nil, fmt.Errorf("données insuffisantes pour décoder PlayerMove")
+	}
+
+	m := &PlayerMove{}
+	m.PlayerID = data[0]
+	m.Direction = int8(data[1])
+	m.Seq = binary.BigEndian.Uint32(data[2:])
+	m.ViewTick = binary.BigEndian.Uint32(data[6:])
+	return m, nil
+}
+
+// PlayerJoin: Attribution d'un ID de joueur
+// Format binaire:
+// - Octet 0: ID du joueur (1 ou 2) (byte)
+type PlayerJoin struct {
+	PlayerID byte
+}
+
+// EncodePlayerJoin encode un PlayerJoin avec son en-tête
+func EncodePlayerJoin(m *PlayerJoin) []byte {
+	message := make([]byte, HeaderSize+PlayerJoinSize)
+	message[0] = MsgTypePlayerJoin
+	binary.BigEndian.PutUint32(message[1:], PlayerJoinSize)
+	b := message[HeaderSize:]
+	b[0] = m.PlayerID
+	return message
+}
+
+// DecodePlayerJoin décode le corps d'un message PlayerJoin
+func DecodePlayerJoin(data []byte) (*PlayerJoin, error) {
+	if len(data) < PlayerJoinSize {
+		return nil, fmt.Errorf("données insuffisantes pour décoder PlayerJoin")
+	}
+
+	m := &PlayerJoin{}
+	m.PlayerID = data[0]
+	return m, nil
+}
+
+// PlayerReady: État de préparation d'un joueur
+// Format binaire:
+// - Octet 0: ID du joueur (1 ou 2) (byte)
+// - Octet 1: 1 si prêt, 0 sinon (byte)
+type PlayerReady struct {
+	PlayerID byte
+	Ready    byte
+}
+
+// EncodePlayerReady encode un PlayerReady avec son en-tête
+func EncodePlayerReady(m *PlayerReady) []byte {
+	message := make([]byte, HeaderSize+PlayerReadySize)
+	message[0] = MsgTypePlayerReady
+	binary.BigEndian.PutUint32(message[1:], PlayerReadySize)
+	b := message[HeaderSize:]
+	b[0] = m.PlayerID
+	b[1] = m.Ready
+	return message
+}
+
+// DecodePlayerReady décode le corps d'un message PlayerReady
+func DecodePlayerReady(data []byte) (*PlayerReady, error) {
+	if len(data) < PlayerReadySize {
+		return nil, fmt.Errorf("données insuffisantes pour décoder PlayerReady")
+	}
+
+	m := &PlayerReady{}
+	m.PlayerID = data[0]
+	m.Ready = data[1]
+	return m, nil
+}
+
+// Subscribe: Fréquence des états de jeu demandée par le client
+// Format binaire:
+// - Octet 0: Fréquence maximale en Hz (0 pour chaque tick du serveur) (byte)
+// - Octet 1: 1 pour ne recevoir que les états modifiés, 0 sinon (byte)
+type Subscribe struct {
+	RateHz   byte
+	OnChange byte
+}
+
+// EncodeSubscribe encode un Subscribe avec son en-tête
+func EncodeSubscribe(m *Subscribe) []byte {
+	message := make([]byte, HeaderSize+SubscribeSize)
+	message[0] = MsgTypeSubscribe
+	binary.BigEndian.PutUint32(message[1:], SubscribeSize)
+	b := message[HeaderSize:]
+	b[0] = m.RateHz
+	b[1] = m.OnChange
+	return message
+}
+
+// DecodeSubscribe décode le corps d'un message Subscribe
+func DecodeSubscribe(data []byte) (*Subscribe, error) {
+	if len(data) < SubscribeSize {
+		return nil, fmt.Errorf("données insuffisantes pour décoder Subscribe")
+	}
+
+	m := &Subscribe{}
+	m.RateHz = data[0]
+	m.OnChange = data[1]
+	return m, nil
+}
+
+// DiscoveryPing: Requête de découverte envoyée en UDP par un client
+// Format binaire:
+// - Octets 0-3: Identifiant de la requête, renvoyé dans la réponse (uint32)
+type DiscoveryPing struct {
+	Nonce uint32
+}
+
+// EncodeDiscoveryPing encode un DiscoveryPing avec son en-tête
+func EncodeDiscoveryPing(m *DiscoveryPing) []byte {
+	message := make([]byte, HeaderSize+DiscoveryPingSize)
+	message[0] = MsgTypeDiscoveryPing
+	binary.BigEndian.PutUint32(message[1:], DiscoveryPingSize)
+	b := message[HeaderSize:]
+	binary.BigEndian.PutUint32(b[0:], m.Nonce)
+	return message
+}
+
+// DecodeDiscoveryPing décode le corps d'un message DiscoveryPing
+func DecodeDiscoveryPing(data []byte) (*DiscoveryPing, error) {
+	if len(data) < DiscoveryPingSize {
+		return nil, fmt.Errorf("données insuffisantes pour décoder DiscoveryPing")
+	}
+
+	m := &DiscoveryPing{}
+	m.Nonce = binary.BigEndian.Uint32(data[0:])
+	return m, nil
+}
+
+// DiscoveryPong: Réponse du serveur à une requête de découverte
+// Format binaire:
+// - Octets 0-3: Identifiant de la requête (uint32)
+// - Octets 4-5: Port TCP du serveur de jeu (uint16)
+// - Octet 6: Nombre de joueurs connectés (byte)
+// - Octet 7: Nombre de places libres (byte)
+type DiscoveryPong struct {
+	Nonce     uint32
+	Port      uint16
+	Players   byte
+	FreeSlots byte
+}
+
+// EncodeDiscoveryPong encode un DiscoveryPong avec son en-tête
+func EncodeDiscoveryPong(m *DiscoveryPong) []byte {
+	message := make([]byte, HeaderSize+DiscoveryPongSize)
+	message[0] = MsgTypeDiscoveryPong
+	binary.BigEndian.PutUint32(message[1:], DiscoveryPongSize)
+	b := message[HeaderSize:]
+	binary.BigEndian.PutUint32(b[0:], m.Nonce)
+	binary.BigEndian.PutUint16(b[4:], m.Port)
+	b[6] = m.Players
+	b[7] = m.FreeSlots
+	return message
+}
+
+// DecodeDiscoveryPong décode le corps d'un message DiscoveryPong
+func DecodeDiscoveryPong(data []byte) (*DiscoveryPong, error) {
+	if len(data) < DiscoveryPongSize {
+		return nil, fmt.Errorf("données insuffisantes pour décoder DiscoveryPong")
+	}
+
+	m := &DiscoveryPong{}
+	m.Nonce = binary.BigEndian.Uint32(data[0:])
+	m.Port = binary.BigEndian.Uint16(data[4:])
+	m.Players = data[6]
+	m.FreeSlots = data[7]
+	return m, nil
+}
@@ -0,0 +1,162 @@
+package protocol
+
+import (
+	"bytes"
+	"encoding/hex"
+	"encoding/json"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"reflect"
+	"testing"
+)
+
+// Racine du dépôt, vue depuis server-tcp/pkg/protocol
+var repoRoot = filepath.Join("..", "..", "..")
+
+// vector est un vecteur de test produit par protocol/generate.py
+type vector struct {
+	Name    string             `json:"name"`
+	ID      byte               `json:"id"`
+	Fields  map[string]float64 `json:"fields"`
+	Message string             `json:"message"`
+}
+
+// codec regroupe l'encodeur et le décodeur d'un type de message
+type codec struct {
+	size   int
+	decode func([]byte) (any, error)
+	encode func(any) []byte
+}
+
+var codecs = map[string]codec{
+	"GameState": {GameStateSize,
+		func(b []byte) (any, error) { return DecodeGameState(b) },
+		func(m any) []byte { return EncodeGameState(m.(*GameState)) }},
+	"PlayerMove": {PlayerMoveSize,
+		func(b []byte) (any, error) { return DecodePlayerMove(b) },
+		func(m any) []byte { return EncodePlayerMove(m.(*PlayerMove)) }},
+	"PlayerJoin": {PlayerJoinSize,
+		func(b []byte) (any, error) { return DecodePlayerJoin(b) },
+		func(m any) []byte { return EncodePlayerJoin(m.(*PlayerJoin)) }},
+	"PlayerReady": {PlayerReadySize,
+		func(b []byte) (any, error) { return DecodePlayerReady(b) },
+		func(m any) []byte { return EncodePlayerReady(m.(*PlayerReady)) }},
+	"Subscribe": {SubscribeSize,
+		func(b []byte) (any, error) { return DecodeSubscribe(b) },
+		func(m any) []byte { return EncodeSubscribe(m.(*Subscribe)) }},
+	"DiscoveryPing": {DiscoveryPingSize,
+		func(b []byte) (any, error) { return DecodeDiscoveryPing(b) },
+		func(m any) []byte { return EncodeDiscoveryPing(m.(*DiscoveryPing)) }},
+	"DiscoveryPong": {DiscoveryPongSize,
+		func(b []byte) (any, error) { return DecodeDiscoveryPong(b) },
+		func(m any) []byte { return EncodeDiscoveryPong(m.(*DiscoveryPong)) }},
+}
+
+func loadVectors(t testing.TB) []vector {
+	t.Helper()
+	data, err := os.ReadFile(filepath.Join(repoRoot, "protocol", "vectors.json"))
+	if err != nil {
+		t.Fatalf("lecture des vecteurs: %v", err)
+	}
+	var vectors []vector
+	if err := json.Unmarshal(data, &vectors); err != nil {
+		t.Fatalf("décodage des vecteurs: %v", err)
+	}
+	return vectors
+}
+
+// fieldValue convertit un champ entier ou flottant en float64
+func fieldValue(v reflect.Value) float64 {
+	switch v.Kind() {
+	case reflect.Uint8, reflect.Uint16, reflect.Uint32:
+		return float64(v.Uint())
+	case reflect.Int8:
+		return float64(v.Int())
+	default:
+		return v.Float()
+	}
+}
+
+func TestGoldenVectors(t *testing.T) {
+	vectors := loadVectors(t)
+	if len(vectors) != len(MessageNames) {
+		t.Fatalf("%d vecteurs pour %d types de messages", len(vectors), len(MessageNames))
+	}
+
+	for _, vec := range vectors {
+		t.Run(vec.Name, func(t *testing.T) {
+			c, ok := codecs[vec.Name]
+			if !ok {
+				t.Fatalf("aucun codec pour %s", vec.Name)
+			}
+			if MessageNames[vec.ID] != vec.Name {
+				t.Fatalf("type %d: %q, attendu %q", vec.ID, MessageNames[vec.ID], vec.Name)
+			}
+			want, err := hex.DecodeString(vec.Message)
+			if err != nil {
+				t.Fatal(err)
+			}
+
+			header, err := DecodeHeader(want)
+			if err != nil {
+				t.Fatal(err)
+			}
+			if header.Type != vec.ID || int(header.Length) != c.size || len(want) != HeaderSize+c.size {
+				t.Fatalf("en-tête %+v pour un message de %d octets", header, len(want))
+			}
+
+			m, err := c.decode(want[HeaderSize:])
+			if err != nil {
+				t.Fatal(err)
+			}
+			fields := reflect.ValueOf(m).Elem()
+			if fields.NumField() != len(vec.Fields) {
+				t.Fatalf("%d champs, %d dans le vecteur", fields.NumField(), len(vec.Fields))
+			}
+			for name, value := range vec.Fields {
+				field := fields.FieldByName(name)
+				if !field.IsValid() {
+					t.Fatalf("champ %s absent", name)
+				}
+				if got := fieldValue(field); got != value {
+					t.Errorf("%s = %v, attendu %v", name, got, value)
+				}
+			}
+
+			if got := c.encode(m); !bytes.Equal(got, want) {
+				t.Errorf("encodage %x, attendu %x", got, want)
+			}
+			if _, err := c.decode(want[HeaderSize : len(want)-1]); err == nil {
+				t.Errorf("corps tronqué accepté")
+			}
+		})
+	}
+}
+
+func TestGeneratedFilesUpToDate(t *testing.T) {
+	python, err := exec.LookPath("python3")
+	if err != nil {
+		t.Skip("python3 introuvable")
+	}
+	cmd := exec.Command(python, filepath.Join(repoRoot, "protocol", "generate.py"), "--check")
+	if out, err := cmd.CombinedOutput(); err != nil {
+		t.Fatalf("%v\n%s", err, out)
+	}
+}
+
+func BenchmarkDecodeGameState(b *testing.B) {
+	body := EncodeGameState(&GameState{
+		BallX: 400, BallY: 300, Player1Y: 250, Player2Y: 250,
+		Player1Score: 3, Player2Score: 5, IsRunning: 1,
+		Player1Seq: 1200, Player2Seq: 1180, Tick: 36000,
+	})[HeaderSize:]
+
+	b.ReportAllocs()
+	b.SetBytes(int64(len(body)))
+	for i := 0; i < b.N; i++ {
+		if _, err := DecodeGameState(body); err != nil {
+			b.Fatal(err)
+		}
+	}
+}